@@ -0,0 +1,381 @@
+"""
+Rule of 40 Screener - ヘッドレス CLI
+
+GUI（PySide6）を一切読み込まずにスクリーニングを実行する。cron などからの
+バッチ実行用。
+
+    python -m src.cli screen --sources sp500,nasdaq100 --period ttm \\
+        --variant both --out results.parquet
+    python -m src.cli resume --out results.parquet  # 中断した実行の再開
+
+- 進捗とログは stderr に JSON Lines（1行1イベント）で出力する
+- 実行結果の集計は stdout に1つの JSON として出力する
+- 終了コードは EXIT_* を参照
+
+起動を速くするため、スクリーニング関連のモジュールはコマンド実行時に
+読み込む（--help などでは pandas / yfinance を読み込まない）。
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# 終了コード
+EXIT_OK = 0
+EXIT_ERROR = 1  # スクリーニング・出力の失敗
+EXIT_USAGE = 2  # 引数・設定の誤り（argparse と同じ）
+EXIT_NO_SYMBOLS = 3  # 銘柄リストが空（データソースの障害など）
+EXIT_INTERRUPTED = 130  # Ctrl+C / SIGINT
+
+# 出力形式（拡張子 -> 形式）
+OUTPUT_FORMATS = {".parquet": "parquet", ".csv": "csv", ".json": "json"}
+
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config.yaml")
+
+logger = logging.getLogger(__name__)
+
+
+class _JsonLinesWriter:
+    """スレッドセーフな JSON Lines 出力"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def write(self, event: str, **fields: Any):
+        record = {"event": event, "time": datetime.now().isoformat()}
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+class _JsonLogHandler(logging.Handler):
+    """ログレコードを JSON Lines として出力するハンドラ"""
+
+    def __init__(self, writer: _JsonLinesWriter):
+        super().__init__()
+        self.writer = writer
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.writer.write(
+                "log",
+                level=record.levelname,
+                logger=record.name,
+                message=record.getMessage(),
+            )
+        except Exception:
+            self.handleError(record)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """引数パーサーを作成"""
+    parser = argparse.ArgumentParser(
+        prog="rule40-screen",
+        description="Rule of 40 Screener のヘッドレス実行",
+    )
+    parser.add_argument(
+        "--config", default=DEFAULT_CONFIG_PATH, help="設定ファイル (config.yaml)"
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="ログレベル（省略時は設定ファイルの logging.level）",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    screen = subparsers.add_parser("screen", help="スクリーニングを実行")
+    screen.add_argument(
+        "--sources", help="データソース（カンマ区切り、例: sp500,nasdaq100）"
+    )
+    screen.add_argument(
+        "--csv", dest="csv_path", help="銘柄リスト CSV（1列目がシンボル）"
+    )
+    screen.add_argument("--period", choices=["annual", "ttm", "mrq_annualized"])
+    screen.add_argument("--variant", choices=["op", "ebitda", "both"])
+    screen.add_argument("--threshold", type=float, help="Rule of 40 の閾値")
+    screen.add_argument("--min-revenue", type=float, help="最小時価総額")
+    screen.add_argument("--margin-positive", action="store_true", help="黒字企業のみ")
+    screen.add_argument("--workers", type=int, help="最大ワーカー数")
+    screen.add_argument("--backend", choices=["thread", "async"], help="取得エンジン")
+    screen.add_argument(
+        "--force-refresh", action="store_true", help="キャッシュを使わずに取得"
+    )
+    screen.add_argument(
+        "--retry-failures",
+        action="store_true",
+        help="取得に失敗した銘柄の記録を消して再取得する",
+    )
+    screen.add_argument(
+        "--stale-grace-hours",
+        type=int,
+        help="期限切れ後この時間内のキャッシュを使い、出力後に取得し直す（0 で無効）",
+    )
+    screen.add_argument(
+        "--offline",
+        action="store_true",
+        default=None,
+        help="銘柄リストはネットワークを使わず、前回の取得結果を使う",
+    )
+    screen.add_argument(
+        "--delta",
+        action="store_true",
+        help="既存の銘柄は期限切れでもキャッシュを使い、新たに加わった銘柄"
+        "（とキャッシュの無い銘柄）だけを取得する",
+    )
+    screen.add_argument(
+        "--no-prefilter",
+        dest="prefilter",
+        action="store_false",
+        default=None,
+        help="info による事前絞り込みを行わない",
+    )
+    _add_output_arguments(screen)
+
+    resume = subparsers.add_parser(
+        "resume", help="中断した実行を再開（未処理・失敗の銘柄だけを取得）"
+    )
+    resume.add_argument("--run-id", help="再開する実行（省略時は再開できる最新の実行）")
+    _add_output_arguments(resume)
+    return parser
+
+
+def _add_output_arguments(parser: argparse.ArgumentParser):
+    """出力関連の引数を追加"""
+    parser.add_argument("--out", help="結果の出力先（拡張子 .parquet / .csv / .json）")
+    parser.add_argument(
+        "--format",
+        choices=sorted(set(OUTPUT_FORMATS.values())),
+        help="出力形式（省略時は --out の拡張子から判定）",
+    )
+    parser.add_argument("--quiet", action="store_true", help="進捗イベントを出力しない")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI エントリーポイント（終了コードを返す）"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    events = _JsonLinesWriter(sys.stderr)
+    stdout = _JsonLinesWriter(sys.stdout)
+
+    # screen / resume（resume は記録した設定で実行する）
+    return _run_screen(args, events, stdout)
+
+
+def _run_screen(
+    args: argparse.Namespace, events: _JsonLinesWriter, stdout: _JsonLinesWriter
+) -> int:
+    """screen / resume コマンド"""
+    summary: Dict[str, Any] = {"status": "error", "output": None}
+
+    def finish(exit_code: int, **fields: Any) -> int:
+        summary.update(fields)
+        summary["exit_code"] = exit_code
+        stdout.write("summary", **summary)
+        return exit_code
+
+    # 出力形式は長時間の取得を始める前に検証する
+    output_format = None
+    if args.out:
+        output_format = args.format or OUTPUT_FORMATS.get(
+            os.path.splitext(args.out)[1].lower()
+        )
+        if output_format is None:
+            return finish(EXIT_USAGE, error=f"Unknown output format: {args.out}")
+        if output_format == "parquet" and not _parquet_available():
+            return finish(
+                EXIT_USAGE,
+                error="Parquet output requires pyarrow or fastparquet",
+            )
+
+    try:
+        from .core.application.screening_service import ScreeningService
+        from .core.data.config_loader import ConfigManager
+        from .core.domain.models import ConfigError
+    except ImportError:
+        from src.core.application.screening_service import ScreeningService
+        from src.core.data.config_loader import ConfigManager
+        from src.core.domain.models import ConfigError
+
+    try:
+        config_manager = ConfigManager(args.config)
+    except ConfigError as e:
+        return finish(EXIT_USAGE, error=str(e))
+
+    _setup_logging(events, args.log_level or config_manager.get("logging.level"))
+
+    service = None
+    try:
+        service = ScreeningService(config_manager)
+        run = None
+        if args.command == "resume":
+            run = (
+                service.journal.get_run(args.run_id)
+                if args.run_id
+                else service.get_resumable_run()
+            )
+            if run is None or not run.resumable:
+                return finish(
+                    EXIT_USAGE, error=f"No resumable run: {args.run_id or 'latest'}"
+                )
+            config = run.config
+        else:
+            config = _build_config(args, config_manager)
+
+        unknown = [s for s in config.sources if s not in service.data_sources]
+        if unknown:
+            return finish(EXIT_USAGE, error=f"Unknown sources: {', '.join(unknown)}")
+        summary["config"] = {
+            "sources": config.sources,
+            "csv_path": config.csv_path,
+            "period": config.period.value,
+            "variant": config.variant.value,
+            "threshold": config.threshold,
+        }
+
+        def on_progress(current: int, total: int, message: str):
+            if not args.quiet:
+                events.write("progress", current=current, total=total, message=message)
+
+        if run is not None:
+            results = service.resume(run.run_id, progress_callback=on_progress)
+        else:
+            results = service.screen_stocks(config, progress_callback=on_progress)
+        summary.update(service.last_summary.to_dict())
+
+        if service.last_summary.symbols == 0:
+            return finish(EXIT_NO_SYMBOLS, error="No symbols to screen")
+
+        if args.out:
+            _write_output(results, args.out, output_format)
+            summary["output"] = os.path.abspath(args.out)
+            summary["format"] = output_format
+
+        # 期限切れのキャッシュで出力した銘柄は、次回の実行に備えて取得し直す
+        if service.pending_revalidation:
+            service.revalidate(config)
+            summary["revalidated"] = service.last_summary.revalidated
+
+        return finish(EXIT_OK, status="ok")
+
+    except KeyboardInterrupt:
+        if service is not None:
+            summary.update(service.last_summary.to_dict())
+        return finish(EXIT_INTERRUPTED, status="interrupted")
+    except Exception as e:
+        logger.error(f"Screening failed: {e}")
+        if service is not None:
+            summary.update(service.last_summary.to_dict())
+        return finish(EXIT_ERROR, error=str(e))
+    finally:
+        if service is not None:
+            service.cache.close()
+
+
+def _build_config(args: argparse.Namespace, config_manager):
+    """引数と設定ファイルから ScreeningConfig を作成（引数優先）"""
+    try:
+        from .core.domain.models import (
+            CalculationPeriod,
+            Rule40Variant,
+            ScreeningConfig,
+        )
+    except ImportError:
+        from src.core.domain.models import (
+            CalculationPeriod,
+            Rule40Variant,
+            ScreeningConfig,
+        )
+
+    if args.sources is not None:
+        sources = [s.strip() for s in args.sources.split(",") if s.strip()]
+    else:
+        sources = list(config_manager.get("universe.sources", ["sp500"]))
+
+    def option(value, key: str, default):
+        return value if value is not None else config_manager.get(key, default)
+
+    return ScreeningConfig(
+        sources=sources,
+        csv_path=option(args.csv_path, "universe.csv_path", None),
+        exclude_symbols=list(config_manager.get("universe.exclude_symbols", []) or []),
+        variant=Rule40Variant(option(args.variant, "rule40.variant", "op")),
+        period=CalculationPeriod(option(args.period, "rule40.period", "ttm")),
+        threshold=float(option(args.threshold, "rule40.threshold", 40.0)),
+        min_revenue=option(args.min_revenue, "rule40.min_revenue", None),
+        margin_positive_only=args.margin_positive,
+        max_workers=max(1, int(option(args.workers, "fetch.max_workers", 12))),
+        cache_ttl_hours=max(1, int(config_manager.get("fetch.cache_ttl_hours", 24))),
+        annual_statement_ttl_hours=max(
+            1, int(config_manager.get("fetch.annual_statement_ttl_hours", 720))
+        ),
+        ttm_statement_ttl_hours=max(
+            1, int(config_manager.get("fetch.ttm_statement_ttl_hours", 168))
+        ),
+        force_refresh=args.force_refresh,
+        fetch_backend=option(args.backend, "fetch.backend", "thread"),
+        streaming=config_manager.get("performance.streaming", True),
+        prefilter=option(args.prefilter, "fetch.prefilter", True),
+        failure_ttl_hours=max(0, int(config_manager.get("fetch.failure_ttl_hours", 6))),
+        retry_failures=args.retry_failures,
+        stale_grace_hours=max(
+            0, int(option(args.stale_grace_hours, "fetch.stale_grace_hours", 0))
+        ),
+        offline=bool(option(args.offline, "universe.offline", False)),
+        delta=args.delta,
+    )
+
+
+def _setup_logging(events: _JsonLinesWriter, level: Optional[str]):
+    """ログを stderr の JSON Lines に出力"""
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, _JsonLogHandler):
+            root.removeHandler(handler)
+    root.addHandler(_JsonLogHandler(events))
+    root.setLevel(getattr(logging, str(level or "INFO").upper(), logging.INFO))
+
+
+def _parquet_available() -> bool:
+    """Parquet エンジン（pyarrow / fastparquet）の有無"""
+    import importlib.util
+
+    return any(
+        importlib.util.find_spec(name) is not None
+        for name in ("pyarrow", "fastparquet")
+    )
+
+
+def _write_output(results, path: str, output_format: str):
+    """結果を機械可読な形式で保存（列名・値は ResultFrame.to_dataframe のまま）"""
+    try:
+        from .core.domain.result_frame import ResultFrame
+    except ImportError:
+        from src.core.domain.result_frame import ResultFrame
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    df = ResultFrame.from_results(results).to_dataframe()
+    if output_format == "parquet":
+        df.to_parquet(path, index=False)
+    elif output_format == "csv":
+        df.to_csv(path, index=False, encoding="utf-8")
+    else:
+        df.to_json(
+            path, orient="records", date_format="iso", force_ascii=False, indent=2
+        )
+    logger.info(f"Wrote {len(df)} results to {path}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
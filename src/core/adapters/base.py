@@ -2,10 +2,85 @@
 Base classes and protocols for data adapters
 """
 
+import logging
+import re
 from abc import ABC, abstractmethod
-from typing import List, Protocol, runtime_checkable
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Union,
+    runtime_checkable,
+)
 
-from src.core.domain.models import Symbol
+import pandas as pd
+import requests
+
+from src.core.data.universe_cache import UniverseCache, snapshot_diff
+from src.core.domain.models import Market, Symbol, UniverseDiff
+
+logger = logging.getLogger(__name__)
+
+
+# 銘柄テーブルの列（Symbol のフィールドと同じ順序）
+SYMBOL_COLUMNS = ["symbol", "name", "market", "sector", "industry", "source"]
+
+# シンボルの最大長と許可する文字（英数字と一部記号）
+MAX_SYMBOL_LENGTH = 10
+SYMBOL_PATTERN = re.compile(r"[A-Z0-9\-\.]+")
+
+# 株式クラスの接尾辞（BRK.B → BRK-B, BF.B → BF-B など）
+_CLASS_SUFFIX = re.compile(r"\.([AB])$")
+
+# 欠損値として扱う文字列（str(NaN) など）
+_MISSING_SYMBOLS = ["NAN", "NONE"]
+
+Column = Union[pd.Series, str]
+
+# 取得した内容（テキスト）から銘柄テーブルを作る関数
+Parser = Callable[[str], pd.DataFrame]
+
+
+def normalize_symbols(values: pd.Series) -> pd.Series:
+    """シンボル列の正規化（前後の空白除去・大文字化、BRK.B → BRK-B など）"""
+    text = values.astype("string").str.strip().str.upper().fillna("")
+    text = text.mask(text.isin(_MISSING_SYMBOLS), "")
+    return text.str.replace(_CLASS_SUFFIX, r"-\1", regex=True)
+
+
+def valid_symbol_mask(symbols: pd.Series) -> pd.Series:
+    """正規化済みシンボル列のバリデーション結果（英数字と一部記号、10文字以内）"""
+    matches = symbols.str.fullmatch(SYMBOL_PATTERN).fillna(False).astype(bool)
+    return matches & symbols.str.len().le(MAX_SYMBOL_LENGTH).fillna(False).astype(bool)
+
+
+def symbols_to_table(symbols: Iterable[Symbol]) -> pd.DataFrame:
+    """Symbol のリストを銘柄テーブルに変換"""
+    return pd.DataFrame(
+        [
+            (s.symbol, s.name, s.market.value, s.sector, s.industry, s.source)
+            for s in symbols
+        ],
+        columns=SYMBOL_COLUMNS,
+    )
+
+
+def table_to_symbols(table: pd.DataFrame) -> List[Symbol]:
+    """銘柄テーブルを Symbol のリストに変換"""
+    return [
+        Symbol(*row)
+        for row in table[SYMBOL_COLUMNS].itertuples(index=False, name=None)
+    ]
+
+
+def _text_column(values: Column) -> Column:
+    """テキスト列（欠損は空文字）"""
+    if isinstance(values, pd.Series):
+        return values.astype("string").fillna("")
+    return values
 
 
 @runtime_checkable
@@ -16,6 +91,10 @@ class SymbolSource(Protocol):
         """銘柄リストを取得"""
         ...
 
+    def fetch_table(self) -> pd.DataFrame:
+        """銘柄テーブル（SYMBOL_COLUMNS の列）を取得"""
+        ...
+
     def get_source_name(self) -> str:
         """データソース名を取得"""
         ...
@@ -26,14 +105,30 @@ class SymbolSource(Protocol):
 
 
 class BaseSymbolSource(ABC):
-    """銘柄データ取得の基底クラス"""
+    """銘柄データ取得の基底クラス
+
+    サブクラスは fetch_table（列単位で正規化した銘柄テーブルを返す）を
+    実装する。fetch（Symbol のリストを返す）は基底クラスが変換して提供する。
+
+    snapshots を設定すると _fetch_document は条件付き GET を送り、更新が
+    無ければ保存した銘柄テーブルを使う。offline ならネットワークを使わない。
+    取得後の last_diff は前回の取得からの一覧の変化（前回の一覧が無い・
+    スナップショットを使わないソースは None、304・オフラインでは空）。
+    """
 
     def __init__(self, name: str):
         self.name = name
+        self.snapshots: Optional[UniverseCache] = None
+        self.offline = False
+        self.last_diff: Optional[UniverseDiff] = None
 
-    @abstractmethod
     def fetch(self) -> List[Symbol]:
         """銘柄リストを取得"""
+        return table_to_symbols(self.fetch_table())
+
+    @abstractmethod
+    def fetch_table(self) -> pd.DataFrame:
+        """銘柄テーブル（SYMBOL_COLUMNS の列）を取得"""
         pass
 
     def get_source_name(self) -> str:
@@ -44,33 +139,95 @@ class BaseSymbolSource(ABC):
         """データソースが利用可能かチェック"""
         return True
 
-    def _normalize_symbol(self, symbol: str) -> str:
-        """シンボルの正規化"""
-        # NaN や None チェック
-        if symbol is None or str(symbol).lower() in ['nan', 'none', '']:
-            return ""
-
-        # 一般的な正規化ルール
-        symbol = str(symbol).strip().upper()
-
-        # BRK.B → BRK-B, BF.B → BF-B など
-        if symbol.endswith(".B"):
-            symbol = symbol[:-2] + "-B"
-        elif symbol.endswith(".A"):
-            symbol = symbol[:-2] + "-A"
-
-        return symbol
-
-    def _validate_symbol(self, symbol: str) -> bool:
-        """シンボルのバリデーション"""
-        # 空文字列、None、長すぎるシンボルをチェック
-        if not symbol or len(symbol) == 0 or len(symbol) > 10:
-            return False
-
-        # アルファベットと一部記号のみ許可
-        import re
-
-        return bool(re.match(r"^[A-Z0-9\-\.]+$", symbol))
+    def _fetch_document(
+        self,
+        url: str,
+        parse: Parser,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30,
+        session=None,
+    ) -> pd.DataFrame:
+        """URL の内容を取得し、parse で銘柄テーブルにする
+
+        保存したスナップショットがあれば If-None-Match / If-Modified-Since を
+        付けて取得し、304 ならパースせずに保存したテーブルを返す。取得した
+        場合はテーブルと検証子を保存する。session は requests 互換の get を持つ
+        オブジェクト（省略時は requests）。
+        """
+        self.last_diff = None
+        snapshot = self.snapshots.get(url) if self.snapshots is not None else None
+
+        if self.offline:
+            if snapshot is None:
+                raise DataSourceError(f"No saved symbol list for {self.name} (offline)")
+            logger.info(
+                f"{self.name}: using symbol list saved at {snapshot.fetched_at} (offline)"
+            )
+            # 保存した一覧は前回の実行で返したものと同じ
+            self.last_diff = UniverseDiff()
+            return snapshot.table
+
+        headers = dict(headers or {})
+        if snapshot is not None:
+            if snapshot.etag:
+                headers["If-None-Match"] = snapshot.etag
+            if snapshot.last_modified:
+                headers["If-Modified-Since"] = snapshot.last_modified
+
+        response = (session or requests).get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and snapshot is not None:
+            self.snapshots.touch(url)
+            logger.info(f"{self.name}: not modified since {snapshot.fetched_at}")
+            self.last_diff = UniverseDiff()
+            return snapshot.table
+        response.raise_for_status()
+
+        table = parse(response.text)
+        if self.snapshots is not None:
+            saved = self.snapshots.save(
+                url,
+                self.name,
+                table,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            self.last_diff = snapshot_diff(saved)
+        return table
+
+    def _build_table(
+        self,
+        symbols: pd.Series,
+        names: Column,
+        market: Union[Market, pd.Series],
+        sector: Column = "",
+        industry: Column = "",
+        keep: Optional[pd.Series] = None,
+    ) -> pd.DataFrame:
+        """取得した列から銘柄テーブルを作成（正規化・バリデーションは列単位）
+
+        market は Market か、行ごとの Market の値の列。keep は残す行の
+        真偽値マスク（テスト銘柄の除外など）。無効なシンボルの行は除く。
+        """
+        table = pd.DataFrame(
+            {
+                "symbol": normalize_symbols(symbols),
+                "name": _text_column(names),
+                "market": market.value if isinstance(market, Market) else market,
+                "sector": _text_column(sector),
+                "industry": _text_column(industry),
+                "source": self.get_source_name(),
+            },
+            index=symbols.index,
+        )
+
+        valid = valid_symbol_mask(table["symbol"])
+        invalid_count = int((~valid).sum())
+        if invalid_count:
+            logger.debug(f"{self.name}: skipped {invalid_count} invalid symbols")
+
+        if keep is not None:
+            valid &= keep
+        return table[valid].reset_index(drop=True)
 
 
 class DataSourceError(Exception):
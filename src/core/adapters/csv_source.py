@@ -3,16 +3,26 @@ CSV ファイル銘柄データ取得アダプタ
 """
 
 import logging
-from typing import List, Union
+from typing import Union
 
 import pandas as pd
 
 try:
-    from ...domain.models import Market, Symbol
-    from .base import BaseSymbolSource, DataSourceError, ParseError
+    from ...domain.models import Market
+    from .base import (
+        BaseSymbolSource,
+        DataSourceError,
+        ParseError,
+        normalize_symbols,
+    )
 except ImportError:
-    from src.core.adapters.base import BaseSymbolSource, DataSourceError, ParseError
-    from src.core.domain.models import Market, Symbol
+    from src.core.adapters.base import (
+        BaseSymbolSource,
+        DataSourceError,
+        ParseError,
+        normalize_symbols,
+    )
+    from src.core.domain.models import Market
 
 
 logger = logging.getLogger(__name__)
@@ -34,8 +44,8 @@ class CSVFileSource(BaseSymbolSource):
         self.name_col = name_col
         self.auto_add_exchange_suffix = auto_add_exchange_suffix
 
-    def fetch(self) -> List[Symbol]:
-        """CSV ファイルから銘柄リストを取得"""
+    def fetch_table(self) -> pd.DataFrame:
+        """CSV ファイルから銘柄テーブルを取得"""
         try:
             logger.info(f"Fetching symbols from CSV file: {self.file_path}")
 
@@ -70,62 +80,34 @@ class CSVFileSource(BaseSymbolSource):
                     f"Name column '{name_col_name}' not found. Available: {df.columns.tolist()}"
                 )
 
-            symbols = []
-            invalid_count = 0
-            for idx, row in df.iterrows():
-                try:
-                    raw_symbol = str(row[symbol_col_name])
-                    symbol = self._normalize_symbol(raw_symbol)
-
-                    # 日本株の自動検出と接尾辞追加
-                    if self.auto_add_exchange_suffix:
-                        symbol = self._add_exchange_suffix(symbol)
-
-                    name = str(row[name_col_name])
-
-                    # バリデーション
-                    if not self._validate_symbol(symbol):
-                        logger.debug(f"Invalid symbol at row {idx}: raw='{raw_symbol}', normalized='{symbol}'")
-                        invalid_count += 1
-                        continue
-
-                    # 追加情報があれば取得
-                    sector = ""
-                    if "sector" in df.columns:
-                        sector = str(row.get("sector", ""))
-
-                    industry = ""
-                    if "industry" in df.columns:
-                        industry = str(row.get("industry", ""))
-
-                    market = Market.OTHER
-                    if "market" in df.columns:
-                        market_str = str(row.get("market", "")).upper()
-                        try:
-                            market = Market(market_str)
-                        except ValueError:
-                            market = Market.OTHER
-
-                    symbol_obj = Symbol(
-                        symbol=symbol,
-                        name=name,
-                        market=market,
-                        sector=sector,
-                        industry=industry,
-                        source=self.get_source_name(),
-                    )
-
-                    symbols.append(symbol_obj)
-
-                except Exception as e:
-                    logger.warning(f"Error processing row {idx}: {e}")
-                    continue
+            symbols = normalize_symbols(df[symbol_col_name])
 
+            # 日本株の自動検出と接尾辞追加
+            if self.auto_add_exchange_suffix:
+                symbols = self._add_exchange_suffix(symbols)
+
+            # 市場情報があれば取得（不明な値は OTHER）
+            market = Market.OTHER
+            if "market" in df.columns:
+                markets = df["market"].astype("string").str.upper()
+                market = markets.where(
+                    markets.isin([m.value for m in Market]), Market.OTHER.value
+                )
+
+            table = self._build_table(
+                symbols,
+                df[name_col_name],
+                market,
+                sector=df.get("sector", ""),
+                industry=df.get("industry", ""),
+            )
+
+            invalid_count = len(df) - len(table)
             if invalid_count > 0:
                 logger.warning(f"Skipped {invalid_count} invalid symbols from CSV")
 
-            logger.info(f"Successfully fetched {len(symbols)} symbols from CSV")
-            return symbols
+            logger.info(f"Successfully fetched {len(table)} symbols from CSV")
+            return table
 
         except FileNotFoundError:
             raise DataSourceError(f"CSV file not found: {self.file_path}")
@@ -134,20 +116,15 @@ class CSVFileSource(BaseSymbolSource):
         except Exception as e:
             raise DataSourceError(f"Error reading CSV file: {e}")
 
-    def _add_exchange_suffix(self, symbol: str) -> str:
-        """取引所接尾辞を自動追加（日本株対応）"""
-        # 既に接尾辞がある場合はそのまま返す
-        if '.' in symbol:
-            return symbol
-
-        # 数字のみのシンボル = 日本株と判定
-        if symbol.isdigit():
-            # 4桁の数字 = 東京証券取引所
-            if len(symbol) == 4:
-                logger.debug(f"Adding .T suffix to Japanese stock: {symbol} -> {symbol}.T")
-                return f"{symbol}.T"
+    def _add_exchange_suffix(self, symbols: pd.Series) -> pd.Series:
+        """取引所接尾辞を自動追加（日本株対応）
 
-        return symbol
+        接尾辞の無い4桁の数字のシンボルは東京証券取引所（.T）と判定する。
+        """
+        japanese = symbols.str.fullmatch(r"\d{4}").fillna(False).astype(bool)
+        if japanese.any():
+            logger.debug(f"Adding .T suffix to {int(japanese.sum())} Japanese stocks")
+        return symbols.where(~japanese, symbols + ".T")
 
     def is_available(self) -> bool:
         try:
@@ -0,0 +1,139 @@
+"""
+HTML ページから目的のテーブルだけを取り出すパーサー
+
+pd.read_html はページ内の全テーブルをパースするため、Wikipedia の構成銘柄
+ページのように大きなページでは大半の時間を使わないテーブルに費やす。
+ここでは id（またはアンカー）で対象のテーブルを文字列のまま切り出し、
+その部分だけを lxml でパースする。パース結果はページ内容のハッシュを
+キーにプロセス内で保持し、同じ内容を再びパースしない。
+"""
+
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import lxml.html
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# Wikipedia の構成銘柄テーブルの id（S&P 500 / 400、Nasdaq-100）
+CONSTITUENTS_TABLE_ID = "constituents"
+
+# パース結果を保持する数（ページ内容 × 取り出すテーブル）
+PARSED_CACHE_SIZE = 16
+
+_TABLE_TAG = re.compile(r"<(/?)table\b", re.IGNORECASE)
+
+_parsed_cache: "OrderedDict[Tuple[str, str], pd.DataFrame]" = OrderedDict()
+_parsed_cache_lock = threading.Lock()
+
+
+def content_hash(text: str) -> str:
+    """ページ内容のハッシュ（パース結果のキャッシュキー）"""
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def extract_table(
+    html: str, table_id: Optional[str] = None, anchor: Optional[str] = None
+) -> Optional[pd.DataFrame]:
+    """ページから1つのテーブルを取り出して DataFrame にする
+
+    table_id はテーブル自身の id、anchor は見出しなどの id で、その後に
+    最初に現れるテーブルを取り出す（table_id を優先）。見つからなければ
+    None。列名は見出し行のテキスト、値は各セルのテキスト（文字列）。
+    """
+    key = (content_hash(html), f"{table_id}#{anchor}")
+    with _parsed_cache_lock:
+        cached = _parsed_cache.get(key)
+        if cached is not None:
+            _parsed_cache.move_to_end(key)
+            return cached.copy()
+
+    fragment = None
+    if table_id:
+        fragment = _find_table_by_id(html, table_id)
+    if fragment is None and anchor:
+        fragment = _find_table_after_anchor(html, anchor)
+    if fragment is None:
+        logger.debug(f"Table not found (id={table_id}, anchor={anchor})")
+        return None
+
+    table = _parse_table(fragment)
+    with _parsed_cache_lock:
+        _parsed_cache[key] = table
+        while len(_parsed_cache) > PARSED_CACHE_SIZE:
+            _parsed_cache.popitem(last=False)
+    return table.copy()
+
+
+def clear_parsed_cache():
+    """パース結果のキャッシュを消去"""
+    with _parsed_cache_lock:
+        _parsed_cache.clear()
+
+
+def _id_pattern(value: str) -> "re.Pattern[str]":
+    """id 属性の正規表現（HTML エスケープされた値にも一致）"""
+    escaped = value.replace("&", "&amp;")
+    values = {re.escape(value), re.escape(escaped)}
+    alternatives = "|".join(values)
+    return re.compile(rf"""\bid\s*=\s*["'](?:{alternatives})["']""", re.IGNORECASE)
+
+
+def _find_table_by_id(html: str, table_id: str) -> Optional[str]:
+    for match in _id_pattern(table_id).finditer(html):
+        start = html.rfind("<", 0, match.start())
+        if start >= 0 and html[start : start + 6].lower() == "<table":
+            return _slice_table(html, start)
+    return None
+
+
+def _find_table_after_anchor(html: str, anchor: str) -> Optional[str]:
+    match = _id_pattern(anchor).search(html)
+    if match is None:
+        return None
+    start = _TABLE_TAG.search(html, match.end())
+    while start is not None and start.group(1):
+        start = _TABLE_TAG.search(html, start.end())
+    return _slice_table(html, start.start()) if start is not None else None
+
+
+def _slice_table(html: str, start: int) -> Optional[str]:
+    """start の <table から対応する </table> までを切り出す（入れ子に対応）"""
+    depth = 0
+    for tag in _TABLE_TAG.finditer(html, start):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            end = html.find(">", tag.end())
+            return html[start : end + 1] if end >= 0 else None
+    return None
+
+
+def _cell_text(cell) -> str:
+    return " ".join(cell.text_content().split())
+
+
+def _parse_table(fragment: str) -> pd.DataFrame:
+    """切り出したテーブルをパース（入れ子のテーブルの行は含めない）"""
+    table = lxml.html.fragment_fromstring(fragment)
+    rows = table.xpath("./tr | ./thead/tr | ./tbody/tr | ./tfoot/tr")
+
+    header: List[str] = []
+    records: List[List[str]] = []
+    for row in rows:
+        cells = row.xpath("./th | ./td")
+        if not cells:
+            continue
+        if not header and all(cell.tag == "th" for cell in cells):
+            header = [_cell_text(cell) for cell in cells]
+            continue
+        records.append([_cell_text(cell) for cell in cells])
+
+    width = len(header) or max((len(record) for record in records), default=0)
+    records = [(record + [""] * width)[:width] for record in records]
+    return pd.DataFrame(records, columns=header or None)
@@ -7,17 +7,23 @@ import re
 from typing import List
 
 import cloudscraper
+import pandas as pd
 from bs4 import BeautifulSoup
 
 try:
     from ...domain.models import Market, Symbol
-    from .base import BaseSymbolSource, DataSourceError, NetworkError, ParseError
+    from .base import (
+        BaseSymbolSource,
+        DataSourceError,
+        ParseError,
+        symbols_to_table,
+    )
 except ImportError:
     from src.core.adapters.base import (
         BaseSymbolSource,
         DataSourceError,
-        NetworkError,
         ParseError,
+        symbols_to_table,
     )
     from src.core.domain.models import Market, Symbol
 
@@ -43,8 +49,8 @@ class Nikkei500Source(BaseSymbolSource):
         super().__init__("Nikkei 500")
         self.timeout = 30
 
-    def fetch(self) -> List[Symbol]:
-        """日経500銘柄リストを取得"""
+    def fetch_table(self) -> pd.DataFrame:
+        """日経500銘柄テーブルを取得"""
         try:
             logger.info(f"Fetching Nikkei 500 companies from: {self.NIKKEI500_URL}")
 
@@ -63,32 +69,27 @@ class Nikkei500Source(BaseSymbolSource):
                 "Accept-Language": "ja,en;q=0.9",
             }
 
-            response = scraper.get(
+            return self._fetch_document(
                 self.NIKKEI500_URL,
+                self._parse_table,
+                headers,
                 timeout=self.timeout,
-                headers=headers,
+                session=scraper,
             )
 
-            if response.status_code != 200:
-                logger.error(f"HTTP error: status code {response.status_code}")
-                logger.error(f"Response content (first 500 chars): {response.text[:500]}")
-                raise NetworkError(
-                    f"Failed to fetch Nikkei 500 data. Status code: {response.status_code}"
-                )
-
-            logger.info(f"Successfully fetched HTML ({len(response.text)} bytes)")
-
-            return self._parse_html(response.text)
-
         except ParseError as e:
             logger.error(f"Parse error: {e}")
             raise
-        except NetworkError:
+        except DataSourceError:
             raise
         except Exception as e:
             logger.error(f"Unexpected error: {type(e).__name__}: {e}", exc_info=True)
             raise DataSourceError(f"Error fetching Nikkei 500 companies: {e}")
 
+    def _parse_table(self, html: str) -> pd.DataFrame:
+        """HTMLから銘柄テーブルを作成"""
+        return symbols_to_table(self._parse_html(html))
+
     def _parse_html(self, html: str) -> List[Symbol]:
         """HTMLから銘柄リストをパース"""
         soup = BeautifulSoup(html, "html.parser")
@@ -4,7 +4,6 @@ Wikipedia S&P 500 銘柄データ取得アダプタ
 
 import io
 import logging
-from typing import List
 
 import pandas as pd
 import requests
@@ -15,7 +14,8 @@ from src.core.adapters.base import (
     NetworkError,
     ParseError,
 )
-from src.core.domain.models import Market, Symbol
+from src.core.adapters.html_tables import CONSTITUENTS_TABLE_ID, extract_table
+from src.core.domain.models import Market
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +27,8 @@ class WikipediaSP500(BaseSymbolSource):
         super().__init__("Wikipedia S&P 500")
         self.url = url or "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
 
-    def fetch(self) -> List[Symbol]:
-        """S&P 500 銘柄リストを取得"""
+    def fetch_table(self) -> pd.DataFrame:
+        """S&P 500 銘柄テーブルを取得"""
         try:
             logger.info(f"Fetching S&P 500 symbols from {self.url}")
 
@@ -36,72 +36,52 @@ class WikipediaSP500(BaseSymbolSource):
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
-            response = requests.get(self.url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            # pandas で HTML テーブルを読み込み（StringIOを使用）
-            tables = pd.read_html(io.StringIO(response.text))
-
-            if not tables:
-                raise ParseError("No tables found on Wikipedia page")
-
-            # 2番目のテーブルが S&P 500 情報（1番目は警告メッセージ）
-            if len(tables) < 2:
-                raise ParseError("Expected at least 2 tables on Wikipedia page")
-
-            df = tables[1]
-
-            # 必要な列を確認
-            required_columns = ["Symbol", "Security"]
-            if not all(col in df.columns for col in required_columns):
-                raise ParseError(
-                    f"Required columns not found. Available: {df.columns.tolist()}"
-                )
-
-            symbols = []
-            for _, row in df.iterrows():
-                try:
-                    symbol = self._normalize_symbol(str(row["Symbol"]))
-                    name = str(row["Security"])
-
-                    # セクター情報があれば取得
-                    sector = ""
-                    if "GICS Sector" in df.columns:
-                        sector = str(row.get("GICS Sector", ""))
-
-                    # 業種情報があれば取得
-                    industry = ""
-                    if "GICS Sub-Industry" in df.columns:
-                        industry = str(row.get("GICS Sub-Industry", ""))
-
-                    # バリデーション
-                    if not self._validate_symbol(symbol):
-                        logger.warning(f"Invalid symbol: {symbol}")
-                        continue
-
-                    symbol_obj = Symbol(
-                        symbol=symbol,
-                        name=name,
-                        market=Market.OTHER,  # S&P 500 は複数市場にまたがる
-                        sector=sector,
-                        industry=industry,
-                        source=self.get_source_name(),
-                    )
-
-                    symbols.append(symbol_obj)
-
-                except Exception as e:
-                    logger.warning(f"Error processing row: {e}")
-                    continue
-
-            logger.info(f"Successfully fetched {len(symbols)} S&P 500 symbols")
-            return symbols
+            return self._fetch_document(self.url, self._parse, headers)
 
         except requests.RequestException as e:
             raise NetworkError(f"Network error fetching Wikipedia page: {e}")
         except Exception as e:
             raise DataSourceError(f"Error fetching S&P 500 data: {e}")
 
+    def _parse(self, text: str) -> pd.DataFrame:
+        """S&P 500 のページから銘柄テーブルを作成"""
+        # 構成銘柄のテーブルだけをパース（見つからなければページ全体から選ぶ）
+        df = extract_table(text, table_id=CONSTITUENTS_TABLE_ID)
+        if df is None:
+            df = self._find_table(text)
+
+        # 必要な列を確認
+        required_columns = ["Symbol", "Security"]
+        if not all(col in df.columns for col in required_columns):
+            raise ParseError(
+                f"Required columns not found. Available: {df.columns.tolist()}"
+            )
+
+        table = self._build_table(
+            df["Symbol"],
+            df["Security"],
+            Market.OTHER,  # S&P 500 は複数市場にまたがる
+            sector=df.get("GICS Sector", ""),
+            industry=df.get("GICS Sub-Industry", ""),
+        )
+
+        logger.info(f"Successfully fetched {len(table)} S&P 500 symbols")
+        return table
+
+    def _find_table(self, text: str) -> pd.DataFrame:
+        """ページ全体のテーブルから構成銘柄のテーブルを選ぶ"""
+        # pandas で HTML テーブルを読み込み（StringIOを使用）
+        tables = pd.read_html(io.StringIO(text))
+
+        if not tables:
+            raise ParseError("No tables found on Wikipedia page")
+
+        # 2番目のテーブルが S&P 500 情報（1番目は警告メッセージ）
+        if len(tables) < 2:
+            raise ParseError("Expected at least 2 tables on Wikipedia page")
+
+        return tables[1]
+
     def is_available(self) -> bool:
         """Wikipedia ページが利用可能かチェック"""
         try:
@@ -127,8 +107,8 @@ class WikipediaSP400(BaseSymbolSource):
         super().__init__("Wikipedia S&P 400")
         self.url = url or "https://en.wikipedia.org/wiki/List_of_S%26P_400_companies"
 
-    def fetch(self) -> List[Symbol]:
-        """S&P 400 銘柄リストを取得"""
+    def fetch_table(self) -> pd.DataFrame:
+        """S&P 400 銘柄テーブルを取得"""
         try:
             logger.info(f"Fetching S&P 400 symbols from {self.url}")
 
@@ -136,66 +116,49 @@ class WikipediaSP400(BaseSymbolSource):
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
-            response = requests.get(self.url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            # pandas で HTML テーブルを読み込み（StringIOを使用）
-            tables = pd.read_html(io.StringIO(response.text))
-
-            if not tables:
-                raise ParseError("No tables found on Wikipedia page")
-
-            # S&P 400は最初のテーブルが正しいデータ
-            df = tables[0]
-
-            # 必要な列を確認
-            required_columns = ["Symbol", "Security"]
-            if not all(col in df.columns for col in required_columns):
-                raise ParseError(
-                    f"Required columns not found. Available: {df.columns.tolist()}"
-                )
-
-            symbols = []
-            for _, row in df.iterrows():
-                try:
-                    symbol = self._normalize_symbol(str(row["Symbol"]))
-                    name = str(row["Security"])
-
-                    sector = ""
-                    if "GICS Sector" in df.columns:
-                        sector = str(row.get("GICS Sector", ""))
-
-                    industry = ""
-                    if "GICS Sub-Industry" in df.columns:
-                        industry = str(row.get("GICS Sub-Industry", ""))
-
-                    if not self._validate_symbol(symbol):
-                        logger.warning(f"Invalid symbol: {symbol}")
-                        continue
-
-                    symbol_obj = Symbol(
-                        symbol=symbol,
-                        name=name,
-                        market=Market.OTHER,
-                        sector=sector,
-                        industry=industry,
-                        source=self.get_source_name(),
-                    )
-
-                    symbols.append(symbol_obj)
-
-                except Exception as e:
-                    logger.warning(f"Error processing row: {e}")
-                    continue
-
-            logger.info(f"Successfully fetched {len(symbols)} S&P 400 symbols")
-            return symbols
+            return self._fetch_document(self.url, self._parse, headers)
 
         except requests.RequestException as e:
             raise NetworkError(f"Network error fetching Wikipedia page: {e}")
         except Exception as e:
             raise DataSourceError(f"Error fetching S&P 400 data: {e}")
 
+    def _parse(self, text: str) -> pd.DataFrame:
+        """S&P 400 のページから銘柄テーブルを作成"""
+        # 構成銘柄のテーブルだけをパース（見つからなければページ全体から選ぶ）
+        df = extract_table(text, table_id=CONSTITUENTS_TABLE_ID)
+        if df is None:
+            df = self._find_table(text)
+
+        # 必要な列を確認
+        required_columns = ["Symbol", "Security"]
+        if not all(col in df.columns for col in required_columns):
+            raise ParseError(
+                f"Required columns not found. Available: {df.columns.tolist()}"
+            )
+
+        table = self._build_table(
+            df["Symbol"],
+            df["Security"],
+            Market.OTHER,
+            sector=df.get("GICS Sector", ""),
+            industry=df.get("GICS Sub-Industry", ""),
+        )
+
+        logger.info(f"Successfully fetched {len(table)} S&P 400 symbols")
+        return table
+
+    def _find_table(self, text: str) -> pd.DataFrame:
+        """ページ全体のテーブルから構成銘柄のテーブルを選ぶ"""
+        # pandas で HTML テーブルを読み込み（StringIOを使用）
+        tables = pd.read_html(io.StringIO(text))
+
+        if not tables:
+            raise ParseError("No tables found on Wikipedia page")
+
+        # S&P 400は最初のテーブルが正しいデータ
+        return tables[0]
+
     def is_available(self) -> bool:
         """Wikipedia ページが利用可能かチェック"""
         try:
@@ -6,17 +6,23 @@ import csv
 import logging
 import os
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
 
 try:
     from ..domain.models import ExportConfig, ExportError, Rule40Result
+    from ..domain.result_frame import ResultFrame
 except ImportError:
     from src.core.domain.models import ExportConfig, ExportError, Rule40Result
+    from src.core.domain.result_frame import ResultFrame
 
 logger = logging.getLogger(__name__)
 
+# エクスポート対象（ResultFrame または Rule40Result のリスト）
+Results = Union[ResultFrame, Sequence[Rule40Result]]
+
 
 class ExportService:
     """エクスポートサービス"""
@@ -26,7 +32,7 @@ class ExportService:
 
     def export_results(
         self,
-        results: List[Rule40Result],
+        results: Results,
         config: ExportConfig,
         file_path: Optional[str] = None,
     ) -> str:
@@ -74,7 +80,7 @@ class ExportService:
             return os.path.join("exports", filename)
 
     def _export_csv(
-        self, results: List[Rule40Result], config: ExportConfig, file_path: str
+        self, results: Results, config: ExportConfig, file_path: str
     ):
         """CSV形式でエクスポート"""
         # データフレーム作成
@@ -94,7 +100,7 @@ class ExportService:
             self._add_csv_metadata(file_path, config, len(results))
 
     def _export_excel(
-        self, results: List[Rule40Result], config: ExportConfig, file_path: str
+        self, results: Results, config: ExportConfig, file_path: str
     ):
         """Excel形式でエクスポート"""
         # データフレーム作成
@@ -120,7 +126,7 @@ class ExportService:
             self._adjust_column_width(worksheet, df)
 
     def _export_json(
-        self, results: List[Rule40Result], config: ExportConfig, file_path: str
+        self, results: Results, config: ExportConfig, file_path: str
     ):
         """JSON形式でエクスポート"""
         data = {
@@ -129,7 +135,7 @@ class ExportService:
                 if config.include_metadata
                 else None
             ),
-            "results": [self._result_to_dict(result, config) for result in results],
+            "results": self._create_records(results),
         }
 
         # メタデータを除外
@@ -141,81 +147,88 @@ class ExportService:
             file_path, orient="records", indent=2, force_ascii=False, date_format="iso"
         )
 
-    def _create_dataframe(
-        self, results: List[Rule40Result], config: ExportConfig
-    ) -> pd.DataFrame:
-        """データフレーム作成"""
-        data = []
-
-        for result in results:
-            row = {
-                "シンボル": result.symbol,
-                "銘柄名": result.name,
-                "Rule of 40 (OP)": self._format_value(result.r40_op, config),
-                "Rule of 40 (EBITDA)": self._format_value(result.r40_ebitda, config),
-                "売上成長率 (%)": self._format_value(
-                    (
-                        result.revenue_growth_yoy * 100
-                        if result.revenue_growth_yoy
-                        else None
-                    ),
-                    config,
-                ),
-                "営業利益率 (%)": self._format_value(
-                    result.operating_margin * 100 if result.operating_margin else None,
-                    config,
+    def _create_dataframe(self, results: Results, config: ExportConfig) -> pd.DataFrame:
+        """データフレーム作成（ResultFrame の列から直接作成）"""
+        frame = ResultFrame.from_results(results)
+        rows = frame.to_list()
+
+        return pd.DataFrame(
+            {
+                "シンボル": frame.column("symbol"),
+                "銘柄名": frame.column("name"),
+                "Rule of 40 (OP)": self._format_column(frame, "r40_op", config),
+                "Rule of 40 (EBITDA)": self._format_column(frame, "r40_ebitda", config),
+                "売上成長率 (%)": self._format_column(
+                    frame, "revenue_growth_yoy", config, multiply=100
                 ),
-                "EBITDAマージン (%)": self._format_value(
-                    result.ebitda_margin * 100 if result.ebitda_margin else None, config
+                "営業利益率 (%)": self._format_column(
+                    frame, "operating_margin", config, multiply=100
                 ),
-                "時価総額 (B$)": self._format_value(
-                    result.market_cap / 1e9 if result.market_cap else None, config
+                "EBITDAマージン (%)": self._format_column(
+                    frame, "ebitda_margin", config, multiply=100
                 ),
-                "セクター": result.sector,
-                "業種": result.industry,
-                "データ品質": result.data_quality.value,
-                "計算時刻": (
-                    result.calculation_time.isoformat()
-                    if result.calculation_time
-                    else None
+                "時価総額 (B$)": self._format_column(
+                    frame, "market_cap", config, divide=1e9
                 ),
+                "セクター": frame.column("sector"),
+                "業種": frame.column("industry"),
+                "データ品質": [r.data_quality.value for r in rows],
+                "計算時刻": [
+                    r.calculation_time.isoformat() if r.calculation_time else None
+                    for r in rows
+                ],
             }
-            data.append(row)
-
-        return pd.DataFrame(data)
-
-    def _format_value(
-        self, value: Optional[float], config: ExportConfig
-    ) -> Optional[str]:
-        """値をフォーマット"""
-        if value is None:
-            return None
-
-        if config.decimal_places == 0:
-            return f"{value:.0f}"
-        else:
-            return f"{value:.{config.decimal_places}f}"
+        )
 
-    def _result_to_dict(self, result: Rule40Result, config: ExportConfig) -> dict:
-        """結果を辞書に変換"""
-        return {
-            "symbol": result.symbol,
-            "name": result.name,
-            "r40_op": result.r40_op,
-            "r40_ebitda": result.r40_ebitda,
-            "revenue_growth_yoy": result.revenue_growth_yoy,
-            "operating_margin": result.operating_margin,
-            "ebitda_margin": result.ebitda_margin,
-            "market_cap": result.market_cap,
-            "sector": result.sector,
-            "industry": result.industry,
-            "data_quality": result.data_quality.value,
-            "period": result.period.value,
-            "variant": result.variant.value,
-            "calculation_time": (
-                result.calculation_time.isoformat() if result.calculation_time else None
-            ),
+    def _format_column(
+        self,
+        frame: ResultFrame,
+        name: str,
+        config: ExportConfig,
+        multiply: Optional[float] = None,
+        divide: Optional[float] = None,
+    ) -> List[Optional[str]]:
+        """数値列をまとめてフォーマット（換算する列は従来どおり 0 も欠損扱い）"""
+        values = frame.column(name)
+        missing = frame.missing(name)
+        if multiply is not None or divide is not None:
+            missing = missing | (values == 0)
+        if multiply is not None:
+            values = values * multiply
+        if divide is not None:
+            values = values / divide
+
+        formatted = np.char.mod(f"%.{config.decimal_places}f", values).tolist()
+        return [
+            None if is_missing else text
+            for text, is_missing in zip(formatted, missing.tolist())
+        ]
+
+    def _create_records(self, results: Results) -> List[dict]:
+        """JSON 用のレコードを列から作成"""
+        frame = ResultFrame.from_results(results)
+        rows = frame.to_list()
+        columns = {
+            "symbol": frame.column("symbol").tolist(),
+            "name": frame.column("name").tolist(),
+            "r40_op": frame.optional_column("r40_op"),
+            "r40_ebitda": frame.optional_column("r40_ebitda"),
+            "revenue_growth_yoy": frame.optional_column("revenue_growth_yoy"),
+            "operating_margin": frame.optional_column("operating_margin"),
+            "ebitda_margin": frame.optional_column("ebitda_margin"),
+            "market_cap": frame.optional_column("market_cap"),
+            "sector": frame.column("sector").tolist(),
+            "industry": frame.column("industry").tolist(),
+            "data_quality": [r.data_quality.value for r in rows],
+            "period": [r.period.value for r in rows],
+            "variant": [r.variant.value for r in rows],
+            "calculation_time": [
+                r.calculation_time.isoformat() if r.calculation_time else None
+                for r in rows
+            ],
         }
+        keys = list(columns)
+        return [dict(zip(keys, values)) for values in zip(*columns.values())]
 
     def _create_metadata_dataframe(
         self, config: ExportConfig, result_count: int
@@ -263,7 +276,7 @@ class ExportService:
             ].width = column_length
 
     def get_preview(
-        self, results: List[Rule40Result], config: ExportConfig, max_rows: int = 10
+        self, results: Results, config: ExportConfig, max_rows: int = 10
     ) -> pd.DataFrame:
         """エクスポートプレビューを取得"""
         if not results:
@@ -0,0 +1,295 @@
+"""
+財務データ取得エンジン（ThreadPoolExecutor 版 / asyncio 版）
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
+
+try:
+    from ..data.rate_limiter import AdaptiveRateLimiter, is_rate_limit_error
+    from ..domain.cancellation import CancellationToken, ensure_token
+    from ..domain.models import (
+        DataFetchError,
+        FinancialData,
+        ScreeningCancelledError,
+    )
+except ImportError:
+    from src.core.data.rate_limiter import AdaptiveRateLimiter, is_rate_limit_error
+    from src.core.domain.cancellation import CancellationToken, ensure_token
+    from src.core.domain.models import (
+        DataFetchError,
+        FinancialData,
+        ScreeningCancelledError,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+# 1銘柄分のネットワーク取得関数
+FetchFunction = Callable[[str], FinancialData]
+
+# 完了通知: (symbol, data, error)。呼び出し元スレッドで実行される
+ResultHandler = Callable[[str, Optional[FinancialData], Optional[Exception]], None]
+
+
+class FetchEngine(ABC):
+    """取得エンジンの基底クラス
+
+    レート制限・リトライ方針は全エンジン共通で、並行実行の方式のみが異なる。
+    on_result は常に fetch_all の呼び出し元スレッドから呼ばれる。
+
+    cancel_token が停止されると、未着手の銘柄は破棄し、実行中の取得は完了を
+    待たずに fetch_all から戻る（結果は捨てる。スレッドはリクエストの
+    タイムアウトまでに終わる）。停止で打ち切った銘柄の on_result は呼ばない。
+    fetch_all の呼び出し元で例外（KeyboardInterrupt など）が起きた場合も
+    トークンを停止して同様に打ち切る。
+    """
+
+    name = ""
+
+    def __init__(
+        self,
+        rate_limiter: AdaptiveRateLimiter,
+        max_concurrency: int,
+        retry_attempts: int = 3,
+    ):
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max(1, max_concurrency)
+        self.retry_attempts = max(1, retry_attempts)
+
+    @abstractmethod
+    def fetch_all(
+        self,
+        symbols: List[str],
+        fetch_fn: FetchFunction,
+        on_result: ResultHandler,
+        cancel_token: Optional[CancellationToken] = None,
+    ):
+        """全銘柄を取得し、完了順に on_result を呼ぶ"""
+        pass
+
+    def _handle_error(self, symbol: str, error: Exception, attempt: int) -> bool:
+        """エラーを記録し、リトライすべきなら True を返す"""
+        if not is_rate_limit_error(error):
+            return False
+
+        self.rate_limiter.record_throttle()
+        if attempt >= self.retry_attempts - 1:
+            return False
+
+        logger.warning(
+            f"Rate limited for {symbol}, retrying "
+            f"({attempt + 1}/{self.retry_attempts})..."
+        )
+        return True
+
+
+class ThreadPoolFetchEngine(FetchEngine):
+    """ThreadPoolExecutor による取得（1リクエスト = 1スレッド）"""
+
+    name = "thread"
+
+    def fetch_all(
+        self,
+        symbols: List[str],
+        fetch_fn: FetchFunction,
+        on_result: ResultHandler,
+        cancel_token: Optional[CancellationToken] = None,
+    ):
+        if not symbols:
+            return
+
+        token = ensure_token(cancel_token)
+        max_workers = min(self.max_concurrency, len(symbols))
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+        # 停止時に完了待ちを起こすための番兵
+        cancelled = concurrent.futures.Future()
+
+        def wake():
+            if not cancelled.done():
+                cancelled.set_result(None)
+
+        token.add_callback(wake)
+        try:
+            future_to_symbol = {
+                executor.submit(self._fetch_one, symbol, fetch_fn, token): symbol
+                for symbol in symbols
+            }
+
+            pending = set(future_to_symbol)
+            while pending and not token.cancelled:
+                done, pending = concurrent.futures.wait(
+                    pending | {cancelled},
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                pending.discard(cancelled)
+                for future in done:
+                    if future is not cancelled:
+                        self._deliver(future_to_symbol[future], future, on_result)
+
+        except BaseException:
+            token.cancel()
+            raise
+
+        finally:
+            token.remove_callback(wake)
+            # 停止時は未着手の銘柄を破棄し、実行中の取得を待たない
+            executor.shutdown(wait=not token.cancelled, cancel_futures=True)
+
+    @staticmethod
+    def _deliver(
+        symbol: str, future: concurrent.futures.Future, on_result: ResultHandler
+    ):
+        try:
+            data = future.result()
+        except ScreeningCancelledError:
+            return
+        except Exception as e:
+            on_result(symbol, None, e)
+        else:
+            on_result(symbol, data, None)
+
+    def _fetch_one(
+        self, symbol: str, fetch_fn: FetchFunction, token: CancellationToken
+    ) -> FinancialData:
+        for attempt in range(self.retry_attempts):
+            with self.rate_limiter.slot(token):
+                try:
+                    token.raise_if_cancelled()
+                    data = fetch_fn(symbol)
+                except Exception as e:
+                    if self._handle_error(symbol, e, attempt):
+                        continue
+                    raise
+
+            self.rate_limiter.record_success()
+            return data
+
+        raise DataFetchError(f"Failed to fetch data for {symbol}: retries exhausted")
+
+
+class AsyncFetchEngine(FetchEngine):
+    """asyncio による取得
+
+    スケジューリング・レート制限待ち・バックオフは単一イベントループ上で行い、
+    ブロッキングな yfinance 呼び出しのみを有界のエグゼキュータへ委譲する。
+    待機中の銘柄はスレッドを占有しないため、並行数はスレッド数ではなく
+    セマフォで決まる。
+
+    yfinance には非同期 API が無いため、通信中の取得は1件ごとにエグゼキュータの
+    スレッドを使う（スレッド数は実行枠の数 = AIMD の並列度までに限られる）。
+    接続は YFClient の共有セッション（http_session.PooledSession）で再利用する。
+    """
+
+    name = "async"
+
+    def fetch_all(
+        self,
+        symbols: List[str],
+        fetch_fn: FetchFunction,
+        on_result: ResultHandler,
+        cancel_token: Optional[CancellationToken] = None,
+    ):
+        if not symbols:
+            return
+
+        token = ensure_token(cancel_token)
+        try:
+            asyncio.run(self._run(symbols, fetch_fn, on_result, token))
+        except BaseException:
+            token.cancel()
+            raise
+
+    async def _run(
+        self,
+        symbols: List[str],
+        fetch_fn: FetchFunction,
+        on_result: ResultHandler,
+        token: CancellationToken,
+    ):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(symbols)),
+            thread_name_prefix="async-fetch",
+        )
+
+        async def run_one(symbol: str):
+            async with semaphore:
+                try:
+                    data = await self._fetch_one(symbol, fetch_fn, executor, token)
+                except ScreeningCancelledError:
+                    return
+                except Exception as e:
+                    on_result(symbol, None, e)
+                else:
+                    on_result(symbol, data, None)
+
+        # 停止時はタスクを取り消す（待機中のレート制限・実行中の取得の完了待ちも中断）
+        loop = asyncio.get_running_loop()
+        tasks = [asyncio.ensure_future(run_one(symbol)) for symbol in symbols]
+
+        def cancel_tasks():
+            for task in tasks:
+                task.cancel()
+
+        def wake():
+            try:
+                loop.call_soon_threadsafe(cancel_tasks)
+            except RuntimeError:
+                pass  # イベントループは終了済み
+
+        token.add_callback(wake)
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            token.remove_callback(wake)
+            executor.shutdown(wait=not token.cancelled, cancel_futures=True)
+
+    async def _fetch_one(
+        self,
+        symbol: str,
+        fetch_fn: FetchFunction,
+        executor: concurrent.futures.Executor,
+        token: CancellationToken,
+    ) -> FinancialData:
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self.retry_attempts):
+            async with self.rate_limiter.slot_async():
+                try:
+                    token.raise_if_cancelled()
+                    data = await loop.run_in_executor(executor, fetch_fn, symbol)
+                except Exception as e:
+                    if self._handle_error(symbol, e, attempt):
+                        continue
+                    raise
+
+            self.rate_limiter.record_success()
+            return data
+
+        raise DataFetchError(f"Failed to fetch data for {symbol}: retries exhausted")
+
+
+FETCH_ENGINES = {
+    ThreadPoolFetchEngine.name: ThreadPoolFetchEngine,
+    AsyncFetchEngine.name: AsyncFetchEngine,
+}
+
+
+def create_fetch_engine(
+    backend: str,
+    rate_limiter: AdaptiveRateLimiter,
+    max_concurrency: int,
+    retry_attempts: int = 3,
+) -> FetchEngine:
+    """バックエンド名から取得エンジンを作成"""
+    engine_class = FETCH_ENGINES.get(backend)
+    if engine_class is None:
+        logger.warning(f"Unknown fetch backend '{backend}', falling back to thread")
+        engine_class = ThreadPoolFetchEngine
+
+    return engine_class(rate_limiter, max_concurrency, retry_attempts)
@@ -4,60 +4,180 @@
 
 import concurrent.futures
 import logging
-from datetime import datetime
-from typing import List, Optional
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+import pandas as pd
 
 try:
+    from ..adapters.base import table_to_symbols
     from ..adapters.csv_source import CSVFileSource
     from ..adapters.jpx_listed import Nikkei500Source
     from ..adapters.nasdaq_txt import Nasdaq100, NasdaqListed, OtherListed
     from ..adapters.wikipedia_sp500 import WikipediaSP400, WikipediaSP500
     from ..data.cache import CacheManager
     from ..data.config_loader import ConfigManager
-    from ..data.yf_client import YFClient
+    from ..data.http_session import (
+        SESSION_STATE_KEY,
+        export_session_state,
+        restore_session_state,
+        session_state_ttl_hours,
+    )
+    from ..data.rate_limiter import AdaptiveRateLimiter, is_rate_limit_error
+    from ..data.run_journal import RunJournal
+    from ..data.serialization import (
+        FORMAT_VERSION,
+        PART_FIELDS,
+        decode_financial_data,
+        encode_financial_data,
+        merge_financial_data,
+        split_financial_data,
+    )
+    from ..data.universe_cache import UniverseCache
+    from ..data.yf_client import YFClient, apply_info
+    from ..domain.cancellation import CancellationToken, ensure_token
     from ..domain.models import (
+        CacheError,
         CalculationError,
-        DataFetchError,
+        CalculationPeriod,
+        DataPart,
+        DataQuality,
+        FetchFailure,
         FinancialData,
+        JournalStatus,
         Rule40Result,
+        Rule40Variant,
+        RunStatus,
+        ScreeningCancelledError,
         ScreeningConfig,
+        ScreeningRun,
+        ScreeningSummary,
         Symbol,
+        ValidationError,
     )
+    from ..domain.result_frame import ResultFrame
     from ..domain.rule40 import Rule40Calculator
+    from .fetch_engine import create_fetch_engine
 except ImportError:
+    from src.core.adapters.base import table_to_symbols
     from src.core.adapters.csv_source import CSVFileSource
     from src.core.adapters.jpx_listed import Nikkei500Source
     from src.core.adapters.nasdaq_txt import Nasdaq100, NasdaqListed, OtherListed
     from src.core.adapters.wikipedia_sp500 import WikipediaSP400, WikipediaSP500
+    from src.core.application.fetch_engine import create_fetch_engine
     from src.core.data.cache import CacheManager
     from src.core.data.config_loader import ConfigManager
-    from src.core.data.yf_client import YFClient
+    from src.core.data.http_session import (
+        SESSION_STATE_KEY,
+        export_session_state,
+        restore_session_state,
+        session_state_ttl_hours,
+    )
+    from src.core.data.rate_limiter import AdaptiveRateLimiter, is_rate_limit_error
+    from src.core.data.run_journal import RunJournal
+    from src.core.data.serialization import (
+        FORMAT_VERSION,
+        PART_FIELDS,
+        decode_financial_data,
+        encode_financial_data,
+        merge_financial_data,
+        split_financial_data,
+    )
+    from src.core.data.universe_cache import UniverseCache
+    from src.core.data.yf_client import YFClient, apply_info
+    from src.core.domain.cancellation import CancellationToken, ensure_token
     from src.core.domain.models import (
+        CacheError,
         CalculationError,
-        DataFetchError,
+        CalculationPeriod,
+        DataPart,
+        DataQuality,
+        FetchFailure,
         FinancialData,
+        JournalStatus,
         Rule40Result,
+        Rule40Variant,
+        RunStatus,
+        ScreeningCancelledError,
         ScreeningConfig,
+        ScreeningRun,
+        ScreeningSummary,
         Symbol,
+        ValidationError,
     )
+    from src.core.domain.result_frame import ResultFrame
     from src.core.domain.rule40 import Rule40Calculator
 
 logger = logging.getLogger(__name__)
 
 
+# 連続して失敗した銘柄の再取得を控える時間の上限
+FAILURE_MAX_TTL_HOURS = 168
+
+# 決算発表予定日から求めた財務諸表の有効期間の上限（予定日が古い・誤っている場合の保険）
+EARNINGS_TTL_MAX_HOURS = 24 * 120
+
+# 決算発表後、Yahoo の財務諸表に反映されるまでの猶予
+EARNINGS_GRACE_HOURS = 12
+
+# 失敗の記録を保持する時間（再取得後に再び失敗したとき連続回数を引き継ぐため長めに保持）
+FAILURE_RECORD_TTL_HOURS = 2 * FAILURE_MAX_TTL_HOURS
+
+
 class ScreeningService:
     """スクリーニングサービス"""
 
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
         self.calculator = Rule40Calculator()
-        self.yf_client = YFClient()
+        self.yf_client = YFClient(config_manager.get("fetch.timeout_seconds", 30))
+
+        # レート制限（全ワーカーで共有）
+        self.rate_limiter = AdaptiveRateLimiter.from_config(config_manager)
+        self.retry_attempts = max(1, config_manager.get("fetch.retry_attempts", 3))
 
         # キャッシュ設定
         cache_path = config_manager.get("cache.path", "src/app_data/cache/screening.db")
         cache_ttl = config_manager.get("cache.ttl_hours", 24)
         self.cache = CacheManager(cache_path, cache_ttl)
 
+        # 実行の記録（中断した実行の再開用）
+        self.journal = RunJournal(self.cache)
+
+        # 銘柄リストのスナップショット（条件付き GET・オフライン実行用）
+        self.universe_cache = UniverseCache(self.cache)
+        self._journal_run_id: Optional[str] = None
+
+        # 実行中の処理の停止トークン（実行ごとに差し替える）
+        self._cancel_token = CancellationToken()
+
+        # Yahoo の認証状態（前回までに保存したもの）を復元し、Cookie・crumb の取得を省く
+        self.session_ttl_hours = config_manager.get("cache.session_ttl_hours", 24)
+        self._saved_crumb: Optional[str] = None
+        self._restore_session_state()
+
+        # 直近の実行の集計
+        self.last_summary = ScreeningSummary()
+
+        # 期限切れのキャッシュを返した銘柄（revalidate で取得し直す）
+        self.pending_revalidation: List[Symbol] = []
+
+        # delta モードで財務データを取得する銘柄（銘柄リストに新たに加わったもの）
+        self._delta_symbols: Optional[Set[str]] = None
+
         # データソース初期化
         self._init_data_sources()
 
@@ -71,11 +191,69 @@ class ScreeningService:
             "other": OtherListed(),
             "nikkei500": Nikkei500Source(),
         }
+        for source in self.data_sources.values():
+            source.snapshots = self.universe_cache
 
     def screen_stocks(
-        self, config: ScreeningConfig, progress_callback=None, result_callback=None
-    ) -> List[Rule40Result]:
-        """株式スクリーニング実行"""
+        self,
+        config: ScreeningConfig,
+        progress_callback=None,
+        result_callback=None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> ResultFrame:
+        """株式スクリーニング実行（結果は Rule40Result のシーケンスとして扱える）
+
+        実行は run id を振って記録し、中断した場合は resume で再開できる。
+        cancel_token が停止されると未着手の取得を破棄し、実行中の取得を待たずに
+        ScreeningCancelledError を送出する（実行は中断として記録される）。
+        """
+        return self._run_screening(
+            config, progress_callback, result_callback, cancel_token=cancel_token
+        )
+
+    def resume(
+        self,
+        run_id: Optional[str] = None,
+        progress_callback=None,
+        result_callback=None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> ResultFrame:
+        """中断した実行を再開（run_id 省略時は再開できる最新の実行）
+
+        記録した設定と銘柄リストで実行する。処理済みの銘柄はキャッシュから
+        読み込むため、ネットワークから取得するのは未処理・失敗の銘柄だけになる
+        （処理済みでもキャッシュの期限が切れた銘柄は取得し直す）。
+        """
+        run = self.journal.get_run(run_id) if run_id else self.get_resumable_run()
+        if run is None or not run.resumable:
+            raise ValidationError(f"No resumable run: {run_id or 'latest'}")
+
+        logger.info(
+            f"Resuming run {run.run_id} ({run.remaining}/{run.total} symbols left)"
+        )
+        return self._run_screening(
+            run.config, progress_callback, result_callback, run, cancel_token
+        )
+
+    def get_resumable_run(self) -> Optional[ScreeningRun]:
+        """再開できる最新の実行（無ければ None）"""
+        try:
+            return self.journal.latest_resumable()
+        except Exception as e:
+            logger.warning(f"Failed to read run journal: {e}")
+            return None
+
+    def _run_screening(
+        self,
+        config: ScreeningConfig,
+        progress_callback=None,
+        result_callback=None,
+        run: Optional[ScreeningRun] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> ResultFrame:
+        """スクリーニング実行（run を指定した場合はその記録の続きとして実行）"""
+        completed = False
+        self._cancel_token = ensure_token(cancel_token)
         try:
             # 設定の検証と修正
             max_workers = max(1, config.max_workers)
@@ -84,40 +262,39 @@ class ScreeningService:
             
             logger.info(f"Starting screening with config: {config}")
             start_time = datetime.now()
+            self.last_summary = ScreeningSummary(started_at=start_time)
+            self.pending_revalidation = []
+            self._delta_symbols = None
 
             # 1. 銘柄リスト取得
             if progress_callback:
                 progress_callback(0, 4, "銘柄リストを取得中...")
 
-            symbols = self._get_symbols(config)
+            if run is None:
+                symbols = self._get_symbols(config, progress_callback)
+                self._journal_run_id = self._start_journal(config, symbols)
+            else:
+                symbols = self.journal.symbols(run.run_id)
+                self._journal_run_id = run.run_id
+                self.last_summary.resumed = run.counts.get(JournalStatus.DONE, 0)
+            self.last_summary.run_id = self._journal_run_id
+            self.last_summary.symbols = len(symbols)
+            self._cancel_token.raise_if_cancelled()
             logger.info(f"Found {len(symbols)} symbols to screen")
 
             # 2. 財務データ取得
             if progress_callback:
                 progress_callback(1, 4, f"財務データを取得中 ({len(symbols)}銘柄)...")
 
-            financial_data_list = self._fetch_financial_data(
-                symbols, config, progress_callback, result_callback
-            )
-            logger.info(
-                f"Successfully fetched data for {len(financial_data_list)} symbols"
-            )
-
-            # 3. Rule of 40 計算
-            if progress_callback:
-                progress_callback(2, 4, "Rule of 40を計算中...")
-
-            results = self._calculate_rule40(
-                financial_data_list, config, progress_callback, result_callback
-            )
-            logger.info(f"Calculated Rule of 40 for {len(results)} symbols")
-
-            # 4. フィルタリング
-            if progress_callback:
-                progress_callback(3, 4, "結果をフィルタリング中...")
-
-            filtered_results = self._apply_filters(results, config)
-            logger.info(f"After filtering: {len(filtered_results)} symbols")
+            if config.streaming:
+                # 2-4. 取得完了ごとに計算・フィルタリングして即座に通知
+                filtered_results = self._screen_streaming(
+                    symbols, config, progress_callback, result_callback
+                )
+            else:
+                filtered_results = self._screen_batch(
+                    symbols, config, progress_callback, result_callback
+                )
 
             # 5. ソート
             sorted_results = self._sort_results(filtered_results, config)
@@ -129,183 +306,975 @@ class ScreeningService:
             enriched_results = self._enrich_results(sorted_results)
 
             elapsed = (datetime.now() - start_time).total_seconds()
+            self.last_summary.passed = len(enriched_results)
+            self.last_summary.elapsed_seconds = elapsed
+            self.last_summary.rate_limiter = self.rate_limiter.get_stats()
+            self.last_summary.http_pool = self.yf_client.get_pool_stats()
             logger.info(f"Screening completed in {elapsed:.1f} seconds")
+            logger.info(f"HTTP pool stats: {self.last_summary.http_pool}")
 
+            completed = True
             return enriched_results
 
+        except ScreeningCancelledError:
+            logger.info("Screening cancelled")
+            raise
+
         except Exception as e:
             logger.error(f"Screening failed: {e}")
             raise
 
-    def _get_symbols(self, config: ScreeningConfig) -> List[Symbol]:
-        """銘柄リスト取得"""
-        all_symbols = []
-
-        for source_name in config.sources:
-            if source_name in self.data_sources:
-                try:
-                    source = self.data_sources[source_name]
-                    if source.is_available():
-                        symbols = source.fetch()
-                        all_symbols.extend(symbols)
-                        logger.info(f"Got {len(symbols)} symbols from {source_name}")
-                    else:
-                        logger.warning(f"Data source {source_name} is not available")
-                except Exception as e:
-                    logger.error(f"Failed to fetch symbols from {source_name}: {e}")
+        finally:
+            # Ticker は実行内でのみ使い回す（セッション・接続は次の実行でも使う）
+            self.yf_client.clear_tickers()
+            self._save_session_state()
+            self._finish_journal(
+                RunStatus.COMPLETED if completed else RunStatus.INTERRUPTED
+            )
 
-        # CSVファイルから取得
+    def _start_journal(
+        self, config: ScreeningConfig, symbols: List[Symbol]
+    ) -> Optional[str]:
+        """実行を記録（記録に失敗してもスクリーニングは続ける）"""
+        try:
+            return self.journal.start(config, symbols)
+        except Exception as e:
+            logger.warning(f"Failed to start run journal: {e}")
+            return None
+
+    def _update_journal(
+        self, updates: Dict[str, Tuple[JournalStatus, Optional[str]]]
+    ):
+        """バッファした銘柄の状態を記録"""
+        if self._journal_run_id is None or not updates:
+            return
+        try:
+            self.journal.update(self._journal_run_id, updates)
+        except Exception as e:
+            logger.warning(f"Failed to update run journal: {e}")
+        updates.clear()
+
+    def _finish_journal(self, status: RunStatus):
+        """実行の記録を終了"""
+        run_id, self._journal_run_id = self._journal_run_id, None
+        if run_id is None:
+            return
+        try:
+            self.journal.finish(run_id, status)
+        except Exception as e:
+            logger.warning(f"Failed to finish run journal: {e}")
+
+    def revalidate(
+        self,
+        config: ScreeningConfig,
+        result_callback=None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Tuple[ResultFrame, List[str]]:
+        """期限切れのキャッシュを返した銘柄を取得し直して再計算（stale-while-revalidate）
+
+        screen_stocks の後に呼ぶ。取得したデータはキャッシュに保存し、
+        (フィルターを通過した結果, 取得し直せた銘柄) を返す。取得し直せた銘柄の
+        うち結果に含まれないものは、更新後にフィルターを通過しなくなった銘柄。
+        result_callback にはフィルターを通過した結果を通知する。
+        cancel_token が停止されると ScreeningCancelledError を送出する。
+        """
+        self._cancel_token = ensure_token(cancel_token)
+        symbols, self.pending_revalidation = self.pending_revalidation, []
+        if not symbols:
+            return ResultFrame(), []
+
+        logger.info(f"Revalidating {len(symbols)} stale symbols")
+        # 猶予を無効にして期限切れの構成要素を不足扱いにし、不足分だけを取得する。
+        # 事前絞り込みで落ちた銘柄は通知されないため、全銘柄を取得して判定する
+        fresh_config = replace(
+            config, stale_grace_hours=0, prefilter=False, force_refresh=False
+        )
+        refreshed: List[str] = []
+        passed: List[Rule40Result] = []
+
+        def on_data(data: FinancialData):
+            refreshed.append(data.symbol)
+            result = self._calculate_one(data, fresh_config)
+            if result is None or not self._passes_filters(result, fresh_config):
+                return
+
+            passed.append(result)
+            if result_callback:
+                result_callback(result)
+
+        try:
+            self._fetch_financial_data(symbols, fresh_config, data_callback=on_data)
+        finally:
+            self.yf_client.clear_tickers()
+            self._save_session_state()
+
+        self.last_summary.revalidated += len(refreshed)
+        logger.info(
+            f"Revalidated {len(refreshed)}/{len(symbols)} symbols "
+            f"({len(passed)} passed filters)"
+        )
+        return self._sort_results(passed, config), refreshed
+
+    def _restore_session_state(self):
+        """保存済みの Yahoo の認証状態を共有セッションに復元"""
+        session = getattr(self.yf_client, "session", None)
+        if session is None:
+            return
+
+        state = self.cache.get(SESSION_STATE_KEY)
+        if not isinstance(state, dict):
+            return
+
+        self._saved_crumb = state.get("crumb")
+        try:
+            if restore_session_state(session, state):
+                logger.info("Restored Yahoo session state from cache")
+        except Exception as e:
+            logger.warning(f"Failed to restore Yahoo session state: {e}")
+
+    def _save_session_state(self):
+        """Yahoo の認証状態が変わっていればキャッシュに保存"""
+        session = getattr(self.yf_client, "session", None)
+        if session is None:
+            return
+
+        try:
+            state = export_session_state(session)
+            if state is None or state["crumb"] == self._saved_crumb:
+                return
+
+            ttl_hours = session_state_ttl_hours(state, self.session_ttl_hours)
+            if ttl_hours <= 0:
+                return
+
+            self.cache.set(SESSION_STATE_KEY, state, ttl_hours)
+            self._saved_crumb = state["crumb"]
+            logger.debug(f"Saved Yahoo session state for {ttl_hours} hours")
+        except Exception as e:
+            logger.warning(f"Failed to save Yahoo session state: {e}")
+
+    def _screen_batch(
+        self,
+        symbols: List[Symbol],
+        config: ScreeningConfig,
+        progress_callback=None,
+        result_callback=None,
+    ) -> List[Rule40Result]:
+        """フェーズごとに処理（全件取得 → 全件計算 → フィルタリング）
+
+        result_callback にはストリーミングと同じくフィルターを通過した結果だけを
+        通知する（フィルタリングの後にまとめて通知）。
+        """
+        financial_data_list = self._fetch_financial_data(
+            symbols, config, progress_callback
+        )
+        logger.info(
+            f"Successfully fetched data for {len(financial_data_list)} symbols"
+        )
+
+        # 3. Rule of 40 計算
+        if progress_callback:
+            progress_callback(2, 4, "Rule of 40を計算中...")
+
+        results = self._calculate_rule40(financial_data_list, config, progress_callback)
+        self.last_summary.calculated = len(results)
+        logger.info(f"Calculated Rule of 40 for {len(results)} symbols")
+
+        # 4. フィルタリング
+        if progress_callback:
+            progress_callback(3, 4, "結果をフィルタリング中...")
+
+        filtered_results = self._apply_filters(results, config)
+        logger.info(f"After filtering: {len(filtered_results)} symbols")
+
+        if result_callback:
+            for result in filtered_results:
+                result_callback(result)
+        return filtered_results
+
+    def _screen_streaming(
+        self,
+        symbols: List[Symbol],
+        config: ScreeningConfig,
+        progress_callback=None,
+        result_callback=None,
+    ) -> List[Rule40Result]:
+        """取得完了ごとに計算・フィルタリングする（ストリーミング）
+
+        FinancialData は結果の算出後に破棄し、保持するのは Rule40Result のみ。
+        result_callback にはフィルターを通過した結果だけを通知する。
+        """
+        filtered_results = []
+        calculated_count = 0
+
+        def on_data(data: FinancialData):
+            nonlocal calculated_count
+            result = self._calculate_one(data, config)
+            if result is None:
+                return
+
+            calculated_count += 1
+            if not self._passes_filters(result, config):
+                return
+
+            filtered_results.append(result)
+            if result_callback:
+                result_callback(result)
+
+        self._fetch_financial_data(symbols, config, progress_callback, on_data)
+        self.last_summary.calculated = calculated_count
+        logger.info(f"Calculated Rule of 40 for {calculated_count} symbols")
+        logger.info(f"After filtering: {len(filtered_results)} symbols")
+        return filtered_results
+
+    def _get_symbols(
+        self, config: ScreeningConfig, progress_callback=None
+    ) -> List[Symbol]:
+        """銘柄リスト取得
+
+        データソースは並行して取得する（利用可否は取得自体の成否で判断し、
+        事前の確認リクエストは送らない）。前回の取得結果を保存しているソースは
+        更新が無ければそれを使い、config.offline なら常にそれを使う。失敗したソースは記録して残りの
+        ソースで続け、ソースごとに完了を通知する。各ソースの銘柄テーブルは
+        設定の順に結合し、除外・重複除去も列単位で行ってから最後に
+        Symbol を作る。
+        """
+        sources: List[Tuple[str, Any]] = [
+            (name, self.data_sources[name])
+            for name in config.sources
+            if name in self.data_sources
+        ]
         if config.csv_path:
-            try:
-                # 1列目をsymbol列として、name列はsymbolと同じに設定
-                csv_source = CSVFileSource(config.csv_path, symbol_col=0, name_col=0)
-                if csv_source.is_available():
-                    csv_symbols = csv_source.fetch()
-                    all_symbols.extend(csv_symbols)
-                    logger.info(f"Got {len(csv_symbols)} symbols from CSV")
-            except Exception as e:
-                logger.error(f"Failed to fetch symbols from CSV: {e}")
+            # 1列目をsymbol列として、name列はsymbolと同じに設定
+            sources.append(
+                ("csv", CSVFileSource(config.csv_path, symbol_col=0, name_col=0))
+            )
+        if not sources:
+            return []
+        for _, source in sources:
+            source.offline = config.offline
+
+        fetched = self._fetch_symbol_tables(sources, progress_callback)
+        tables = [fetched[name] for name, _ in sources if name in fetched]
+
+        # 前回の一覧からの変化（delta モードでは新たに加わった銘柄だけを取得する）
+        new_symbols = self._collect_universe_diff(sources, fetched)
+        if config.delta:
+            self._delta_symbols = new_symbols
+            logger.info(f"Delta mode: {len(new_symbols)} new symbols")
+
+        if not tables:
+            return []
+        table = pd.concat(tables, ignore_index=True)
 
         # 除外銘柄をフィルター
         if config.exclude_symbols:
-            exclude_set = set(config.exclude_symbols)
-            all_symbols = [s for s in all_symbols if s.symbol not in exclude_set]
+            table = table[~table["symbol"].isin(set(config.exclude_symbols))]
             logger.info(f"Excluded {len(config.exclude_symbols)} symbols")
 
-        # 重複除去（後勝ち）
-        unique_symbols = {}
-        for symbol in all_symbols:
-            unique_symbols[symbol.symbol] = symbol
+        # 重複除去（後勝ち、並びは最初に現れた位置）
+        order = table["symbol"].drop_duplicates()
+        table = (
+            table.drop_duplicates("symbol", keep="last")
+            .set_index("symbol")
+            .loc[order]
+            .reset_index()
+        )
+
+        return table_to_symbols(table)
+
+    def _collect_universe_diff(
+        self, sources: List[Tuple[str, Any]], tables: Dict[str, pd.DataFrame]
+    ) -> Set[str]:
+        """データソースごとの一覧の変化を集計に記録し、新たに加わった銘柄を返す
+
+        前回の一覧が無いソース（初回の取得・CSV）は全銘柄を新たに加わった
+        ものとして扱う。
+        """
+        new_symbols: Set[str] = set()
+        for name, source in sources:
+            if name not in tables:
+                continue
+
+            diff = getattr(source, "last_diff", None)
+            if diff is None:
+                new_symbols.update(tables[name]["symbol"])
+                continue
+
+            new_symbols.update(diff.new_symbols)
+            if diff.changed:
+                self.last_summary.universe_diff[name] = diff.to_dict()
+                logger.info(
+                    f"Universe change in {name}: +{len(diff.added)} "
+                    f"-{len(diff.removed)} renamed {len(diff.renamed)}"
+                )
+        return new_symbols
+
+    def _fetch_symbol_tables(
+        self, sources: List[Tuple[str, Any]], progress_callback=None
+    ) -> Dict[str, pd.DataFrame]:
+        """データソースを並行して取得（ソース名 -> 銘柄テーブル、失敗したソースは除く）"""
+        token = self._cancel_token
+        tables: Dict[str, pd.DataFrame] = {}
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(sources), thread_name_prefix="symbol-source"
+        )
+
+        # 停止時に完了待ちを起こすための番兵
+        cancelled = concurrent.futures.Future()
+
+        def wake():
+            if not cancelled.done():
+                cancelled.set_result(None)
+
+        token.add_callback(wake)
+        try:
+            future_to_name = {
+                executor.submit(source.fetch_table): name for name, source in sources
+            }
+
+            pending = set(future_to_name)
+            finished = 0
+            while pending and not token.cancelled:
+                done, pending = concurrent.futures.wait(
+                    pending | {cancelled},
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                pending.discard(cancelled)
+                for future in done:
+                    if future is cancelled:
+                        continue
+                    name = future_to_name[future]
+                    try:
+                        table = future.result()
+                    except Exception as e:
+                        self.last_summary.source_errors[name] = str(e)
+                        logger.error(f"Failed to fetch symbols from {name}: {e}")
+                        message = f"{name} の取得に失敗"
+                    else:
+                        tables[name] = table
+                        logger.info(f"Got {len(table)} symbols from {name}")
+                        message = f"{name}: {len(table)}銘柄"
+
+                    finished += 1
+                    if progress_callback:
+                        progress_callback(
+                            finished,
+                            len(future_to_name),
+                            f"銘柄リストを取得中: {finished}/{len(future_to_name)} "
+                            f"({message})",
+                        )
+
+        finally:
+            token.remove_callback(wake)
+            # 停止時は取得中のソースを待たない
+            executor.shutdown(wait=not token.cancelled, cancel_futures=True)
 
-        return list(unique_symbols.values())
+        return tables
 
     def _fetch_financial_data(
         self,
         symbols: List[Symbol],
         config: ScreeningConfig,
         progress_callback=None,
-        result_callback=None,
+        data_callback: Optional[Callable[[FinancialData], None]] = None,
     ) -> List[FinancialData]:
-        """財務データ取得"""
+        """財務データ取得
+
+        data_callback を指定した場合、取得したデータは保持せずに
+        1件ずつ（呼び出し元スレッドで）渡し、空のリストを返す。
+        """
         financial_data_list = []
 
+        def deliver(data: FinancialData):
+            if data_callback:
+                data_callback(data)
+            else:
+                financial_data_list.append(data)
+
         # シンボルが0の場合は早期リターン
         if len(symbols) == 0:
             return financial_data_list
 
-        # 並列処理（レート制限対策）
-        max_workers = min(max(1, config.max_workers), len(symbols), 2)  # 最大2並列に制限
+        total = len(symbols)
+        completed_count = 0
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # タスク送信
-            future_to_symbol = {
-                executor.submit(
-                    self._fetch_single_financial_data, symbol, config
-                ): symbol
-                for symbol in symbols
-            }
+        # キャッシュ書き込み・実行の記録はバッファし、batch_size 件ごとにまとめて保存
+        batch_size = max(1, self.config_manager.get("performance.batch_size", 50))
+        failed: Dict[str, str] = {}
+        journal_updates: Dict[str, Tuple[JournalStatus, Optional[str]]] = {}
+
+        def report(symbol: str):
+            nonlocal completed_count
+            completed_count += 1
+            if self._journal_run_id is not None:
+                reason = failed.get(symbol)
+                journal_updates[symbol] = (
+                    (JournalStatus.FAILED, reason)
+                    if reason is not None
+                    else (JournalStatus.DONE, None)
+                )
+                if len(journal_updates) >= batch_size:
+                    self._update_journal(journal_updates)
+            if progress_callback:
+                progress = completed_count / total
+                rate = self.rate_limiter.observed_rate()
+                progress_callback(
+                    int(progress * 100),
+                    100,
+                    f"財務データ取得中: {completed_count}/{total} "
+                    f"({symbol}) - {rate:.1f} req/s",
+                )
+
+        # delta モードでは既存の銘柄をキャッシュから返し、取得するのは
+        # 新たに加わった銘柄とキャッシュの無い（または不足する）銘柄だけ
+        delta = self._delta_symbols if config.delta else None
+
+        # キャッシュヒット分はネットワーク処理の前に一括で読み込む
+        requirements = self.calculator.data_requirements(config.period, config.variant)
+        stale: Set[str] = set()
+        names = [symbol.symbol for symbol in symbols]
+        if delta is None:
+            cached_data = self._load_cached_financial_data(
+                names, config, requirements.parts, stale
+            )
+        else:
+            # delta モード: 既存の銘柄は期限を問わずキャッシュを使い（期限切れは
+            # STALE として返す）、新たに加わった銘柄は通常どおり読み込む
+            cached_data = self._load_cached_financial_data(
+                [name for name in names if name not in delta],
+                config,
+                requirements.parts,
+                stale,
+                any_age=True,
+            )
+            cached_data.update(
+                self._load_cached_financial_data(
+                    [name for name in names if name in delta],
+                    config,
+                    requirements.parts,
+                    stale,
+                )
+            )
+        to_fetch = []
+        partial: Dict[str, FinancialData] = {}
+        for symbol in symbols:
+            cached = cached_data.pop(symbol.symbol, None)
+            if cached and not requirements.missing(cached):
+                self.last_summary.cache_hits += 1
+                if symbol.symbol in stale:
+                    # 期限切れ（猶予内）のデータは即座に返し、後で取得し直す
+                    # （delta モードでは既存の銘柄を取得しないため取得し直さない）
+                    cached.data_quality = DataQuality.STALE
+                    self.last_summary.stale_served += 1
+                    if delta is None:
+                        self.pending_revalidation.append(symbol)
+                    elif symbol.symbol not in delta:
+                        self.last_summary.delta_reused += 1
+                deliver(cached)
+                report(symbol.symbol)
+            else:
+                # 構成要素が不足するキャッシュは不足分のみ取得して補う
+                if cached:
+                    partial[symbol.symbol] = cached
+                to_fetch.append(symbol.symbol)
+
+        # キャッシュから読み込んだ部分データ（書き込み時は今回取得した構成要素のみ保存する）
+        loaded = dict(partial)
+
+        # 直近に取得に失敗した銘柄は再取得しない（ネガティブキャッシュ）
+        if config.retry_failures:
+            self.clear_failures()
+        failures = self._load_failures(to_fetch, config)
+        remaining = []
+        for symbol in to_fetch:
+            failure = failures.get(symbol)
+            if failure is not None and failure.is_active():
+                self.last_summary.skipped_failures += 1
+                partial.pop(symbol, None)
+                failed[symbol] = failure.reason
+                report(symbol)
+            else:
+                remaining.append(symbol)
+        to_fetch = remaining
 
-            # 結果収集
-            completed_count = 0
-            for future in concurrent.futures.as_completed(future_to_symbol):
-                symbol = future_to_symbol[future]
-                try:
-                    data = future.result()
-                    if data:
-                        financial_data_list.append(data)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch data for {symbol.symbol}: {e}")
-
-                completed_count += 1
-                if progress_callback:
-                    progress = completed_count / len(symbols)
-                    progress_callback(
-                        int(progress * 100),
-                        100,
-                        f"財務データ取得中: {completed_count}/{len(symbols)} ({symbol.symbol})",
-                    )
+        if delta is not None:
+            logger.info(
+                f"Delta mode: reusing {self.last_summary.delta_reused} expired "
+                f"cache entries, fetching {len(to_fetch)} symbols"
+            )
+
+        if self.pending_revalidation:
+            logger.info(
+                f"Serving {len(self.pending_revalidation)} symbols from stale cache"
+            )
+        if self.last_summary.skipped_failures:
+            logger.info(
+                f"Skipping {self.last_summary.skipped_failures} symbols "
+                "that failed recently"
+            )
+
+        new_failures: Dict[str, FetchFailure] = {}
+        recovered: List[str] = []
+
+        def record_failure(symbol: str, error: Exception):
+            self.last_summary.fetch_failed += 1
+            failed[symbol] = str(error)
+            # レート制限は銘柄の問題ではないため記録しない
+            if config.failure_ttl_hours > 0 and not is_rate_limit_error(error):
+                new_failures[symbol] = self._new_failure(
+                    symbol, error, failures.get(symbol), config
+                )
+
+        # 並列処理（実際の並列度とレートはレートリミッタが制御）
+        max_workers = min(max(1, config.max_workers), total)
+        self.rate_limiter.set_max_workers(max_workers)
+
+        engine = create_fetch_engine(
+            config.fetch_backend, self.rate_limiter, max_workers, self.retry_attempts
+        )
+
+        # 2段階取得: info だけでフィルター落ちが確定する銘柄は財務諸表を取得しない
+        topping_up = set(partial)
+        if to_fetch and self._prefilter_applicable(config):
+            to_fetch = self._prefilter_symbols(
+                to_fetch, config, engine, report, partial, record_failure
+            )
 
+        pending_writes = []
+
+        def on_result(
+            symbol: str, data: Optional[FinancialData], error: Optional[Exception]
+        ):
+            if error is not None:
+                record_failure(symbol, error)
+                logger.warning(f"Failed to fetch data for {symbol}: {error}")
+            elif data:
+                self.last_summary.fetched += 1
+                if symbol in failures:
+                    recovered.append(symbol)
+                if symbol in topping_up:
+                    self.last_summary.topped_up += 1
+                fetched = self._fetched_parts(data, loaded.get(symbol))
+                pending_writes.append((data, fetched))
+                if len(pending_writes) >= batch_size:
+                    self._store_financial_data_batch(pending_writes, config)
+                    pending_writes.clear()
+                deliver(data)
+            report(symbol)
+
+        # 第1段階の info だけで必要な構成要素が揃った銘柄は財務諸表を取得しない
+        remaining = []
+        for symbol in to_fetch:
+            base = partial.get(symbol)
+            if base is not None and not requirements.missing(base):
+                on_result(symbol, base, None)
+            else:
+                remaining.append(symbol)
+        to_fetch = remaining
+
+        def fetch(symbol: str) -> FinancialData:
+            return self.yf_client.get_financial_data(
+                symbol,
+                requirements=requirements,
+                base=partial.get(symbol),
+                cancel_token=self._cancel_token,
+            )
+
+        logger.info(
+            f"Fetching {len(to_fetch)} symbols ({len(partial)} partially cached) "
+            f"with {engine.name} engine"
+        )
+        try:
+            self._cancel_token.raise_if_cancelled()
+            engine.fetch_all(to_fetch, fetch, on_result, self._cancel_token)
+        finally:
+            # 停止・中断時も取得済みの分は保存する
+            self._store_financial_data_batch(pending_writes, config)
+            self._store_failures(new_failures, recovered)
+            self._update_journal(journal_updates)
+
+        self._cancel_token.raise_if_cancelled()
+
+        logger.info(f"Rate limiter stats: {self.rate_limiter.get_stats()}")
         return financial_data_list
 
-    def _fetch_single_financial_data(
-        self, symbol: Symbol, config: ScreeningConfig
-    ) -> Optional[FinancialData]:
-        """単一銘柄の財務データ取得"""
-        # キャッシュキー
-        cache_key = f"financial_data_{symbol.symbol}"
+    def _prefilter_applicable(self, config: ScreeningConfig) -> bool:
+        """info だけで落とせる条件（最小時価総額・TTM の営業利益版閾値）があるか"""
+        if not config.prefilter:
+            return False
+        if config.min_revenue:
+            return True
+        return (
+            config.threshold is not None
+            and config.period == CalculationPeriod.TTM
+            and config.variant in (Rule40Variant.OP, Rule40Variant.BOTH)
+        )
+
+    def _prefilter_symbols(
+        self,
+        symbols: List[str],
+        config: ScreeningConfig,
+        engine,
+        report: Callable[[str], None],
+        partial: Dict[str, FinancialData],
+        on_failure: Callable[[str, Exception], None],
+    ) -> List[str]:
+        """第1段階: info を揃え、フィルターを通過し得る銘柄に絞り込む
+
+        キャッシュに info がある銘柄はリクエストせずに判定する。取得した info は
+        partial に部分データとして加え（第2段階で再取得しない）、落ちた銘柄の分は
+        info のみのデータとしてキャッシュする。info の取得に失敗した銘柄は
+        財務データの取得も失敗する（同じ info を最初に取得する）ため、
+        取得失敗として扱う。
+        """
+        dropped = set()
+        pruned_data = []
+
+        def prune(symbol: str) -> bool:
+            if not self._rejected_by_info(partial[symbol].info, config):
+                return False
+            self.last_summary.pruned += 1
+            dropped.add(symbol)
+            # 財務諸表を取得しないため info の取得で作った Ticker を破棄する
+            self.yf_client.release_ticker(symbol)
+            report(symbol)
+            return True
+
+        need_info = []
+        for symbol in symbols:
+            if symbol in partial and DataPart.INFO in partial[symbol].held_parts():
+                prune(symbol)
+            else:
+                need_info.append(symbol)
+
+        def on_info(
+            symbol: str, info: Optional[Dict[str, Any]], error: Optional[Exception]
+        ):
+            if error is not None:
+                on_failure(symbol, error)
+                logger.warning(f"Failed to fetch info for {symbol}: {error}")
+                dropped.add(symbol)
+                report(symbol)
+                return
 
-        # キャッシュから取得（強制更新でない場合）
-        if not config.force_refresh:
-            cached_data = self.cache.get(cache_key)
-            if cached_data:
-                logger.debug(f"Using cached data for {symbol.symbol}")
-                return FinancialData(**cached_data)
+            base = partial.get(symbol)
+            if base is None:
+                base = FinancialData(symbol=symbol, parts=frozenset())
+            data = apply_info(base, info)
+            partial[symbol] = data
+            if prune(symbol):
+                pruned_data.append((data, {DataPart.INFO}))
 
+        logger.info(
+            f"Prefiltering {len(symbols)} symbols by info "
+            f"({len(need_info)} info requests)"
+        )
         try:
-            # レート制限対策：リクエスト前に遅延
-            import time
-            import random
-            time.sleep(random.uniform(0.5, 1.5))  # 0.5-1.5秒のランダム遅延
-
-            # リトライ機能付きでデータ取得
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    data = self.yf_client.get_financial_data(symbol.symbol)
-                    break
-                except Exception as e:
-                    if "Rate limited" in str(e) or "Too Many Requests" in str(e):
-                        if attempt < max_retries - 1:
-                            wait_time = (attempt + 1) * 5  # 5秒, 10秒, 15秒
-                            logger.warning(f"Rate limited for {symbol.symbol}, waiting {wait_time}s...")
-                            time.sleep(wait_time)
-                            continue
-                    raise
-
-            # キャッシュに保存
-            self.cache.set(cache_key, data.__dict__, config.cache_ttl_hours)
-
-            return data
-
-        except DataFetchError as e:
-            logger.warning(f"Failed to fetch data for {symbol.symbol}: {e}")
-            return None
+            engine.fetch_all(
+                need_info, self.yf_client.get_info, on_info, self._cancel_token
+            )
+        finally:
+            self._store_financial_data_batch(pruned_data, config)
 
-    def _calculate_rule40(
+        logger.info(
+            f"Prefilter kept {len(symbols) - len(dropped)}/{len(symbols)} symbols "
+            f"({self.last_summary.pruned} pruned)"
+        )
+        return [symbol for symbol in symbols if symbol not in dropped]
+
+    def _rejected_by_info(
+        self, info: Optional[Dict[str, Any]], config: ScreeningConfig
+    ) -> bool:
+        """info だけで _apply_filters に落ちることが確定するか
+
+        確定しない（財務諸表次第の）場合は False。判定は _apply_info・
+        _apply_filters と同じ規則に従う。
+        """
+        # 最小時価総額（結果の market_cap は info["marketCap"] そのもの）
+        if config.min_revenue:
+            market_cap = info.get("marketCap") if info else None
+            if market_cap is None:
+                return True
+            if isinstance(market_cap, (int, float)) and not (
+                market_cap != 0 and market_cap >= config.min_revenue
+            ):
+                return True
+
+        # Rule of 40 閾値（TTM の営業利益版は info だけで決まる）
+        if config.threshold is not None and config.variant in (
+            Rule40Variant.OP,
+            Rule40Variant.BOTH,
+        ):
+            known, r40_op = self.calculator.r40_op_from_info(info, config.period)
+            if known:
+                if r40_op is not None and not r40_op >= config.threshold:
+                    return True
+                # BOTH は r40_op が無ければ EBITDA 版で判定されるため確定しない
+                if r40_op is None and config.variant == Rule40Variant.OP:
+                    return True
+
+        return False
+
+    def _cache_key(self, symbol: str, part: DataPart) -> str:
+        """財務データの構成要素のキャッシュキー（形式バージョン込み）"""
+        return f"financial_data_v{FORMAT_VERSION}_{part.value}_{symbol}"
+
+    def _part_ttl_hours(
+        self, part: DataPart, config: ScreeningConfig, data: FinancialData
+    ) -> int:
+        """構成要素の有効期間（info は日々変わり、財務諸表は決算ごとに変わる）
+
+        財務諸表は次回の決算発表予定日が分かればその日（＋反映までの猶予）まで
+        有効とし、分からなければ固定の有効期間を使う。
+        """
+        if part == DataPart.INFO:
+            return config.cache_ttl_hours
+
+        if data.next_earnings is not None:
+            remaining = data.next_earnings - datetime.now()
+            hours = remaining.total_seconds() / 3600 + EARNINGS_GRACE_HOURS
+            if hours > 0:
+                return max(1, min(int(hours), EARNINGS_TTL_MAX_HOURS))
+
+        if part in (DataPart.INCOME_ANNUAL, DataPart.CASHFLOW_ANNUAL):
+            return config.annual_statement_ttl_hours
+        return config.ttm_statement_ttl_hours
+
+    def _fetched_parts(
+        self, data: FinancialData, loaded: Optional[FinancialData]
+    ) -> FrozenSet[DataPart]:
+        """キャッシュから読み込んだ後に取得した構成要素
+
+        取得し直した構成要素はフィールドが新しいオブジェクトになるため、
+        読み込んだデータと同一でない構成要素を今回取得した分とみなす。
+        """
+        if loaded is None:
+            return data.held_parts()
+
+        held_before = loaded.held_parts()
+        return frozenset(
+            part
+            for part in data.held_parts()
+            if part not in held_before
+            or any(
+                getattr(data, name) is not getattr(loaded, name)
+                for name in PART_FIELDS[part] or ("info",)
+            )
+        )
+
+    def _store_financial_data(self, data: FinancialData, config: ScreeningConfig):
+        """財務データをバイナリ形式でキャッシュに保存"""
+        self._store_financial_data_batch([(data, data.held_parts())], config)
+
+    def _store_financial_data_batch(
         self,
-        financial_data_list: List[FinancialData],
+        entries: Sequence[Tuple[FinancialData, Iterable[DataPart]]],
         config: ScreeningConfig,
-        progress_callback=None,
-        result_callback=None,
-    ) -> List[Rule40Result]:
-        """Rule of 40 計算"""
-        results = []
+    ):
+        """複数銘柄の財務データを構成要素ごとに保存
+
+        entries は (データ, 保存する構成要素)。取得し直していない構成要素を
+        書き直すと有効期限が延びてしまうため、今回取得した分のみを指定する。
+        同じ有効期間の構成要素は1トランザクションで保存する。
+        """
+        items_by_ttl: Dict[int, Dict[str, bytes]] = {}
+        for data, parts in entries:
+            pieces = split_financial_data(data)
+            try:
+                for part in parts:
+                    if part not in pieces:
+                        continue
+                    ttl_hours = self._part_ttl_hours(part, config, data)
+                    items_by_ttl.setdefault(ttl_hours, {})[
+                        self._cache_key(data.symbol, part)
+                    ] = encode_financial_data(pieces[part])
+            except CacheError as e:
+                logger.warning(f"Failed to cache data for {data.symbol}: {e}")
+
+        for ttl_hours, items in items_by_ttl.items():
+            try:
+                self.cache.set_many(items, ttl_hours)
+            except CacheError as e:
+                logger.warning(f"Failed to cache {len(items)} data parts: {e}")
+
+    def _failure_key(self, symbol: str) -> str:
+        """取得失敗の記録のキャッシュキー"""
+        return f"fetch_failure_{symbol}"
+
+    def _new_failure(
+        self,
+        symbol: str,
+        error: Exception,
+        previous: Optional[FetchFailure],
+        config: ScreeningConfig,
+    ) -> FetchFailure:
+        """失敗の記録を作成（連続して失敗するほど再取得までの時間を延ばす）"""
+        failures = previous.failures + 1 if previous else 1
+        hours = min(
+            config.failure_ttl_hours * 2 ** (failures - 1), FAILURE_MAX_TTL_HOURS
+        )
+        now = datetime.now()
+        return FetchFailure(
+            symbol=symbol,
+            reason=str(error)[:500],
+            failures=failures,
+            failed_at=now,
+            retry_after=now + timedelta(hours=hours),
+        )
+
+    def _load_failures(
+        self, symbols: List[str], config: ScreeningConfig
+    ) -> Dict[str, FetchFailure]:
+        """取得失敗の記録を一括取得（強制更新時は空）"""
+        if config.force_refresh or not symbols:
+            return {}
 
-        for i, data in enumerate(financial_data_list):
+        keys = {self._failure_key(symbol): symbol for symbol in symbols}
+        failures = {}
+        for key, payload in self.cache.get_many(keys).items():
             try:
-                result = self.calculator.calculate(
-                    data, period=config.period, variant=config.variant
+                failures[keys[key]] = FetchFailure.from_dict(payload)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Ignoring unreadable failure record {key}: {e}")
+        return failures
+
+    def _store_failures(
+        self, failures: Dict[str, FetchFailure], recovered: List[str]
+    ):
+        """取得失敗の記録を保存し、取得できた銘柄の記録を削除"""
+        try:
+            if failures:
+                self.cache.set_many(
+                    {
+                        self._failure_key(symbol): failure.to_dict()
+                        for symbol, failure in failures.items()
+                    },
+                    FAILURE_RECORD_TTL_HOURS,
+                )
+            if recovered:
+                self.cache.delete_many(
+                    self._failure_key(symbol) for symbol in recovered
                 )
+        except CacheError as e:
+            logger.warning(f"Failed to record fetch failures: {e}")
 
-                # 基本情報設定
-                if data.info:
-                    result.name = data.info.get(
-                        "longName", data.info.get("shortName", "")
-                    )
-                    result.market_cap = data.info.get("marketCap")
-                    result.sector = data.info.get("sector", "")
-                    result.industry = data.info.get("industry", "")
+    def get_failures(self) -> List[FetchFailure]:
+        """記録されている取得失敗の一覧"""
+        prefix = self._failure_key("")
+        keys = [key for key in self.cache.get_keys(prefix) if key.startswith(prefix)]
+        failures = []
+        for payload in self.cache.get_many(keys).values():
+            try:
+                failures.append(FetchFailure.from_dict(payload))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return failures
 
-                results.append(result)
+    def clear_failures(self) -> int:
+        """取得失敗の記録をすべて削除（次回の実行で再取得する）"""
+        prefix = self._failure_key("")
+        keys = [key for key in self.cache.get_keys(prefix) if key.startswith(prefix)]
+        deleted = self.cache.delete_many(keys)
+        if deleted:
+            logger.info(f"Cleared {deleted} fetch failure records")
+        return deleted
 
-                # 個別結果コールバック
-                if result_callback:
-                    result_callback(result)
+    def _get_cached_financial_data(
+        self, symbol: str, config: ScreeningConfig
+    ) -> Optional[FinancialData]:
+        """キャッシュから財務データを取得（強制更新時は None）"""
+        return self._load_cached_financial_data([symbol], config).get(symbol)
+
+    def _load_cached_financial_data(
+        self,
+        symbols: List[str],
+        config: ScreeningConfig,
+        parts: Optional[FrozenSet[DataPart]] = None,
+        stale: Optional[Set[str]] = None,
+        any_age: bool = False,
+    ) -> Dict[str, FinancialData]:
+        """キャッシュから複数銘柄の財務データを一括取得（強制更新時は空）
 
-            except CalculationError as e:
-                logger.warning(f"Failed to calculate Rule of 40 for {data.symbol}: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error calculating for {data.symbol}: {e}")
+        parts（省略時はすべて）の構成要素のうち、期限内のものだけを結合して返す。
+        期限切れの構成要素は返したデータの parts に含まれないため、その分だけが
+        再取得される。stale を渡し、config.stale_grace_hours が正の場合は
+        猶予内の期限切れの構成要素も結合し、その銘柄を stale に追加する。
+        any_age なら猶予によらず期限切れの構成要素をすべて結合する（delta モード）。
+        """
+        if config.force_refresh or not symbols:
+            return {}
+
+        if parts is None:
+            parts = frozenset(DataPart)
+        keys = {
+            self._cache_key(symbol, part): symbol
+            for symbol in symbols
+            for part in parts
+        }
+        if stale is not None and (any_age or config.stale_grace_hours > 0):
+            payloads, stale_keys = self.cache.get_many_stale(
+                keys, None if any_age else config.stale_grace_hours
+            )
+            stale.update(keys[key] for key in stale_keys)
+        else:
+            payloads = self.cache.get_many(keys)
+
+        pieces: Dict[str, List[FinancialData]] = {}
+        for key, payload in payloads.items():
+            symbol = keys[key]
+            if not isinstance(payload, bytes):
+                continue
+            try:
+                pieces.setdefault(symbol, []).append(decode_financial_data(payload))
+            except CacheError as e:
+                logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+
+        cached = {
+            symbol: merge_financial_data(self._drop_outdated_pieces(symbol_pieces))
+            for symbol, symbol_pieces in pieces.items()
+        }
+        logger.debug(f"Loaded {len(cached)}/{len(symbols)} symbols from cache")
+        return cached
+
+    def _drop_outdated_pieces(self, pieces: List[FinancialData]) -> List[FinancialData]:
+        """info の決算期末より前の決算期の財務諸表を除く（決算発表後の古い財務諸表）"""
+        latest = max(
+            (
+                piece.period_end
+                for piece in pieces
+                if piece.period_end and DataPart.INFO in piece.held_parts()
+            ),
+            default=None,
+        )
+        if latest is None:
+            return pieces
+        return [
+            piece
+            for piece in pieces
+            if DataPart.INFO in piece.held_parts()
+            or piece.period_end is None
+            or piece.period_end >= latest
+        ]
+
+    def _calculate_rule40(
+        self,
+        financial_data_list: List[FinancialData],
+        config: ScreeningConfig,
+        progress_callback=None,
+    ) -> List[Rule40Result]:
+        """Rule of 40 計算（ユニバース全体を一括計算）"""
+        results = []
+        batch_results = self.calculator.calculate_batch(
+            financial_data_list, period=config.period, variant=config.variant
+        )
+
+        for i, (data, result) in enumerate(zip(financial_data_list, batch_results)):
+            self._cancel_token.raise_if_cancelled()
+            if result is not None:
+                self._apply_info(result, data)
+                self._apply_staleness(result, data)
+                results.append(result)
 
             # プログレス更新
             if progress_callback:
@@ -318,64 +1287,117 @@ class ScreeningService:
 
         return results
 
+    def _calculate_one(
+        self, data: FinancialData, config: ScreeningConfig
+    ) -> Optional[Rule40Result]:
+        """1銘柄の Rule of 40 計算（失敗時は None）"""
+        try:
+            result = self.calculator.calculate(
+                data, period=config.period, variant=config.variant
+            )
+            self._apply_info(result, data)
+            self._apply_staleness(result, data)
+            return result
+
+        except CalculationError as e:
+            logger.warning(f"Failed to calculate Rule of 40 for {data.symbol}: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error calculating for {data.symbol}: {e}")
+
+        return None
+
+    def _apply_info(self, result: Rule40Result, data: FinancialData):
+        """基本情報設定"""
+        if data.info:
+            result.name = data.info.get("longName", data.info.get("shortName", ""))
+            result.market_cap = data.info.get("marketCap")
+            result.sector = data.info.get("sector", "")
+            result.industry = data.info.get("industry", "")
+
+    def _apply_staleness(self, result: Rule40Result, data: FinancialData):
+        """期限切れのキャッシュから算出した結果は品質を STALE にする"""
+        if data.data_quality == DataQuality.STALE:
+            result.data_quality = DataQuality.STALE
+
     def _apply_filters(
-        self, results: List[Rule40Result], config: ScreeningConfig
-    ) -> List[Rule40Result]:
-        """フィルター適用"""
-        filtered = results
+        self, results: Sequence[Rule40Result], config: ScreeningConfig
+    ) -> ResultFrame:
+        """フィルター適用（全条件を1つのマスクにまとめて1回で抽出）"""
+        frame = ResultFrame.from_results(results)
+        mask = np.ones(len(frame), dtype=bool)
 
         # Rule of 40 閾値フィルター
         if config.threshold is not None:
-            filtered = [
-                r
-                for r in filtered
-                if r.meets_threshold(config.threshold, config.variant)
-            ]
-            logger.debug(f"After threshold filter ({config.threshold}): {len(filtered)} symbols")
+            mask &= frame.threshold_mask(config.threshold, config.variant)
+            logger.debug(
+                f"After threshold filter ({config.threshold}): {mask.sum()} symbols"
+            )
 
         # 最小売上高フィルター
         if config.min_revenue:
-            filtered = [
-                r
-                for r in filtered
-                if r.market_cap and r.market_cap >= config.min_revenue
-            ]
+            market_cap = frame.column("market_cap")
+            mask &= (
+                ~frame.missing("market_cap")
+                & (market_cap != 0)
+                & (market_cap >= config.min_revenue)
+            )
 
         # 黒字のみフィルター
         if config.margin_positive_only:
-            filtered = [
-                r
-                for r in filtered
-                if (r.operating_margin and r.operating_margin > 0)
-                or (r.ebitda_margin and r.ebitda_margin > 0)
-            ]
+            mask &= frame.positive_mask("operating_margin") | frame.positive_mask(
+                "ebitda_margin"
+            )
 
         # カスタムフィルター
         for filter_obj in config.filters:
-            filtered = [r for r in filtered if filter_obj.apply(r)]
-            logger.debug(f"After filter {filter_obj.field} {filter_obj.operator} {filter_obj.value}: {len(filtered)} symbols")
+            mask &= frame.filter_mask(filter_obj)
+            logger.debug(
+                f"After filter {filter_obj.field} {filter_obj.operator} "
+                f"{filter_obj.value}: {mask.sum()} symbols"
+            )
+
+        return frame.take(mask)
 
-        return filtered
+    def _passes_filters(self, result: Rule40Result, config: ScreeningConfig) -> bool:
+        """1件の結果が _apply_filters を通過するか（ResultFrame を作らずに判定）
+
+        取得完了ごとに1件ずつ判定するストリーミング・再検証で使う。
+        _apply_filters と同じ規則に従う。
+        """
+        if config.threshold is not None and not result.meets_threshold(
+            config.threshold, config.variant
+        ):
+            return False
+
+        if config.min_revenue and not (
+            result.market_cap and result.market_cap >= config.min_revenue
+        ):
+            return False
+
+        if config.margin_positive_only and not (
+            (result.operating_margin is not None and result.operating_margin > 0)
+            or (result.ebitda_margin is not None and result.ebitda_margin > 0)
+        ):
+            return False
+
+        return all(filter_obj.apply(result) for filter_obj in config.filters)
 
     def _sort_results(
-        self, results: List[Rule40Result], config: ScreeningConfig
-    ) -> List[Rule40Result]:
-        """結果ソート"""
+        self, results: Sequence[Rule40Result], config: ScreeningConfig
+    ) -> ResultFrame:
+        """結果ソート（argsort による安定ソート）"""
+        results = ResultFrame.from_results(results)
         if config.sort_config:
-            return sorted(
-                results,
-                key=config.sort_config.get_key,
-                reverse=not config.sort_config.ascending,
-            )
-        else:
-            # デフォルト：Rule of 40の降順
-            return sorted(
-                results,
-                key=lambda r: r.get_r40_value(config.variant) or float("-inf"),
-                reverse=True,
+            return results.sort_by(
+                config.sort_config.field, config.sort_config.ascending
             )
 
-    def _enrich_results(self, results: List[Rule40Result]) -> List[Rule40Result]:
+        # デフォルト：Rule of 40の降順（0 と欠損は -inf 扱い）
+        values, missing = results.r40_values(config.variant)
+        keys = np.where(missing | (values == 0), -np.inf, values)
+        return results.take(results.sort_indices(keys=keys))
+
+    def _enrich_results(self, results: ResultFrame) -> ResultFrame:
         """結果に追加情報を付与"""
         # TODO: 追加情報の付与処理
         return results
@@ -6,8 +6,10 @@ import json
 import logging
 import os
 import sqlite3
+import threading
+import weakref
 from datetime import datetime, timedelta
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
 
 try:
     from ..domain.models import CacheEntry, CacheError
@@ -18,25 +20,41 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# IN 句 1回あたりのキー数（SQLITE_MAX_VARIABLE_NUMBER の旧既定値 999 未満）
+_BATCH_CHUNK_SIZE = 500
+
+
+class _PooledConnection(sqlite3.Connection):
+    """弱参照で追跡できる sqlite3 接続"""
+
+
 class CacheManager:
-    """SQLite ベースのキャッシュマネージャ"""
+    """SQLite ベースのキャッシュマネージャ
+
+    接続はスレッドごとに1本を使い回す（スレッドローカル）。同じ SQL 文は
+    接続単位のステートメントキャッシュで再利用される。
+    """
 
     def __init__(self, db_path: str, ttl_hours: int = 24):
         self.db_path = db_path
         self.ttl = timedelta(hours=ttl_hours)
+        self._local = threading.local()
+        self._connections: "weakref.WeakSet[_PooledConnection]" = weakref.WeakSet()
+        self._connections_lock = threading.Lock()
         self._init_db()
 
     def _init_db(self):
         """データベース初期化"""
         try:
             # ディレクトリ作成
-            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
 
-            # タイムアウトを30秒に設定し、WALモードを有効化
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                # WALモードで同時アクセスを改善
+            conn = self._connection()
+            with conn:
+                # WALモードで同時アクセスを改善（DB ファイルに永続化される）
                 conn.execute("PRAGMA journal_mode=WAL")
-                conn.execute("PRAGMA synchronous=NORMAL")
 
                 conn.execute(
                     """
@@ -48,87 +66,202 @@ class CacheManager:
                     )
                 """
                 )
-                conn.commit()
 
         except Exception as e:
             raise CacheError(f"Failed to initialize cache database: {e}")
 
+    def _connection(self) -> sqlite3.Connection:
+        """現在のスレッド用の接続を取得（無ければ作成）"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # タイムアウトを30秒に設定
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=30.0,
+                factory=_PooledConnection,
+                check_same_thread=False,
+                cached_statements=256,
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.add(conn)
+        return conn
+
+    def close(self):
+        """全スレッドの接続を閉じる"""
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.debug(f"Cache connection close error: {e}")
+
+        self._local = threading.local()
+
     def get(self, key: str) -> Optional[Any]:
         """キャッシュからデータを取得"""
         try:
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                cursor = conn.execute(
-                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
-                )
-                row = cursor.fetchone()
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
 
-                if row is None:
-                    return None
+            if row is None:
+                return None
 
-                value_json, expires_at_str = row
-                expires_at = datetime.fromisoformat(expires_at_str)
+            value, expires_at_str = row
+            expires_at = datetime.fromisoformat(expires_at_str)
 
-                # 期限切れチェック
-                if datetime.now() > expires_at:
-                    self.delete(key)
-                    return None
+            # 期限切れチェック
+            if datetime.now() > expires_at:
+                self.delete(key)
+                return None
 
-                # デシリアライズ
-                return json.loads(value_json)
+            # デシリアライズ
+            return self._deserialize(value)
 
         except Exception as e:
             logger.warning(f"Cache get error for key {key}: {e}")
             return None
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """複数キーを一括取得（存在し、期限内のもののみ返す）"""
+        results, _ = self.get_many_stale(keys, 0)
+        return results
+
+    def get_many_stale(
+        self, keys: Iterable[str], grace_hours: Optional[float]
+    ) -> Tuple[Dict[str, Any], Set[str]]:
+        """期限切れ後 grace_hours 以内のエントリも含めて一括取得
+
+        (値, 期限切れのキー) を返す。猶予も過ぎたエントリは削除する。
+        grace_hours が None なら期限を問わずすべて返す（削除しない）。
+        """
+        keys = list(dict.fromkeys(keys))
+        results: Dict[str, Any] = {}
+        stale: Set[str] = set()
+        if not keys:
+            return results, stale
+
+        try:
+            conn = self._connection()
+            now = datetime.now()
+            grace = (
+                None if grace_hours is None else timedelta(hours=max(0, grace_hours))
+            )
+            expired = []
+
+            for chunk in _chunks(keys):
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT key, value, expires_at FROM cache WHERE key IN ({placeholders})",
+                    chunk,
+                )
+                for key, value, expires_at_str in cursor:
+                    expires_at = datetime.fromisoformat(expires_at_str)
+                    if grace is not None and now > expires_at + grace:
+                        expired.append(key)
+                        continue
+                    if now > expires_at:
+                        stale.add(key)
+                    results[key] = self._deserialize(value)
+
+            if expired:
+                self.delete_many(expired)
+
+            return results, stale
+
+        except Exception as e:
+            logger.warning(f"Cache get_many error ({len(keys)} keys): {e}")
+            return results, stale
+
     def set(self, key: str, value: Any, ttl_hours: Optional[int] = None):
         """キャッシュにデータを保存"""
+        self.set_many({key: value}, ttl_hours)
+
+    def set_many(
+        self,
+        items: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]],
+        ttl_hours: Optional[int] = None,
+    ):
+        """複数エントリを1トランザクションで保存"""
+        pairs = list(items.items()) if isinstance(items, Mapping) else list(items)
+        if not pairs:
+            return
+
         try:
             ttl = timedelta(hours=ttl_hours) if ttl_hours else self.ttl
-            expires_at = datetime.now() + ttl
+            now = datetime.now()
+            created_at = now.isoformat()
+            expires_at = (now + ttl).isoformat()
 
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                conn.execute(
+            conn = self._connection()
+            with conn:
+                conn.executemany(
                     "INSERT OR REPLACE INTO cache (key, value, created_at, expires_at) VALUES (?, ?, ?, ?)",
-                    (
-                        key,
-                        json.dumps(value, default=str),
-                        datetime.now().isoformat(),
-                        expires_at.isoformat(),
-                    ),
+                    [
+                        (key, self._serialize(value), created_at, expires_at)
+                        for key, value in pairs
+                    ],
                 )
-                conn.commit()
 
         except Exception as e:
-            logger.warning(f"Cache set error for key {key}: {e}")
-            raise CacheError(f"Failed to set cache for key {key}: {e}")
+            logger.warning(f"Cache set error for {len(pairs)} keys: {e}")
+            raise CacheError(f"Failed to set cache for {len(pairs)} keys: {e}")
+
+    def _serialize(self, value: Any) -> Any:
+        """保存用に変換（bytes は BLOB としてそのまま保存）"""
+        if isinstance(value, (bytes, bytearray)):
+            return bytes(value)
+        return json.dumps(value, default=str)
+
+    def _deserialize(self, value: Any) -> Any:
+        """保存形式から復元（BLOB は bytes のまま返す）"""
+        if isinstance(value, bytes):
+            return value
+        return json.loads(value)
 
     def delete(self, key: str) -> bool:
         """キャッシュを削除"""
+        return self.delete_many([key]) > 0
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """複数キーを1トランザクションで削除"""
+        keys = list(keys)
+        if not keys:
+            return 0
+
         try:
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                cursor = conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-                conn.commit()
-                return cursor.rowcount > 0
+            conn = self._connection()
+            with conn:
+                cursor = conn.executemany(
+                    "DELETE FROM cache WHERE key = ?", [(key,) for key in keys]
+                )
+                return cursor.rowcount
 
         except Exception as e:
-            logger.warning(f"Cache delete error for key {key}: {e}")
-            return False
+            logger.warning(f"Cache delete error for {len(keys)} keys: {e}")
+            return 0
 
     def cleanup(self) -> int:
         """期限切れキャッシュをクリーンアップ"""
         try:
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
+            conn = self._connection()
+            with conn:
                 cursor = conn.execute(
                     "DELETE FROM cache WHERE expires_at < ?",
                     (datetime.now().isoformat(),),
                 )
-                conn.commit()
                 deleted_count = cursor.rowcount
 
-                if deleted_count > 0:
-                    logger.info(f"Cleaned up {deleted_count} expired cache entries")
+            if deleted_count > 0:
+                logger.info(f"Cleaned up {deleted_count} expired cache entries")
 
-                return deleted_count
+            return deleted_count
 
         except Exception as e:
             logger.warning(f"Cache cleanup error: {e}")
@@ -137,10 +270,10 @@ class CacheManager:
     def clear_all(self):
         """全キャッシュをクリア"""
         try:
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
+            conn = self._connection()
+            with conn:
                 conn.execute("DELETE FROM cache")
-                conn.commit()
-                logger.info("Cleared all cache entries")
+            logger.info("Cleared all cache entries")
 
         except Exception as e:
             logger.warning(f"Cache clear error: {e}")
@@ -149,31 +282,32 @@ class CacheManager:
     def get_stats(self) -> dict:
         """キャッシュ統計情報を取得"""
         try:
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                # 総エントリ数
-                cursor = conn.execute("SELECT COUNT(*) FROM cache")
-                total_entries = cursor.fetchone()[0]
-
-                # 期限切れエントリ数
-                cursor = conn.execute(
-                    "SELECT COUNT(*) FROM cache WHERE expires_at < ?",
-                    (datetime.now().isoformat(),),
-                )
-                expired_entries = cursor.fetchone()[0]
-
-                # データベースサイズ
-                cursor = conn.execute(
-                    "SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()"
-                )
-                db_size = cursor.fetchone()[0]
-
-                return {
-                    "total_entries": total_entries,
-                    "expired_entries": expired_entries,
-                    "valid_entries": total_entries - expired_entries,
-                    "db_size_bytes": db_size,
-                    "db_size_mb": round(db_size / 1024 / 1024, 2),
-                }
+            conn = self._connection()
+
+            # 総エントリ数
+            cursor = conn.execute("SELECT COUNT(*) FROM cache")
+            total_entries = cursor.fetchone()[0]
+
+            # 期限切れエントリ数
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM cache WHERE expires_at < ?",
+                (datetime.now().isoformat(),),
+            )
+            expired_entries = cursor.fetchone()[0]
+
+            # データベースサイズ
+            cursor = conn.execute(
+                "SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()"
+            )
+            db_size = cursor.fetchone()[0]
+
+            return {
+                "total_entries": total_entries,
+                "expired_entries": expired_entries,
+                "valid_entries": total_entries - expired_entries,
+                "db_size_bytes": db_size,
+                "db_size_mb": round(db_size / 1024 / 1024, 2),
+            }
 
         except Exception as e:
             logger.warning(f"Cache stats error: {e}")
@@ -182,16 +316,21 @@ class CacheManager:
     def get_keys(self, pattern: str = None) -> List[str]:
         """キャッシュキーのリストを取得"""
         try:
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                if pattern:
-                    cursor = conn.execute(
-                        "SELECT key FROM cache WHERE key LIKE ?", (f"%{pattern}%",)
-                    )
-                else:
-                    cursor = conn.execute("SELECT key FROM cache")
+            conn = self._connection()
+            if pattern:
+                cursor = conn.execute(
+                    "SELECT key FROM cache WHERE key LIKE ?", (f"%{pattern}%",)
+                )
+            else:
+                cursor = conn.execute("SELECT key FROM cache")
 
-                return [row[0] for row in cursor.fetchall()]
+            return [row[0] for row in cursor.fetchall()]
 
         except Exception as e:
             logger.warning(f"Cache keys error: {e}")
             return []
+
+
+def _chunks(items: List[str], size: int = _BATCH_CHUNK_SIZE) -> Iterable[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -0,0 +1,235 @@
+"""
+Yahoo Finance 用の共有 HTTP セッション（接続プール）と認証状態の保存
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from yfinance.data import YfData
+
+try:
+    from curl_cffi import Curl, CurlInfo
+    from curl_cffi.requests import Response, Session
+
+    HAS_CURL_CFFI = True
+except ImportError:
+    # curl_cffi が無い環境では yfinance 既定のセッションを使う
+    Curl = CurlInfo = None
+    Response = Session = object
+    HAS_CURL_CFFI = False
+
+
+logger = logging.getLogger(__name__)
+
+
+# 待機中に保持する curl ハンドル数の上限（超えた分は閉じる）
+MAX_IDLE_HANDLES = 32
+
+# Yahoo の認証状態（Cookie・crumb）を保存するキャッシュキー
+SESSION_STATE_KEY = "yahoo_session_state"
+
+# 保存対象の Cookie のドメイン
+_YAHOO_DOMAIN = "yahoo.com"
+
+
+class _PooledResponse(Response):
+    """転送で新たに確立した接続数を記録するレスポンス"""
+
+    def __init__(self, curl=None, request=None):
+        super().__init__(curl, request)
+        # レスポンス生成はハンドルのリセット前なので転送の情報を参照できる
+        self.new_connections = (
+            int(curl.getinfo(CurlInfo.NUM_CONNECTS)) if curl is not None else 0
+        )
+
+
+class PooledSession(Session):
+    """curl ハンドルをスレッド間で使い回す keep-alive セッション
+
+    curl_cffi の既定ではハンドル（keep-alive 接続・TLS セッション・DNS の
+    キャッシュを持つ）がスレッドローカルのため、ワーカースレッドが終わると
+    接続も失われる。ここではリクエストごとにプールからハンドルを借りて返す
+    ため、実行ごとに作り直されるワーカースレッドや複数の実行をまたいで
+    接続を再利用できる。Cookie はセッション単位で全ワーカーが共有する。
+    """
+
+    def __init__(self, max_idle: int = MAX_IDLE_HANDLES, **kwargs):
+        kwargs.setdefault("impersonate", "chrome")
+        super().__init__(response_class=_PooledResponse, **kwargs)
+        self.max_idle = max_idle
+        self._pool_lock = threading.Lock()
+        self._idle: List[Curl] = []
+        self._borrowed = threading.local()
+
+        # 統計
+        self.requests = 0
+        self.handles_created = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+
+    @property
+    def curl(self):
+        """リクエスト中は借りているハンドル、それ以外は既定のハンドル"""
+        handle = getattr(self._borrowed, "handle", None)
+        if handle is not None:
+            return handle
+        return super().curl
+
+    def request(self, *args, **kwargs):
+        handle = self._acquire()
+        self._borrowed.handle = handle
+        try:
+            response = super().request(*args, **kwargs)
+        finally:
+            self._borrowed.handle = None
+            self._release(handle)
+
+        self._record(response)
+        return response
+
+    def close(self):
+        """プール中のハンドルを含めて閉じる"""
+        with self._pool_lock:
+            idle, self._idle = self._idle, []
+        for handle in idle:
+            handle.close()
+        super().close()
+
+    def get_stats(self) -> dict:
+        """接続プールの統計情報を取得"""
+        with self._pool_lock:
+            return {
+                "requests": self.requests,
+                "connections_created": self.connections_created,
+                "connections_reused": self.connections_reused,
+                "curl_handles": self.handles_created,
+                "idle_handles": len(self._idle),
+            }
+
+    def _acquire(self) -> Curl:
+        with self._pool_lock:
+            if self._idle:
+                return self._idle.pop()
+            self.handles_created += 1
+        return Curl(debug=self.debug)
+
+    def _release(self, handle: Curl):
+        with self._pool_lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(handle)
+                return
+        handle.close()
+
+    def _record(self, response):
+        new_connections = getattr(response, "new_connections", 0)
+        with self._pool_lock:
+            self.requests += 1
+            if new_connections:
+                self.connections_created += new_connections
+            else:
+                self.connections_reused += 1
+
+
+_shared_session: Optional[PooledSession] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> Optional[PooledSession]:
+    """プロセス全体で共有するセッションを取得（curl_cffi が無ければ None）"""
+    global _shared_session
+
+    if not HAS_CURL_CFFI:
+        return None
+
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = PooledSession()
+            logger.debug("Created shared HTTP session")
+        return _shared_session
+
+
+def _cookie_expiry(expires: Optional[float]) -> Optional[float]:
+    """Cookie の有効期限（UNIX 秒、ミリ秒で保存されている場合も秒に揃える）"""
+    if not expires:
+        return None
+    return expires / 1000 if expires > 2e9 else float(expires)
+
+
+def export_session_state(session) -> Optional[Dict[str, Any]]:
+    """yfinance が確立した Yahoo の認証状態（Cookie・crumb）を取り出す
+
+    crumb が未取得（まだリクエストしていない・取得に失敗した）なら None。
+    yfinance に公開 API が無いため YfData の内部状態を参照する。
+    """
+    data = YfData(session=session)
+    with data._cookie_lock:
+        crumb = data._crumb
+        strategy = data._cookie_strategy
+
+    if not crumb:
+        return None
+
+    cookies = [
+        {
+            "name": cookie.name,
+            "value": cookie.value,
+            "domain": cookie.domain,
+            "path": cookie.path,
+            "secure": bool(cookie.secure),
+            "expires": _cookie_expiry(cookie.expires),
+        }
+        for cookie in session.cookies.jar
+        if _YAHOO_DOMAIN in (cookie.domain or "")
+    ]
+    if not cookies:
+        return None
+
+    return {"crumb": crumb, "strategy": strategy, "cookies": cookies}
+
+
+def session_state_ttl_hours(state: Dict[str, Any], max_hours: int) -> int:
+    """認証状態を保存する時間（Cookie の期限が近ければそれまで、0 は保存不可）"""
+    hours = float(max_hours)
+    now = time.time()
+    for cookie in state.get("cookies", []):
+        expires = cookie.get("expires")
+        if expires:
+            hours = min(hours, (expires - now) / 3600)
+    return max(0, int(hours))
+
+
+def restore_session_state(session, state: Dict[str, Any]) -> bool:
+    """保存した認証状態を yfinance に戻す
+
+    既に認証済み（同じプロセスで取得済み）の場合や Cookie の期限が切れている
+    場合は何もしない。戻した crumb が無効なら yfinance が取得し直す。
+    """
+    crumb = state.get("crumb")
+    cookies = state.get("cookies") or []
+    if not crumb or not cookies:
+        return False
+
+    now = time.time()
+    if any(cookie.get("expires") and cookie["expires"] < now for cookie in cookies):
+        logger.debug("Saved Yahoo session state has expired")
+        return False
+
+    data = YfData(session=session)
+    with data._cookie_lock:
+        if data._crumb is not None:
+            return False
+
+        for cookie in cookies:
+            session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+                secure=cookie.get("secure", False),
+            )
+        data._cookie = True
+        data._crumb = crumb
+        data._cookie_strategy = state.get("strategy", data._cookie_strategy)
+    return True
@@ -0,0 +1,401 @@
+"""
+適応型レート制限（トークンバケット + AIMD 並列度制御）
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Deque, Iterator, Optional, Tuple
+
+try:
+    from ..domain.cancellation import CancellationToken
+except ImportError:
+    from src.core.domain.cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+
+# 停止の確認間隔（実行枠の空き待ちはトークンで起こせないため）
+CANCEL_POLL_SECONDS = 0.1
+
+
+# レート制限と判定するエラーメッセージ
+RATE_LIMIT_MARKERS = ("429", "rate limited", "too many requests", "ratelimit")
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """例外がレート制限（429）由来かを判定"""
+    if type(error).__name__ == "YFRateLimitError":
+        return True
+
+    message = str(error).lower()
+    return any(marker in message for marker in RATE_LIMIT_MARKERS)
+
+
+class TokenBucket:
+    """トークンバケット
+
+    rate トークン/秒で補充され、最大 capacity まで貯まる。
+    reserve() はトークンを1つ予約し、実行可能になるまでの待ち時間を返す。
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self._rate = max(rate, 1e-6)
+        self._capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def set_rate(self, rate: float):
+        """補充レートを変更"""
+        with self._lock:
+            self._refill()
+            self._rate = max(rate, 1e-6)
+            self._capacity = max(1.0, self._rate)
+            self._tokens = min(self._tokens, self._capacity)
+
+    def reserve(self) -> float:
+        """トークンを予約し、待機すべき秒数を返す"""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self):
+        """トークンが得られるまで待機"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+
+
+class AIMDController:
+    """AIMD（加算増加・乗算減少）による並列度制御"""
+
+    def __init__(
+        self,
+        initial_limit: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 12,
+        decrease_factor: float = 0.5,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.decrease_factor = decrease_factor
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        # acquire_async() で待機中の (イベントループ, Future)
+        self._async_waiters: Deque[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Future]
+        ] = deque()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def set_max_limit(self, max_limit: int):
+        """並列度の上限を変更"""
+        with self._condition:
+            self.max_limit = max(self.min_limit, max_limit)
+            self._limit = min(self._limit, float(self.max_limit))
+            self._notify(all_threads=True)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """実行枠を取得（上限に達している場合は待機）"""
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._in_flight < int(self._limit), timeout=timeout
+            ):
+                return False
+            self._in_flight += 1
+            return True
+
+    async def acquire_async(self):
+        """acquire() の asyncio 版（枠が空くと release() などから起こされる）"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            finally:
+                with self._condition:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+
+    def try_acquire(self) -> bool:
+        """待機せずに実行枠の取得を試みる"""
+        with self._condition:
+            if self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return True
+            return False
+
+    def release(self):
+        """実行枠を解放"""
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._notify()
+
+    def on_success(self):
+        """成功時: 1ウィンドウ（limit 件）ごとに並列度を +1"""
+        with self._condition:
+            previous = int(self._limit)
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            if int(self._limit) > previous:
+                self._notify()
+
+    def on_throttle(self):
+        """レート制限時: 並列度を乗算減少"""
+        with self._condition:
+            self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+
+    def _notify(self, all_threads: bool = False):
+        """枠の空きを待機中のスレッドと非同期の待機者に知らせる（ロック内で呼ぶ）
+
+        非同期の待機者はすべて起こし、各自が枠を確認し直す（待機者は
+        エンジンのセマフォで並行数以下に限られる）。
+        """
+        if all_threads:
+            self._condition.notify_all()
+        else:
+            self._condition.notify()
+
+        waiters, self._async_waiters = self._async_waiters, deque()
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake_waiter, waiter)
+            except RuntimeError:
+                pass  # イベントループは終了済み
+
+
+def _wake_waiter(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AdaptiveRateLimiter:
+    """トークンバケットと AIMD を組み合わせた共有レートリミッタ
+
+    リクエストが成功し続ける間はレートと並列度を徐々に引き上げ、
+    429 / "Rate limited" を検知すると両方を乗算減少させて全体を一時停止する。
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = 2.0,
+        min_requests_per_second: float = 0.2,
+        max_requests_per_second: float = 10.0,
+        initial_workers: int = 2,
+        max_workers: int = 12,
+        backoff_factor: float = 2.0,
+        rate_increase: float = 0.1,
+        base_penalty_seconds: float = 5.0,
+        max_penalty_seconds: float = 60.0,
+        rate_window_seconds: float = 30.0,
+    ):
+        self.min_rate = max(min_requests_per_second, 1e-3)
+        self.max_rate = max(max_requests_per_second, self.min_rate)
+        self.backoff_factor = max(backoff_factor, 1.0)
+        self.rate_increase = rate_increase
+        self.base_penalty_seconds = base_penalty_seconds
+        self.max_penalty_seconds = max_penalty_seconds
+        self.rate_window_seconds = rate_window_seconds
+
+        initial_rate = min(max(requests_per_second, self.min_rate), self.max_rate)
+        self.bucket = TokenBucket(initial_rate)
+        self.concurrency = AIMDController(
+            initial_limit=initial_workers,
+            max_limit=max_workers,
+            decrease_factor=1.0 / self.backoff_factor,
+        )
+
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._consecutive_throttles = 0
+        self._request_times: Deque[float] = deque()
+
+        # 統計
+        self.total_requests = 0
+        self.total_throttled = 0
+
+    @classmethod
+    def from_config(cls, config_manager) -> "AdaptiveRateLimiter":
+        """fetch.* 設定からリミッタを作成"""
+        return cls(
+            requests_per_second=config_manager.get("fetch.requests_per_second", 2.0),
+            min_requests_per_second=config_manager.get(
+                "fetch.min_requests_per_second", 0.2
+            ),
+            max_requests_per_second=config_manager.get(
+                "fetch.max_requests_per_second", 10.0
+            ),
+            initial_workers=config_manager.get("fetch.initial_workers", 2),
+            max_workers=config_manager.get("fetch.max_workers", 12),
+            backoff_factor=config_manager.get("fetch.backoff_factor", 2.0),
+        )
+
+    @property
+    def rate(self) -> float:
+        """現在の許可レート（req/s）"""
+        return self.bucket.rate
+
+    def set_max_workers(self, max_workers: int):
+        """並列度の上限を変更"""
+        self.concurrency.set_max_limit(max_workers)
+
+    @contextmanager
+    def slot(self, cancel_token: Optional[CancellationToken] = None) -> Iterator[None]:
+        """レート制限付きでリクエスト1件分の実行枠を確保"""
+        self.acquire(cancel_token)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def slot_async(self) -> AsyncIterator[None]:
+        """slot() の asyncio 版（待機中にスレッドを占有しない）"""
+        await self.acquire_async()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self, cancel_token: Optional[CancellationToken] = None):
+        """実行枠とトークンを取得（必要なら待機）
+
+        cancel_token を渡した場合、停止が要求されると待機を打ち切って
+        ScreeningCancelledError を送出する。
+        """
+        if cancel_token is None:
+            self.concurrency.acquire()
+            sleep = time.sleep
+        else:
+            while not self.concurrency.acquire(timeout=CANCEL_POLL_SECONDS):
+                cancel_token.raise_if_cancelled()
+            sleep = cancel_token.sleep
+        try:
+            remaining = self._pause_remaining()
+            while remaining > 0:
+                sleep(remaining)
+                remaining = self._pause_remaining()
+            wait = self.bucket.reserve()
+            if wait > 0:
+                sleep(wait)
+            self._record_request()
+        except BaseException:
+            self.concurrency.release()
+            raise
+
+    async def acquire_async(self):
+        """acquire() の asyncio 版
+
+        実行枠は空いたときに起こされるまで待ち、一時停止・トークンの不足は
+        残り時間を求めてその分だけ待つ（どちらもポーリングしない）。
+        """
+        await self.concurrency.acquire_async()
+        try:
+            remaining = self._pause_remaining()
+            while remaining > 0:
+                await asyncio.sleep(remaining)
+                remaining = self._pause_remaining()
+            wait = self.bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._record_request()
+        except BaseException:
+            self.concurrency.release()
+            raise
+
+    def release(self):
+        """実行枠を解放"""
+        self.concurrency.release()
+
+    def record_success(self):
+        """リクエスト成功を記録（加算増加）"""
+        with self._lock:
+            self._consecutive_throttles = 0
+            new_rate = min(self.max_rate, self.bucket.rate + self.rate_increase)
+        self.bucket.set_rate(new_rate)
+        self.concurrency.on_success()
+
+    def record_throttle(self) -> float:
+        """レート制限を記録（乗算減少 + 一時停止）し、停止秒数を返す"""
+        with self._lock:
+            self.total_throttled += 1
+            self._consecutive_throttles += 1
+            penalty = min(
+                self.max_penalty_seconds,
+                self.base_penalty_seconds
+                * self.backoff_factor ** (self._consecutive_throttles - 1),
+            )
+            self._paused_until = max(self._paused_until, time.monotonic() + penalty)
+            new_rate = max(self.min_rate, self.bucket.rate / self.backoff_factor)
+
+        self.bucket.set_rate(new_rate)
+        self.concurrency.on_throttle()
+        logger.warning(
+            f"Rate limited: rate -> {new_rate:.2f} req/s, "
+            f"concurrency -> {self.concurrency.limit}, pause {penalty:.0f}s"
+        )
+        return penalty
+
+    def observed_rate(self) -> float:
+        """直近ウィンドウの実リクエストレート（req/s）"""
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            if len(self._request_times) < 2:
+                return 0.0
+            span = max(now - self._request_times[0], 1e-6)
+            return len(self._request_times) / span
+
+    def get_stats(self) -> dict:
+        """統計情報を取得"""
+        return {
+            "total_requests": self.total_requests,
+            "total_throttled": self.total_throttled,
+            "allowed_rate": round(self.rate, 2),
+            "observed_rate": round(self.observed_rate(), 2),
+            "concurrency_limit": self.concurrency.limit,
+        }
+
+    def _pause_remaining(self) -> float:
+        with self._lock:
+            return self._paused_until - time.monotonic()
+
+    def _record_request(self):
+        with self._lock:
+            now = time.monotonic()
+            self.total_requests += 1
+            self._request_times.append(now)
+            self._trim(now)
+
+    def _trim(self, now: float):
+        cutoff = now - self.rate_window_seconds
+        while self._request_times and self._request_times[0] < cutoff:
+            self._request_times.popleft()
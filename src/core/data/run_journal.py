@@ -0,0 +1,226 @@
+"""
+スクリーニング実行の記録（ジャーナル）
+
+実行ごとに run id を振り、対象銘柄と設定、銘柄ごとの処理状態を
+キャッシュと同じ SQLite データベースに記録する。異常終了や停止の後は
+記録から未処理・失敗の銘柄だけを処理し直せる。
+"""
+
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import Iterable, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    from ..domain.models import (
+        JournalStatus,
+        RunStatus,
+        ScreeningConfig,
+        ScreeningRun,
+        Symbol,
+    )
+    from .cache import CacheManager
+except ImportError:
+    from src.core.data.cache import CacheManager
+    from src.core.domain.models import (
+        JournalStatus,
+        RunStatus,
+        ScreeningConfig,
+        ScreeningRun,
+        Symbol,
+    )
+
+
+logger = logging.getLogger(__name__)
+
+
+# 保持する実行の記録の数（古いものから削除）
+MAX_JOURNAL_RUNS = 20
+
+
+class RunJournal:
+    """スクリーニング実行の記録（キャッシュの DB に runs / run_symbols テーブルを持つ）"""
+
+    def __init__(self, cache: CacheManager, max_runs: int = MAX_JOURNAL_RUNS):
+        self.cache = cache
+        self.max_runs = max_runs
+        self._init_tables()
+
+    def _init_tables(self):
+        conn = self.cache._connection()
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    config TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS run_symbols (
+                    run_id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    symbol TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    market TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    error TEXT,
+                    PRIMARY KEY (run_id, symbol)
+                )
+            """
+            )
+
+    def start(self, config: ScreeningConfig, symbols: Sequence[Symbol]) -> str:
+        """実行を記録し、run id を返す（全銘柄を未処理として登録）"""
+        run_id = uuid.uuid4().hex
+        now = datetime.now().isoformat()
+
+        conn = self.cache._connection()
+        with conn:
+            conn.execute(
+                "INSERT INTO runs (run_id, status, config, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    RunStatus.RUNNING.value,
+                    json.dumps(config.to_dict(), default=str),
+                    now,
+                    now,
+                ),
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO run_symbols "
+                "(run_id, position, symbol, name, market, status) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        position,
+                        symbol.symbol,
+                        symbol.name,
+                        symbol.market.value,
+                        JournalStatus.PENDING.value,
+                    )
+                    for position, symbol in enumerate(symbols)
+                ],
+            )
+        self._prune()
+
+        logger.info(f"Started run {run_id} ({len(symbols)} symbols)")
+        return run_id
+
+    def update(
+        self,
+        run_id: str,
+        statuses: Mapping[str, Tuple[JournalStatus, Optional[str]]],
+    ):
+        """銘柄の状態を1トランザクションで更新（symbol -> (状態, エラー)）"""
+        if not statuses:
+            return
+
+        conn = self.cache._connection()
+        with conn:
+            conn.executemany(
+                "UPDATE run_symbols SET status = ?, error = ? "
+                "WHERE run_id = ? AND symbol = ?",
+                [
+                    (status.value, error, run_id, symbol)
+                    for symbol, (status, error) in statuses.items()
+                ],
+            )
+            conn.execute(
+                "UPDATE runs SET updated_at = ? WHERE run_id = ?",
+                (datetime.now().isoformat(), run_id),
+            )
+
+    def finish(self, run_id: str, status: RunStatus):
+        """実行の状態を更新（完了・中断）"""
+        conn = self.cache._connection()
+        with conn:
+            conn.execute(
+                "UPDATE runs SET status = ?, updated_at = ? WHERE run_id = ?",
+                (status.value, datetime.now().isoformat(), run_id),
+            )
+        logger.info(f"Run {run_id} {status.value}")
+
+    def get_run(self, run_id: str) -> Optional[ScreeningRun]:
+        """実行の記録を取得"""
+        conn = self.cache._connection()
+        row = conn.execute(
+            "SELECT run_id, status, config, created_at, updated_at "
+            "FROM runs WHERE run_id = ?",
+            (run_id,),
+        ).fetchone()
+        return self._to_run(row) if row else None
+
+    def list_runs(self) -> List[ScreeningRun]:
+        """実行の記録を新しい順に取得"""
+        conn = self.cache._connection()
+        rows = conn.execute(
+            "SELECT run_id, status, config, created_at, updated_at "
+            "FROM runs ORDER BY created_at DESC"
+        ).fetchall()
+        return [self._to_run(row) for row in rows]
+
+    def latest_resumable(self) -> Optional[ScreeningRun]:
+        """再開できる（完了しておらず、処理が残っている）最新の実行"""
+        return next((run for run in self.list_runs() if run.resumable), None)
+
+    def symbols(
+        self, run_id: str, statuses: Optional[Iterable[JournalStatus]] = None
+    ) -> List[Symbol]:
+        """実行の対象銘柄（statuses で絞り込み、登録順）"""
+        query = "SELECT symbol, name, market FROM run_symbols WHERE run_id = ?"
+        params: list = [run_id]
+        if statuses is not None:
+            values = [status.value for status in statuses]
+            query += f" AND status IN ({','.join('?' * len(values))})"
+            params.extend(values)
+
+        conn = self.cache._connection()
+        rows = conn.execute(query + " ORDER BY position", params).fetchall()
+        return [Symbol(symbol, name, market) for symbol, name, market in rows]
+
+    def _to_run(self, row) -> ScreeningRun:
+        run_id, status, config, created_at, updated_at = row
+        conn = self.cache._connection()
+        counts = {
+            JournalStatus(value): count
+            for value, count in conn.execute(
+                "SELECT status, COUNT(*) FROM run_symbols "
+                "WHERE run_id = ? GROUP BY status",
+                (run_id,),
+            )
+        }
+        return ScreeningRun(
+            run_id=run_id,
+            config=ScreeningConfig.from_dict(json.loads(config)),
+            status=RunStatus(status),
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+            counts=counts,
+        )
+
+    def _prune(self):
+        """古い実行の記録を削除"""
+        conn = self.cache._connection()
+        with conn:
+            stale = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT run_id FROM runs ORDER BY created_at DESC LIMIT -1 OFFSET ?",
+                    (self.max_runs,),
+                )
+            ]
+            if not stale:
+                return
+            conn.executemany(
+                "DELETE FROM run_symbols WHERE run_id = ?", [(r,) for r in stale]
+            )
+            conn.executemany("DELETE FROM runs WHERE run_id = ?", [(r,) for r in stale])
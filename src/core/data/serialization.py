@@ -0,0 +1,354 @@
+"""
+FinancialData のバイナリシリアライズ
+
+キャッシュ用の型付きバイナリ形式。pd.Series は dtype 付きの NumPy バッファ
+（インデックスの日付は datetime64 のまま）として、info は計算・表示に使う
+キーだけを残した小さな JSON として格納する。
+
+レイアウト（リトルエンディアン）:
+    header   : magic(4s) version(B) quality(B) n_index(B) n_series(B)
+               parts(B) last_updated_us(q) period_end_us(q) next_earnings_us(q)
+    symbol   : 文字列
+    info     : 文字列（JSON、無ければ None）
+    index*n  : kind(B) + name + 本体
+    series*n : field_id(B) index_id(B) + name + values
+
+文字列は u32 長 + UTF-8、None は長さ 0xFFFFFFFF で表す。
+配列は dtype 文字列 + u32 要素数 + 生バッファ。
+parts は保持している DataPart のビットマスク（0xFF は不明 = すべて保持）。
+日時は 1970-01-01 からのマイクロ秒（決算カレンダーの日時は 0 が None）。
+同じ期間の Series（売上・営業利益・減価償却費）はインデックスを共有するため、
+インデックスは一度だけ格納し、デコード時も同一オブジェクトを再利用する。
+
+キャッシュには構成要素（DataPart）ごとに分割して格納し（split_financial_data）、
+読み込み時に結合する（merge_financial_data）。構成要素ごとに有効期限を変えられる。
+"""
+
+import json
+import struct
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from ..domain.models import CacheError, DataPart, DataQuality, FinancialData
+except ImportError:
+    from src.core.domain.models import CacheError, DataPart, DataQuality, FinancialData
+
+
+FORMAT_MAGIC = b"R40F"
+FORMAT_VERSION = 3
+
+# シリアライズ対象の Series フィールド（順序 = field_id、変更不可）
+SERIES_FIELDS = (
+    "revenue_annual",
+    "revenue_ttm",
+    "revenue_mrq",
+    "operating_income_annual",
+    "operating_income_ttm",
+    "operating_income_mrq",
+    "depreciation_annual",
+    "depreciation_ttm",
+    "depreciation_mrq",
+)
+
+# 構成要素 -> 格納する Series フィールド（INFO は info のみ）
+PART_FIELDS = {
+    DataPart.INFO: (),
+    DataPart.INCOME_ANNUAL: ("revenue_annual", "operating_income_annual"),
+    DataPart.INCOME_TTM: ("revenue_ttm", "operating_income_ttm"),
+    DataPart.CASHFLOW_ANNUAL: ("depreciation_annual",),
+    DataPart.CASHFLOW_TTM: ("depreciation_ttm",),
+}
+
+# キャッシュに残す info のキー
+INFO_KEYS = (
+    "longName",
+    "shortName",
+    "marketCap",
+    "sector",
+    "industry",
+    "revenueGrowth",
+    "operatingMargins",
+    "ebitdaMargins",
+    "currency",
+    "quoteType",
+)
+
+_QUALITIES = tuple(DataQuality)
+_PARTS = tuple(DataPart)  # 順序 = ビット位置（変更不可）
+_UNKNOWN_PARTS = 0xFF
+_HEADER = struct.Struct("<4sBBBBBqqq")
+_U32 = struct.Struct("<I")
+_KIND = struct.Struct("<B")
+_SERIES_HEAD = struct.Struct("<BB")
+_RANGE = struct.Struct("<qqq")
+_NONE_LENGTH = 0xFFFFFFFF
+_EPOCH = datetime(1970, 1, 1)
+
+# インデックス種別
+_INDEX_ARRAY = 0  # 数値 / datetime64 などの NumPy 配列
+_INDEX_RANGE = 1  # RangeIndex
+_INDEX_JSON = 2  # 文字列などのオブジェクト配列
+
+
+def trim_info(info: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """info から INFO_KEYS のみを抽出"""
+    if info is None:
+        return None
+    return {key: info[key] for key in INFO_KEYS if key in info}
+
+
+def split_financial_data(data: FinancialData) -> Dict[DataPart, FinancialData]:
+    """保持している構成要素ごとの FinancialData に分割"""
+    split = {}
+    for part in data.held_parts():
+        fields = {name: getattr(data, name) for name in PART_FIELDS[part]}
+        split[part] = FinancialData(
+            symbol=data.symbol,
+            info=data.info if part == DataPart.INFO else None,
+            last_updated=data.last_updated,
+            data_quality=data.data_quality,
+            parts=frozenset({part}),
+            period_end=data.period_end,
+            next_earnings=data.next_earnings,
+            **fields,
+        )
+    return split
+
+
+def merge_financial_data(pieces: Iterable[FinancialData]) -> Optional[FinancialData]:
+    """構成要素ごとの FinancialData を1つに結合（空なら None）
+
+    last_updated と period_end は最も古い構成要素のもの、データ品質と
+    next_earnings は最後に取得した構成要素の時点のものを使う。
+    """
+    pieces = sorted(pieces, key=lambda piece: piece.last_updated)
+    if not pieces:
+        return None
+
+    fields: Dict[str, Any] = {}
+    info = None
+    parts = frozenset()
+    period_end = next_earnings = None
+    for piece in pieces:
+        if piece.period_end and (period_end is None or piece.period_end < period_end):
+            period_end = piece.period_end
+        next_earnings = piece.next_earnings or next_earnings
+        held = piece.held_parts()
+        parts |= held
+        if DataPart.INFO in held:
+            info = piece.info
+        for part in held:
+            for name in PART_FIELDS[part]:
+                fields[name] = getattr(piece, name)
+
+    return FinancialData(
+        symbol=pieces[0].symbol,
+        info=info,
+        last_updated=pieces[0].last_updated,
+        data_quality=pieces[-1].data_quality,
+        parts=parts,
+        period_end=period_end,
+        next_earnings=next_earnings,
+        **fields,
+    )
+
+
+def encode_financial_data(data: FinancialData) -> bytes:
+    """FinancialData をバイナリにエンコード"""
+    try:
+        index_ids: Dict[bytes, int] = {}
+        series_parts: List[bytes] = []
+
+        for field_id, field_name in enumerate(SERIES_FIELDS):
+            series = getattr(data, field_name)
+            if series is None:
+                continue
+
+            index_block = _encode_index(series.index)
+            index_id = index_ids.setdefault(index_block, len(index_ids))
+
+            values = series.to_numpy()
+            if values.dtype == object:
+                values = values.astype(np.float64)
+
+            series_parts.append(
+                _SERIES_HEAD.pack(field_id, index_id)
+                + _pack_str(None if series.name is None else str(series.name))
+                + _pack_array(values)
+            )
+
+        last_updated = data.last_updated or datetime.now()
+        header = _HEADER.pack(
+            FORMAT_MAGIC,
+            FORMAT_VERSION,
+            _QUALITIES.index(DataQuality(data.data_quality)),
+            len(index_ids),
+            len(series_parts),
+            _encode_parts(data.parts),
+            _encode_time(last_updated),
+            _encode_time(data.period_end),
+            _encode_time(data.next_earnings),
+        )
+
+        info = trim_info(data.info)
+        info_text = None if info is None else json.dumps(info, separators=(",", ":"))
+
+        return b"".join(
+            [
+                header,
+                _pack_str(data.symbol),
+                _pack_str(info_text),
+                *index_ids,
+                *series_parts,
+            ]
+        )
+
+    except Exception as e:
+        raise CacheError(f"Failed to encode financial data for {data.symbol}: {e}")
+
+
+def decode_financial_data(payload: bytes) -> FinancialData:
+    """バイナリから FinancialData をデコード"""
+    try:
+        view = memoryview(payload)
+        (
+            magic,
+            version,
+            quality,
+            index_count,
+            series_count,
+            parts,
+            updated_us,
+            period_end_us,
+            next_earnings_us,
+        ) = _HEADER.unpack_from(view, 0)
+        if magic != FORMAT_MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"unsupported format {magic!r} v{version}")
+
+        offset = _HEADER.size
+        symbol, offset = _unpack_str(view, offset)
+        info_text, offset = _unpack_str(view, offset)
+
+        indexes = []
+        for _ in range(index_count):
+            index, offset = _decode_index(view, offset)
+            indexes.append(index)
+
+        fields: Dict[str, Any] = {}
+        for _ in range(series_count):
+            field_id, index_id = _SERIES_HEAD.unpack_from(view, offset)
+            name, offset = _unpack_str(view, offset + _SERIES_HEAD.size)
+            values, offset = _unpack_array(view, offset)
+            fields[SERIES_FIELDS[field_id]] = pd.Series(
+                values, index=indexes[index_id], name=name, copy=False
+            )
+
+        return FinancialData(
+            symbol=symbol,
+            info=None if info_text is None else json.loads(info_text),
+            last_updated=_EPOCH + timedelta(microseconds=updated_us),
+            data_quality=_QUALITIES[quality],
+            parts=_decode_parts(parts),
+            period_end=_decode_time(period_end_us),
+            next_earnings=_decode_time(next_earnings_us),
+            **fields,
+        )
+
+    except Exception as e:
+        raise CacheError(f"Failed to decode financial data: {e}")
+
+
+def _encode_time(value: Optional[datetime]) -> int:
+    if value is None:
+        return 0
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _decode_time(microseconds: int) -> Optional[datetime]:
+    if microseconds == 0:
+        return None
+    return _EPOCH + timedelta(microseconds=microseconds)
+
+
+def _encode_parts(parts) -> int:
+    if parts is None:
+        return _UNKNOWN_PARTS
+    return sum(1 << _PARTS.index(DataPart(part)) for part in parts)
+
+
+def _decode_parts(mask: int):
+    if mask == _UNKNOWN_PARTS:
+        return None
+    return frozenset(part for bit, part in enumerate(_PARTS) if mask & (1 << bit))
+
+
+def _encode_index(index: pd.Index) -> bytes:
+    name = _pack_str(None if index.name is None else str(index.name))
+
+    if isinstance(index, pd.RangeIndex):
+        body = _RANGE.pack(index.start, index.stop, index.step)
+        return _KIND.pack(_INDEX_RANGE) + name + body
+
+    if index.dtype != object and index.dtype.kind in "iufMm":
+        return _KIND.pack(_INDEX_ARRAY) + name + _pack_array(index.to_numpy())
+
+    text = json.dumps([_to_json_scalar(v) for v in index])
+    return _KIND.pack(_INDEX_JSON) + name + _pack_str(text)
+
+
+def _decode_index(view: memoryview, offset: int) -> Tuple[pd.Index, int]:
+    (kind,) = _KIND.unpack_from(view, offset)
+    name, offset = _unpack_str(view, offset + _KIND.size)
+
+    if kind == _INDEX_RANGE:
+        start, stop, step = _RANGE.unpack_from(view, offset)
+        return pd.RangeIndex(start, stop, step, name=name), offset + _RANGE.size
+
+    if kind == _INDEX_ARRAY:
+        array, offset = _unpack_array(view, offset)
+        if array.dtype.kind == "M":
+            # 汎用の pd.Index より大幅に速い
+            return pd.DatetimeIndex(array, name=name, copy=False), offset
+        return pd.Index(array, name=name, copy=False), offset
+
+    text, offset = _unpack_str(view, offset)
+    return pd.Index(json.loads(text), name=name), offset
+
+
+def _pack_str(text: Optional[str]) -> bytes:
+    if text is None:
+        return _U32.pack(_NONE_LENGTH)
+    encoded = text.encode("utf-8")
+    return _U32.pack(len(encoded)) + encoded
+
+
+def _unpack_str(view: memoryview, offset: int) -> Tuple[Optional[str], int]:
+    (length,) = _U32.unpack_from(view, offset)
+    offset += _U32.size
+    if length == _NONE_LENGTH:
+        return None, offset
+    return str(view[offset : offset + length], "utf-8"), offset + length
+
+
+def _pack_array(array: np.ndarray) -> bytes:
+    array = np.ascontiguousarray(array)
+    return _pack_str(array.dtype.str) + _U32.pack(len(array)) + array.tobytes()
+
+
+def _unpack_array(view: memoryview, offset: int) -> Tuple[np.ndarray, int]:
+    dtype_str, offset = _unpack_str(view, offset)
+    (count,) = _U32.unpack_from(view, offset)
+    offset += _U32.size
+    dtype = np.dtype(dtype_str)
+    end = offset + count * dtype.itemsize
+    return np.frombuffer(view[offset:end], dtype=dtype), end
+
+
+def _to_json_scalar(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
@@ -0,0 +1,231 @@
+"""
+銘柄リスト（ユニバース）のスナップショット
+
+データソースの URL ごとに、パース済みの銘柄テーブルと HTTP の検証子
+（ETag / Last-Modified）をキャッシュと同じ SQLite データベースに保存する。
+次回は条件付き GET を送り、304 なら保存したテーブルをそのまま使う
+（HTML・テキストのパースを省く）。オフライン実行ではネットワークを使わずに
+保存したテーブルを返す。
+
+取得のたびに前回のテーブルも残し、前回の取得からの銘柄の変化
+（追加・削除・シンボル変更）を求められるようにする。変化は一度だけ
+報告され、内容が変わらない・304 の取得では空になる。
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+import pandas as pd
+
+try:
+    from ..domain.models import UniverseDiff, UniverseSnapshot
+    from .cache import CacheManager
+except ImportError:
+    from src.core.data.cache import CacheManager
+    from src.core.domain.models import UniverseDiff, UniverseSnapshot
+
+
+logger = logging.getLogger(__name__)
+
+
+class UniverseCache:
+    """銘柄リストのスナップショット（キャッシュの DB に universe_snapshots テーブルを持つ）"""
+
+    def __init__(self, cache: CacheManager):
+        self.cache = cache
+        self._init_table()
+
+    def _init_table(self):
+        conn = self.cache._connection()
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS universe_snapshots (
+                    url TEXT PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    symbols TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at TEXT NOT NULL,
+                    checked_at TEXT NOT NULL,
+                    previous_symbols TEXT
+                )
+            """
+            )
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(universe_snapshots)")
+            }
+            if "previous_symbols" not in columns:
+                conn.execute(
+                    "ALTER TABLE universe_snapshots ADD COLUMN previous_symbols TEXT"
+                )
+
+    def get(self, url: str) -> Optional[UniverseSnapshot]:
+        """URL のスナップショットを取得（無い・読めなければ None）"""
+        try:
+            conn = self.cache._connection()
+            row = conn.execute(
+                "SELECT url, source, symbols, etag, last_modified, fetched_at, "
+                "checked_at, previous_symbols FROM universe_snapshots WHERE url = ?",
+                (url,),
+            ).fetchone()
+        except Exception as e:
+            logger.warning(f"Universe snapshot read error for {url}: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        (
+            url,
+            source,
+            symbols,
+            etag,
+            last_modified,
+            fetched_at,
+            checked_at,
+            previous,
+        ) = row
+        return UniverseSnapshot(
+            url=url,
+            source=source,
+            table=_decode_table(symbols),
+            fetched_at=datetime.fromisoformat(fetched_at),
+            checked_at=datetime.fromisoformat(checked_at),
+            etag=etag,
+            last_modified=last_modified,
+            previous=_decode_table(previous) if previous else None,
+        )
+
+    def save(
+        self,
+        url: str,
+        source: str,
+        table: pd.DataFrame,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[UniverseSnapshot]:
+        """取得した内容のテーブルと検証子を保存し、保存後のスナップショットを返す
+
+        テーブルは列ごとのリストとして JSON 化する。前回のテーブルは内容が
+        同じでも変わる前のものとして残す（変化は前回の取得から求める）。
+        内容が同じなら取得日時は更新しない。
+        """
+        now = datetime.now()
+        symbols = _encode_table(table)
+        try:
+            conn = self.cache._connection()
+            with conn:
+                row = conn.execute(
+                    "SELECT symbols, fetched_at FROM universe_snapshots WHERE url = ?",
+                    (url,),
+                ).fetchone()
+                if row is None:
+                    previous, fetched_at = None, now.isoformat()
+                else:
+                    previous = row[0]
+                    fetched_at = row[1] if row[0] == symbols else now.isoformat()
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO universe_snapshots "
+                    "(url, source, symbols, etag, last_modified, fetched_at, "
+                    "checked_at, previous_symbols) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        url,
+                        source,
+                        symbols,
+                        etag,
+                        last_modified,
+                        fetched_at,
+                        now.isoformat(),
+                        previous,
+                    ),
+                )
+        except Exception as e:
+            logger.warning(f"Universe snapshot write error for {url}: {e}")
+            return None
+
+        return UniverseSnapshot(
+            url=url,
+            source=source,
+            table=table,
+            fetched_at=datetime.fromisoformat(fetched_at),
+            checked_at=now,
+            etag=etag,
+            last_modified=last_modified,
+            previous=_decode_table(previous) if previous else None,
+        )
+
+    def touch(self, url: str):
+        """更新が無いことを確認した日時を記録（304 のとき、前回からの変化は無くなる）"""
+        try:
+            conn = self.cache._connection()
+            with conn:
+                conn.execute(
+                    "UPDATE universe_snapshots SET checked_at = ?, "
+                    "previous_symbols = symbols WHERE url = ?",
+                    (datetime.now().isoformat(), url),
+                )
+        except Exception as e:
+            logger.warning(f"Universe snapshot update error for {url}: {e}")
+
+
+def snapshot_diff(snapshot: Optional[UniverseSnapshot]) -> Optional[UniverseDiff]:
+    """スナップショットの前回の取得からの変化（前回のテーブルが無ければ None）"""
+    if snapshot is None or snapshot.previous is None:
+        return None
+    return diff_symbol_tables(snapshot.previous, snapshot.table)
+
+
+def diff_symbol_tables(previous: pd.DataFrame, current: pd.DataFrame) -> UniverseDiff:
+    """2つの銘柄テーブルの差分
+
+    消えたシンボルと加わったシンボルで銘柄名と市場が同じものは、シンボルの
+    変更（旧 -> 新）として扱い、追加・削除には含めない。同じ銘柄名・市場の
+    シンボルがどちらかのテーブルに複数ある場合（複数のクラス株・よくある
+    名前）は対応を決められないため、変更とはみなさない。
+    """
+    added = current[~current["symbol"].isin(previous["symbol"])]
+    removed = previous[~previous["symbol"].isin(current["symbol"])]
+
+    keys = ["key"]
+    if "market" in previous and "market" in current:
+        keys.append("market")
+    previous_keys = _unique_keys(previous, keys)
+    current_keys = _unique_keys(current, keys)
+    pairs = pd.merge(
+        previous_keys[previous_keys["symbol"].isin(removed["symbol"])],
+        current_keys[current_keys["symbol"].isin(added["symbol"])],
+        on=keys,
+        suffixes=("_old", "_new"),
+    )
+    renamed = dict(zip(pairs["symbol_old"], pairs["symbol_new"]))
+
+    new_symbols = set(renamed.values())
+    return UniverseDiff(
+        added=[s for s in added["symbol"] if s not in new_symbols],
+        removed=[s for s in removed["symbol"] if s not in renamed],
+        renamed=renamed,
+    )
+
+
+def _unique_keys(table: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """銘柄名（と市場）がテーブル内で一意のシンボルとその比較用キー"""
+    frame = table.assign(key=_name_key(table["name"]))[["symbol"] + keys]
+    frame = frame[frame["key"] != ""]
+    return frame.drop_duplicates(keys, keep=False)
+
+
+def _name_key(names: pd.Series) -> pd.Series:
+    """銘柄名の比較用キー"""
+    return names.astype("string").fillna("").str.strip().str.casefold()
+
+
+def _encode_table(table: pd.DataFrame) -> str:
+    return json.dumps(table.to_dict(orient="list"), ensure_ascii=False)
+
+
+def _decode_table(data: str) -> pd.DataFrame:
+    return pd.DataFrame(json.loads(data))
@@ -3,78 +3,254 @@ Yahoo Finance データ取得クライアント
 """
 
 import logging
+import threading
+from dataclasses import replace
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 import pandas as pd
 import yfinance as yf
 
 try:
-    from ..domain.models import DataFetchError, FinancialData
+    from ..domain.cancellation import CancellationToken
+    from ..domain.models import (
+        DataFetchError,
+        DataPart,
+        DataQuality,
+        DataRequirements,
+        FinancialData,
+        ScreeningCancelledError,
+    )
+    from .http_session import get_shared_session
 except ImportError:
-    from src.core.domain.models import DataFetchError, FinancialData
+    from src.core.data.http_session import get_shared_session
+    from src.core.domain.cancellation import CancellationToken
+    from src.core.domain.models import (
+        DataFetchError,
+        DataPart,
+        DataQuality,
+        DataRequirements,
+        FinancialData,
+        ScreeningCancelledError,
+    )
 
 
 logger = logging.getLogger(__name__)
 
 
+# 減価償却費の行名（yfinance のバージョンにより異なる）
+_DEPRECIATION_ROWS = (
+    "Depreciation And Amortization",
+    "Depreciation Amortization Depletion",
+    "Depreciation & Amortization",
+)
+
+# 構成要素 -> (Ticker の属性, {FinancialData のフィールド: 行名の候補})
+_STATEMENTS = {
+    DataPart.INCOME_ANNUAL: (
+        "income_stmt",
+        {
+            "revenue_annual": ("Total Revenue",),
+            "operating_income_annual": ("Operating Income",),
+        },
+    ),
+    DataPart.INCOME_TTM: (
+        "ttm_income_stmt",
+        {
+            "revenue_ttm": ("Total Revenue",),
+            "operating_income_ttm": ("Operating Income",),
+        },
+    ),
+    DataPart.CASHFLOW_ANNUAL: ("cashflow", {"depreciation_annual": _DEPRECIATION_ROWS}),
+    DataPart.CASHFLOW_TTM: ("ttm_cashflow", {"depreciation_ttm": _DEPRECIATION_ROWS}),
+}
+
+
+# 次回の決算発表予定日の候補（UNIX 秒。Start/End は発表予定期間）
+_EARNINGS_KEYS = (
+    "earningsTimestamp",
+    "earningsTimestampStart",
+    "earningsTimestampEnd",
+)
+
+
+def _timestamp(value: Any) -> Optional[datetime]:
+    """info の UNIX 秒を datetime に変換（不正な値は None）"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        return None
+    try:
+        return datetime.fromtimestamp(value)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def earnings_calendar(
+    info: Optional[Dict[str, Any]],
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """info から (直近の決算期末, 次回の決算発表予定日) を取得
+
+    発表予定日は候補のうち最も早い将来の日時（発表済みの日時は含めない）。
+    """
+    if not info:
+        return None, None
+
+    period_end = _timestamp(info.get("mostRecentQuarter"))
+    now = datetime.now()
+    upcoming = [
+        timestamp
+        for timestamp in (_timestamp(info.get(key)) for key in _EARNINGS_KEYS)
+        if timestamp is not None and timestamp > now
+    ]
+    return period_end, min(upcoming) if upcoming else None
+
+
+def apply_info(data: FinancialData, info: Dict[str, Any]) -> FinancialData:
+    """info と決算カレンダーを反映した FinancialData を返す
+
+    info の決算期末が保持している財務諸表の決算期末より新しければ（決算発表
+    済み）、財務諸表の構成要素を不足扱いにして取得し直させる。
+    """
+    period_end, next_earnings = earnings_calendar(info)
+    parts = data.held_parts() | {DataPart.INFO}
+    if period_end and data.period_end and period_end > data.period_end:
+        logger.debug(f"New fiscal period for {data.symbol}; statements are outdated")
+        parts = frozenset({DataPart.INFO})
+
+    return replace(
+        data,
+        info=info,
+        parts=parts,
+        period_end=period_end or data.period_end,
+        next_earnings=next_earnings,
+    )
+
+
+def _select_row(
+    statement: Optional[pd.DataFrame], row_names: Sequence[str]
+) -> Optional[pd.Series]:
+    """財務諸表から最初に見つかった行を取得"""
+    if statement is None:
+        return None
+    for name in row_names:
+        if name in statement.index:
+            return statement.loc[name]
+    return None
+
+
 class YFClient:
-    """Yahoo Finance データ取得クライアント"""
+    """Yahoo Finance データ取得クライアント
 
-    def __init__(self, timeout: int = 30):
-        self.timeout = timeout
+    すべてのワーカーが1つの keep-alive セッション（既定はプロセス共有の
+    PooledSession）を使い、実行をまたいで接続・Cookie を再利用する。
+    yf.Ticker は実行中は銘柄ごとに使い回し（info の取得後に財務諸表を取得する
+    場合など）、clear_tickers() で破棄する。
+    """
 
-    def get_financial_data(self, symbol: str) -> FinancialData:
-        """財務データを取得"""
+    def __init__(self, timeout: int = 30, session=None):
+        self.timeout = timeout
+        self.session = session if session is not None else get_shared_session()
+
+        self._tickers: Dict[str, yf.Ticker] = {}
+        self._tickers_lock = threading.Lock()
+        self.tickers_created = 0
+        self.tickers_reused = 0
+
+    def _ticker(self, symbol: str) -> yf.Ticker:
+        """銘柄の Ticker を取得（実行中は使い回す）"""
+        with self._tickers_lock:
+            ticker = self._tickers.get(symbol)
+            if ticker is not None:
+                self.tickers_reused += 1
+                return ticker
+
+            if self.session is not None:
+                ticker = yf.Ticker(symbol, session=self.session)
+            else:
+                ticker = yf.Ticker(symbol)
+            self._tickers[symbol] = ticker
+            self.tickers_created += 1
+            return ticker
+
+    def release_ticker(self, symbol: str):
+        """銘柄の Ticker を破棄（その銘柄の取得が完了したとき）"""
+        with self._tickers_lock:
+            self._tickers.pop(symbol, None)
+
+    def clear_tickers(self):
+        """すべての Ticker を破棄（実行の終了時）"""
+        with self._tickers_lock:
+            self._tickers.clear()
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """HTTP 接続プールと Ticker の使い回しの統計情報を取得"""
+        stats: Dict[str, Any] = {}
+        if hasattr(self.session, "get_stats"):
+            stats.update(self.session.get_stats())
+        with self._tickers_lock:
+            stats.update(
+                {
+                    "tickers_created": self.tickers_created,
+                    "tickers_reused": self.tickers_reused,
+                    "tickers_alive": len(self._tickers),
+                }
+            )
+        return stats
+
+    def get_financial_data(
+        self,
+        symbol: str,
+        info: Optional[Dict[str, Any]] = None,
+        requirements: Optional[DataRequirements] = None,
+        base: Optional[FinancialData] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> FinancialData:
+        """財務データを取得
+
+        requirements に含まれる構成要素のうち、base（キャッシュ済みの部分データ）
+        に無いものだけを取得して補う。info を渡した場合は info の取得を省略する。
+        requirements を省略した場合はすべての構成要素を取得する。
+        cancel_token が停止されると、次の構成要素を取得する前に
+        ScreeningCancelledError を送出する。
+        """
         try:
             logger.debug(f"Fetching financial data for {symbol}")
 
-            ticker = yf.Ticker(symbol)
-
-            # Info データ取得
-            info = ticker.info or {}
+            if requirements is None:
+                requirements = DataRequirements()
 
-            # 財務諸表取得
-            income_stmt = ticker.income_stmt
-            ttm_income_stmt = ticker.ttm_income_stmt
-            cashflow = ticker.cashflow
-
-            financial_data = FinancialData(
-                symbol=symbol,
-                revenue_annual=(
-                    income_stmt.loc["Total Revenue"]
-                    if income_stmt is not None and "Total Revenue" in income_stmt.index
-                    else None
-                ),
-                revenue_ttm=(
-                    ttm_income_stmt.loc["Total Revenue"]
-                    if ttm_income_stmt is not None and "Total Revenue" in ttm_income_stmt.index
-                    else None
-                ),
-                operating_income_annual=(
-                    income_stmt.loc["Operating Income"]
-                    if income_stmt is not None and "Operating Income" in income_stmt.index
-                    else None
-                ),
-                operating_income_ttm=(
-                    ttm_income_stmt.loc["Operating Income"]
-                    if ttm_income_stmt is not None and "Operating Income" in ttm_income_stmt.index
-                    else None
-                ),
-                depreciation_annual=(
-                    cashflow.loc["Depreciation & Amortization"]
-                    if cashflow is not None and "Depreciation & Amortization" in cashflow.index
-                    else None
-                ),
-                info=info,
-                last_updated=datetime.now(),
-            )
+            if base is None:
+                financial_data = FinancialData(symbol=symbol, parts=frozenset())
+            else:
+                financial_data = replace(base, parts=base.held_parts())
+            if info is not None:
+                financial_data = apply_info(financial_data, info)
+
+            ticker = self._ticker(symbol)
+
+            # Info データ取得（TTM 損益計算書の要否は info の内容で決まるため先に取得）
+            if DataPart.INFO in requirements.missing(financial_data):
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                financial_data = apply_info(financial_data, ticker.info or {})
+
+            # 財務諸表取得（不足している構成要素のみ、必要な行だけを取り出す）
+            for part in requirements.missing(financial_data):
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                attribute, rows = _STATEMENTS[part]
+                statement = getattr(ticker, attribute)
+                for field_name, row_names in rows.items():
+                    setattr(financial_data, field_name, _select_row(statement, row_names))
+                financial_data.parts |= {part}
+
+            financial_data.last_updated = datetime.now()
 
             # データ品質を評価
             financial_data.data_quality = self._evaluate_data_quality(financial_data)
 
             # デバッグ：取得したデータの内容をログ出力
             logger.debug(f"Data for {symbol}:")
+            logger.debug(f"  Parts: {sorted(p.value for p in financial_data.parts)}")
             logger.debug(f"  Revenue TTM: {financial_data.revenue_ttm}")
             logger.debug(f"  Operating Income TTM: {financial_data.operating_income_ttm}")
             logger.debug(f"  Revenue Annual: {financial_data.revenue_annual}")
@@ -88,16 +264,38 @@ class YFClient:
             )
             return financial_data
 
+        except ScreeningCancelledError:
+            raise
+
         except Exception as e:
             logger.error(f"Failed to fetch data for {symbol}: {e}")
             raise DataFetchError(f"Failed to fetch data for {symbol}: {e}")
 
+        finally:
+            self.release_ticker(symbol)
+
+    def get_info(self, symbol: str) -> Dict[str, Any]:
+        """info（気配値・主要指標）のみを取得
+
+        Ticker は続けて get_financial_data で使うために残す。財務諸表を
+        取得しないと決まった銘柄は release_ticker() で破棄する。
+        """
+        try:
+            logger.debug(f"Fetching info for {symbol}")
+            return self._ticker(symbol).info or {}
+
+        except Exception as e:
+            # 失敗した銘柄は財務諸表を取得しないため Ticker を残さない
+            self.release_ticker(symbol)
+            logger.warning(f"Failed to fetch info for {symbol}: {e}")
+            raise DataFetchError(f"Failed to fetch info for {symbol}: {e}")
+
     def get_info_margins_growth(
         self, symbol: str
     ) -> Tuple[Optional[float], Optional[float]]:
         """info から成長率とマージンを取得"""
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = self._ticker(symbol)
             info = ticker.info or {}
 
             revenue_growth = info.get("revenueGrowth")
@@ -114,7 +312,7 @@ class YFClient:
     ) -> Optional[pd.DataFrame]:
         """損益計算書を取得"""
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = self._ticker(symbol)
 
             if ttm:
                 return ticker.ttm_income_stmt
@@ -128,7 +326,7 @@ class YFClient:
     def get_cash_flow(self, symbol: str, ttm: bool = False) -> Optional[pd.DataFrame]:
         """キャッシュフロー計算書を取得"""
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = self._ticker(symbol)
 
             if ttm:
                 return ticker.ttm_cashflow
@@ -139,10 +337,8 @@ class YFClient:
             logger.warning(f"Failed to get cash flow for {symbol}: {e}")
             return None
 
-    def _evaluate_data_quality(self, data: FinancialData) -> str:
+    def _evaluate_data_quality(self, data: FinancialData) -> DataQuality:
         """データ品質を評価"""
-        from src.core.domain.models import DataQuality
-
         # 必須データのチェック
         has_revenue = (
             data.revenue_annual is not None and len(data.revenue_annual) > 0
@@ -158,8 +354,8 @@ class YFClient:
         has_info = data.info is not None and len(data.info) > 0
 
         if has_revenue and has_operating_income and has_info:
-            return DataQuality.COMPLETE.value
+            return DataQuality.COMPLETE
         elif has_revenue or has_operating_income:
-            return DataQuality.PARTIAL.value
+            return DataQuality.PARTIAL
         else:
-            return DataQuality.MISSING.value
+            return DataQuality.MISSING
@@ -0,0 +1,77 @@
+"""
+協調的キャンセル（スクリーニングの停止）
+"""
+
+import logging
+import threading
+from typing import Callable, List, Optional
+
+try:
+    from .models import ScreeningCancelledError
+except ImportError:
+    from src.core.domain.models import ScreeningCancelledError
+
+logger = logging.getLogger(__name__)
+
+
+class CancellationToken:
+    """スクリーニングの停止を伝えるトークン（スレッドセーフ）
+
+    停止する側は cancel() を呼ぶだけで、処理する側は区切りごとに
+    raise_if_cancelled() で確認し、待機には sleep() を使う（停止すると
+    待機中でも直ちに戻る）。待機をトークン以外で行う処理（エグゼキュータの
+    完了待ちなど）は add_callback() で停止の通知を受ける。
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        """停止を要求（2回目以降は何もしない）"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Cancellation callback failed: {e}")
+
+    def raise_if_cancelled(self):
+        """停止が要求されていれば ScreeningCancelledError を送出"""
+        if self._event.is_set():
+            raise ScreeningCancelledError("Screening was cancelled")
+
+    def sleep(self, seconds: float):
+        """最大 seconds 秒待機（停止が要求されると直ちに ScreeningCancelledError）"""
+        if seconds > 0:
+            self._event.wait(seconds)
+        self.raise_if_cancelled()
+
+    def add_callback(self, callback: Callable[[], None]):
+        """停止時に呼ぶ関数を登録（停止済みなら直ちに呼ぶ）"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]):
+        """add_callback で登録した関数を解除"""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+def ensure_token(token: Optional[CancellationToken]) -> CancellationToken:
+    """None なら停止されないトークンを返す"""
+    return token if token is not None else CancellationToken()
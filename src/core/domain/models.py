@@ -2,10 +2,10 @@
 Domain models for financial data and screening results
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
 import pandas as pd
 
@@ -32,6 +32,7 @@ class DataQuality(Enum):
     COMPLETE = "complete"  # 完全
     PARTIAL = "partial"  # 部分的
     MISSING = "missing"  # 欠損
+    STALE = "stale"  # 期限切れのキャッシュから算出（バックグラウンドで更新する）
 
 
 class Market(Enum):
@@ -63,6 +64,20 @@ class Symbol:
             self.market = Market(self.market)
 
 
+class DataPart(Enum):
+    """FinancialData の取得単位（yfinance の1リクエストに対応）"""
+
+    INFO = "info"  # ticker.info
+    INCOME_ANNUAL = "income_annual"  # 年次損益計算書（売上・営業利益）
+    INCOME_TTM = "income_ttm"  # TTM 損益計算書（売上・営業利益）
+    CASHFLOW_ANNUAL = "cashflow_annual"  # 年次キャッシュフロー（減価償却費）
+    CASHFLOW_TTM = "cashflow_ttm"  # TTM キャッシュフロー（減価償却費）
+
+
+# TTM でこれらが info にあれば、営業利益版の成長率・マージンは財務諸表より info が優先される
+TTM_INFO_KEYS = ("revenueGrowth", "operatingMargins")
+
+
 @dataclass
 class FinancialData:
     """財務データ"""
@@ -91,10 +106,46 @@ class FinancialData:
     last_updated: Optional[datetime] = None
     data_quality: DataQuality = DataQuality.MISSING
 
+    # 取得済みの構成要素（None は不明 = すべて保持しているとみなす）
+    parts: Optional[FrozenSet[DataPart]] = None
+
+    # 決算カレンダー（財務諸表の取得時点の info から）
+    period_end: Optional[datetime] = None  # 財務諸表の直近の決算期末
+    next_earnings: Optional[datetime] = None  # 次回の決算発表予定日
+
     def __post_init__(self):
         if self.last_updated is None:
             self.last_updated = datetime.now()
 
+    def held_parts(self) -> FrozenSet[DataPart]:
+        """保持している構成要素"""
+        return frozenset(DataPart) if self.parts is None else self.parts
+
+
+@dataclass(frozen=True)
+class DataRequirements:
+    """計算に必要な FinancialData の構成要素（期間・バリアントから決まる）"""
+
+    parts: FrozenSet[DataPart] = frozenset(DataPart)
+
+    # info に TTM_INFO_KEYS が揃っていれば TTM 損益計算書は不要（営業利益版 TTM）
+    info_replaces_income_ttm: bool = False
+
+    def missing(self, data: Optional[FinancialData]) -> FrozenSet[DataPart]:
+        """data に不足している構成要素（data が None ならすべて）"""
+        if data is None:
+            return self.parts
+
+        missing = self.parts - data.held_parts()
+        if (
+            DataPart.INCOME_TTM in missing
+            and self.info_replaces_income_ttm
+            and data.info
+            and all(key in data.info for key in TTM_INFO_KEYS)
+        ):
+            missing -= {DataPart.INCOME_TTM}
+        return missing
+
 
 @dataclass
 class Rule40Result:
@@ -222,13 +273,198 @@ class ScreeningConfig:
 
     # データ取得設定
     max_workers: int = 12
-    cache_ttl_hours: int = 24
+    cache_ttl_hours: int = 24  # info（時価総額などの気配値・企業プロフィール）
+    annual_statement_ttl_hours: int = 720  # 年次財務諸表
+    ttm_statement_ttl_hours: int = 168  # TTM 財務諸表（四半期決算ごとに変わる）
     force_refresh: bool = False
+    fetch_backend: str = "thread"  # thread | async
+    streaming: bool = True  # 取得完了ごとに計算・フィルタリング
+    prefilter: bool = True  # info で落ちる銘柄は財務諸表を取得しない
+    failure_ttl_hours: int = 6  # 取得に失敗した銘柄を再取得しない時間（連続失敗で倍増）
+    retry_failures: bool = False  # 失敗の記録を消して再取得する
+    stale_grace_hours: int = 0  # 期限切れ後この時間内のキャッシュは即座に返し、後で更新する（0 で無効）
+    offline: bool = False  # 銘柄リストはネットワークを使わず、保存した前回の取得結果を使う
+    delta: bool = False  # 既存の銘柄は期限を問わずキャッシュを使い、新たに加わった銘柄だけを取得する
 
     # 最小条件
     min_revenue: Optional[float] = None
     margin_positive_only: bool = False
 
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 化できる辞書に変換（実行の記録用）"""
+        data = asdict(self)
+        data["variant"] = self.variant.value
+        data["period"] = self.period.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScreeningConfig":
+        """to_dict の結果から復元（未知のキーは無視）"""
+        names = {f.name for f in fields(cls)}
+        values = {key: value for key, value in data.items() if key in names}
+        if "variant" in values:
+            values["variant"] = Rule40Variant(values["variant"])
+        if "period" in values:
+            values["period"] = CalculationPeriod(values["period"])
+        values["filters"] = [Filter(**f) for f in values.get("filters") or []]
+        if values.get("sort_config"):
+            values["sort_config"] = SortConfig(**values["sort_config"])
+        return cls(**values)
+
+
+@dataclass
+class ScreeningSummary:
+    """スクリーニング実行の集計"""
+
+    run_id: Optional[str] = None  # 実行の記録（ジャーナル）の ID
+    started_at: Optional[datetime] = None
+    elapsed_seconds: float = 0.0
+    symbols: int = 0  # 対象銘柄数
+    cache_hits: int = 0  # キャッシュから読み込んだ銘柄数
+    fetched: int = 0  # ネットワークから取得できた銘柄数
+    fetch_failed: int = 0  # 取得に失敗した銘柄数
+    topped_up: int = 0  # キャッシュの不足分のみを取得した銘柄数
+    pruned: int = 0  # info だけでフィルター落ちが確定し、財務諸表を省いた銘柄数
+    skipped_failures: int = 0  # 直近に取得に失敗しており、取得を省いた銘柄数
+    resumed: int = 0  # 中断した実行の再開で、処理済みとして扱った銘柄数
+    stale_served: int = 0  # 期限切れのキャッシュを返し、再検証待ちにした銘柄数
+    revalidated: int = 0  # 再検証で取得し直した銘柄数
+    calculated: int = 0  # Rule of 40 を計算できた銘柄数
+    passed: int = 0  # フィルターを通過した銘柄数
+    rate_limiter: Dict[str, Any] = field(default_factory=dict)
+    http_pool: Dict[str, Any] = field(default_factory=dict)  # 接続・Ticker の再利用
+    source_errors: Dict[str, str] = field(default_factory=dict)  # 取得に失敗したデータソース
+    universe_diff: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # データソースごとの銘柄リストの変化
+    delta_reused: int = 0  # delta モードで、期限切れのキャッシュを取得し直さずに返した既存の銘柄数
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 化できる辞書に変換"""
+        data = dict(self.__dict__)
+        data["started_at"] = self.started_at.isoformat() if self.started_at else None
+        data["rate_limiter"] = dict(self.rate_limiter)
+        data["http_pool"] = dict(self.http_pool)
+        data["source_errors"] = dict(self.source_errors)
+        data["universe_diff"] = dict(self.universe_diff)
+        return data
+
+
+@dataclass
+class FetchFailure:
+    """取得に失敗した銘柄の記録（ネガティブキャッシュ）"""
+
+    symbol: str
+    reason: str
+    failures: int  # 連続失敗回数
+    failed_at: datetime
+    retry_after: datetime  # これより前は取得しない
+
+    def is_active(self) -> bool:
+        """再取得を控える期間中か"""
+        return datetime.now() < self.retry_after
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 化できる辞書に変換"""
+        return {
+            "symbol": self.symbol,
+            "reason": self.reason,
+            "failures": self.failures,
+            "failed_at": self.failed_at.isoformat(),
+            "retry_after": self.retry_after.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FetchFailure":
+        """to_dict の結果から復元"""
+        return cls(
+            symbol=data["symbol"],
+            reason=data.get("reason", ""),
+            failures=int(data.get("failures", 1)),
+            failed_at=datetime.fromisoformat(data["failed_at"]),
+            retry_after=datetime.fromisoformat(data["retry_after"]),
+        )
+
+
+class RunStatus(Enum):
+    """スクリーニング実行の状態"""
+
+    RUNNING = "running"  # 実行中（異常終了した場合もこのまま残る）
+    COMPLETED = "completed"  # 完了
+    INTERRUPTED = "interrupted"  # 停止・エラーで中断
+
+
+class JournalStatus(Enum):
+    """実行の記録における銘柄の状態"""
+
+    PENDING = "pending"  # 未処理（処理中を含む）
+    DONE = "done"  # 処理済み
+    FAILED = "failed"  # 取得に失敗
+
+
+@dataclass
+class ScreeningRun:
+    """スクリーニング実行の記録（ジャーナル）"""
+
+    run_id: str
+    config: ScreeningConfig
+    status: RunStatus
+    created_at: datetime
+    updated_at: datetime
+    counts: Dict[JournalStatus, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def remaining(self) -> int:
+        """再開時に処理する銘柄数（未処理と失敗）"""
+        return self.counts.get(JournalStatus.PENDING, 0) + self.counts.get(
+            JournalStatus.FAILED, 0
+        )
+
+    @property
+    def resumable(self) -> bool:
+        return self.status != RunStatus.COMPLETED and self.remaining > 0
+
+
+@dataclass
+class UniverseSnapshot:
+    """データソースの銘柄リストの保存（条件付き GET・オフライン実行用）"""
+
+    url: str
+    source: str  # データソース名
+    table: pd.DataFrame  # 正規化済みの銘柄テーブル
+    fetched_at: datetime  # 内容を取得した日時
+    checked_at: datetime  # 最後に更新の有無を確認した日時
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    previous: Optional[pd.DataFrame] = None  # 前回の取得での銘柄テーブル
+
+
+@dataclass
+class UniverseDiff:
+    """銘柄リストの前回の取得からの変化"""
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    renamed: Dict[str, str] = field(default_factory=dict)  # 旧シンボル -> 新シンボル
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed or self.renamed)
+
+    @property
+    def new_symbols(self) -> List[str]:
+        """新たに加わったシンボル（新規上場・採用と、シンボル変更後のもの）"""
+        return self.added + list(self.renamed.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "added": list(self.added),
+            "removed": list(self.removed),
+            "renamed": dict(self.renamed),
+        }
+
 
 @dataclass
 class CacheEntry:
@@ -302,3 +538,9 @@ class ExportError(Rule40ScreenerError):
     """エクスポートエラー"""
 
     pass
+
+
+class ScreeningCancelledError(Rule40ScreenerError):
+    """スクリーニングの中断（CancellationToken による停止）"""
+
+    pass
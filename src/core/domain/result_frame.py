@@ -0,0 +1,251 @@
+"""
+Rule40Result の列指向コンテナ
+"""
+
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .models import Filter, Rule40Result, Rule40Variant
+except ImportError:
+    from src.core.domain.models import Filter, Rule40Result, Rule40Variant
+
+
+# float64 で保持する列（None は欠損マスクで区別し、NaN は値として扱う）
+NUMERIC_COLUMNS = (
+    "r40_op",
+    "r40_ebitda",
+    "revenue_growth_yoy",
+    "operating_margin",
+    "ebitda_margin",
+    "market_cap",
+)
+
+# 文字列として保持する列
+TEXT_COLUMNS = ("symbol", "name", "sector", "industry")
+
+
+class ResultFrame:
+    """スクリーニング結果の列指向コンテナ
+
+    Rule40Result のフィールドごとに NumPy 配列を持ち、フィルターは真偽値マスク、
+    ソートは argsort で行う。元の Rule40Result への参照も保持するため、
+    行オブジェクトを作り直さずにリストと同様に反復・添字アクセスできる。
+    """
+
+    def __init__(self, results: Sequence[Rule40Result] = ()):
+        rows = list(results)
+        self._rows = np.empty(len(rows), dtype=object)
+        self._rows[:] = rows
+
+        self._values: Dict[str, np.ndarray] = {}
+        self._missing: Dict[str, np.ndarray] = {}
+        for name in NUMERIC_COLUMNS:
+            raw = [getattr(r, name) for r in rows]
+            missing = np.fromiter((v is None for v in raw), dtype=bool, count=len(raw))
+            self._missing[name] = missing
+            self._values[name] = np.array(
+                [np.nan if v is None else v for v in raw], dtype=np.float64
+            )
+
+        self._text: Dict[str, np.ndarray] = {}
+        for name in TEXT_COLUMNS:
+            column = np.empty(len(rows), dtype=object)
+            column[:] = [getattr(r, name) for r in rows]
+            self._text[name] = column
+
+    @classmethod
+    def from_results(
+        cls, results: Union["ResultFrame", Sequence[Rule40Result]]
+    ) -> "ResultFrame":
+        """リストなどから作成（ResultFrame はそのまま返す）"""
+        if isinstance(results, ResultFrame):
+            return results
+        return cls(results)
+
+    # --- シーケンスとしての振る舞い ---
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[Rule40Result]:
+        return iter(self._rows.tolist())
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.take(np.arange(len(self))[key])
+        return self._rows[key]
+
+    def __repr__(self) -> str:
+        return f"ResultFrame({len(self)} results)"
+
+    def to_list(self) -> List[Rule40Result]:
+        """Rule40Result のリストを取得"""
+        return self._rows.tolist()
+
+    # --- 列アクセス ---
+
+    def column(self, name: str) -> Optional[np.ndarray]:
+        """列の配列を取得（数値列の None は NaN、未知の列は None）"""
+        if name in self._values:
+            return self._values[name]
+        return self._text.get(name)
+
+    def missing(self, name: str) -> np.ndarray:
+        """値が None の位置（未知の列はすべて True）"""
+        if name in self._missing:
+            return self._missing[name]
+        if name in self._text:
+            return np.fromiter(
+                (v is None for v in self._text[name]), dtype=bool, count=len(self)
+            )
+        return np.ones(len(self), dtype=bool)
+
+    def r40_values(self, variant: Rule40Variant) -> Tuple[np.ndarray, np.ndarray]:
+        """Rule40Result.get_r40_value 相当の (値, 欠損マスク)"""
+        if variant == Rule40Variant.OP:
+            return self._values["r40_op"], self._missing["r40_op"]
+        if variant == Rule40Variant.EBITDA:
+            return self._values["r40_ebitda"], self._missing["r40_ebitda"]
+        if variant == Rule40Variant.BOTH:
+            use_op = ~self._missing["r40_op"]
+            values = np.where(use_op, self._values["r40_op"], self._values["r40_ebitda"])
+            missing = self._missing["r40_op"] & self._missing["r40_ebitda"]
+            return values, missing
+        return np.full(len(self), np.nan), np.ones(len(self), dtype=bool)
+
+    # --- フィルター ---
+
+    def threshold_mask(self, threshold: float, variant: Rule40Variant) -> np.ndarray:
+        """Rule40Result.meets_threshold 相当のマスク"""
+        values, missing = self.r40_values(variant)
+        return ~missing & (values >= threshold)
+
+    def positive_mask(self, name: str) -> np.ndarray:
+        """値があり正（`value and value > 0` 相当）のマスク"""
+        return ~self.missing(name) & (self.column(name) > 0)
+
+    def filter_mask(self, filter_obj: Filter) -> np.ndarray:
+        """Filter.apply 相当のマスク"""
+        name, operator, value = filter_obj.field, filter_obj.operator, filter_obj.value
+
+        if name in self._values and operator != "contains":
+            column = self._values[name]
+            comparisons = {
+                "gt": np.greater,
+                "gte": np.greater_equal,
+                "lt": np.less,
+                "lte": np.less_equal,
+                "eq": np.equal,
+                "neq": np.not_equal,
+            }
+            compare = comparisons.get(operator)
+            if compare is None:
+                return np.zeros(len(self), dtype=bool)
+            return ~self._missing[name] & compare(column, value)
+
+        # 文字列列・contains は行ごとの判定（Filter.apply と同じ規則）
+        return np.fromiter(
+            (filter_obj.apply(r) for r in self._rows), dtype=bool, count=len(self)
+        )
+
+    def contains_mask(self, text: str, columns: Sequence[str]) -> np.ndarray:
+        """いずれかの文字列列に text を含む（大文字小文字を区別しない）"""
+        mask = np.zeros(len(self), dtype=bool)
+        needle = text.lower()
+        for name in columns:
+            values = pd.Series(self._text[name], dtype=object).fillna("")
+            mask |= values.str.lower().str.contains(needle, regex=False).to_numpy(
+                dtype=bool
+            )
+        return mask
+
+    def take(self, indexer: np.ndarray) -> "ResultFrame":
+        """マスクまたは位置配列で行を抽出した新しいフレーム"""
+        frame = ResultFrame.__new__(ResultFrame)
+        frame._rows = self._rows[indexer]
+        frame._values = {k: v[indexer] for k, v in self._values.items()}
+        frame._missing = {k: v[indexer] for k, v in self._missing.items()}
+        frame._text = {k: v[indexer] for k, v in self._text.items()}
+        return frame
+
+    def extended(self, results: Sequence[Rule40Result]) -> "ResultFrame":
+        """末尾に結果を追加した新しいフレーム（既存の列は再構築しない）"""
+        addition = ResultFrame.from_results(results)
+        if not len(addition):
+            return self
+        if not len(self):
+            return addition
+
+        frame = ResultFrame.__new__(ResultFrame)
+        frame._rows = np.concatenate([self._rows, addition._rows])
+        frame._values = {
+            k: np.concatenate([v, addition._values[k]]) for k, v in self._values.items()
+        }
+        frame._missing = {
+            k: np.concatenate([v, addition._missing[k]])
+            for k, v in self._missing.items()
+        }
+        frame._text = {
+            k: np.concatenate([v, addition._text[k]]) for k, v in self._text.items()
+        }
+        return frame
+
+    # --- ソート ---
+
+    def sort_indices(
+        self,
+        name: Optional[str] = None,
+        ascending: bool = False,
+        keys: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """安定ソートの並び順（sorted(..., reverse=not ascending) と同順）
+
+        数値列の None は昇順・降順とも末尾になるよう ±inf として扱う。
+        """
+        if keys is None:
+            if name in self._values:
+                fill = np.inf if ascending else -np.inf
+                keys = np.where(self._missing[name], fill, self._values[name])
+            elif name in self._text:
+                keys = self.text_keys(name)
+            else:
+                return np.arange(len(self))
+
+        if ascending:
+            return np.argsort(keys, kind="stable")
+
+        # 降順でも同値の行は元の順序を保つ
+        reversed_order = np.argsort(keys[::-1], kind="stable")[::-1]
+        return len(keys) - 1 - reversed_order
+
+    def text_keys(self, name: str) -> np.ndarray:
+        """文字列列のソートキー（None は空文字列として扱う）"""
+        return np.where(self.missing(name), "", self._text[name])
+
+    def sort_by(self, name: str, ascending: bool = False) -> "ResultFrame":
+        """列でソートした新しいフレーム"""
+        return self.take(self.sort_indices(name, ascending))
+
+    # --- 変換 ---
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """列をそのまま DataFrame 化（数値列の None は NaN）"""
+        data = {name: self._text[name] for name in TEXT_COLUMNS}
+        data.update(self._values)
+        data["data_quality"] = [r.data_quality.value for r in self._rows]
+        data["period"] = [r.period.value for r in self._rows]
+        data["variant"] = [r.variant.value for r in self._rows]
+        data["calculation_time"] = [r.calculation_time for r in self._rows]
+        return pd.DataFrame(data)
+
+    def optional_column(self, name: str) -> List[Optional[float]]:
+        """数値列を None 入りのリストとして取得"""
+        return [
+            None if missing else value
+            for value, missing in zip(
+                self._values[name].tolist(), self._missing[name].tolist()
+            )
+        ]
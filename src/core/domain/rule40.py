@@ -4,22 +4,31 @@ Rule of 40 計算エンジン
 
 import logging
 from datetime import datetime
-from typing import Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
 
 try:
     from .models import (
+        TTM_INFO_KEYS,
         CalculationError,
         CalculationPeriod,
+        DataPart,
         DataQuality,
+        DataRequirements,
         FinancialData,
         Rule40Result,
         Rule40Variant,
     )
 except ImportError:
     from src.core.domain.models import (
+        TTM_INFO_KEYS,
         CalculationError,
         CalculationPeriod,
+        DataPart,
         DataQuality,
+        DataRequirements,
         FinancialData,
         Rule40Result,
         Rule40Variant,
@@ -37,6 +46,60 @@ class Rule40Strategy(Protocol):
     ) -> Optional[float]: ...
 
 
+def _revenue_growth(
+    data: FinancialData, period: CalculationPeriod
+) -> Optional[float]:
+    """売上成長率を計算（OP版・EBITDA版で共通）"""
+    try:
+        if period == CalculationPeriod.TTM:
+            # infoから成長率を取得
+            if data.info and "revenueGrowth" in data.info:
+                return data.info["revenueGrowth"]
+
+            # TTMデータから計算
+            if (
+                data.revenue_ttm is not None
+                and hasattr(data.revenue_ttm, 'iloc')
+                and len(data.revenue_ttm) > 1
+            ):
+                current = data.revenue_ttm.iloc[0]
+                previous = data.revenue_ttm.iloc[1]
+                if previous != 0:
+                    return (current / previous) - 1
+
+        elif period == CalculationPeriod.ANNUAL:
+            # 年次データから計算
+            if (
+                data.revenue_annual is not None
+                and hasattr(data.revenue_annual, 'iloc')
+                and len(data.revenue_annual) > 1
+            ):
+                current = data.revenue_annual.iloc[0]
+                previous = data.revenue_annual.iloc[1]
+                if previous != 0:
+                    return (current / previous) - 1
+
+        return None
+
+    except Exception as e:
+        logger.warning(f"Error calculating revenue growth: {e}")
+        return None
+
+
+def _combine(
+    revenue_growth: Optional[float], margin: Optional[float]
+) -> Optional[float]:
+    """Rule of 40 = 売上成長率(%) + マージン(%)"""
+    if revenue_growth is None or margin is None:
+        return None
+
+    try:
+        return revenue_growth * 100 + margin * 100
+    except Exception as e:
+        logger.warning(f"Error combining Rule of 40 components: {e}")
+        return None
+
+
 class OPStrategy:
     """営業利益版 Rule of 40 計算戦略"""
 
@@ -56,8 +119,7 @@ class OPStrategy:
                 return None
 
             # Rule of 40 = 売上成長率(%) + 営業利益率(%)
-            r40 = rev_growth * 100 + op_margin * 100
-            return r40
+            return _combine(rev_growth, op_margin)
 
         except Exception as e:
             logger.warning(f"Error in OP strategy calculation: {e}")
@@ -67,44 +129,7 @@ class OPStrategy:
         self, data: FinancialData, period: CalculationPeriod
     ) -> Optional[float]:
         """売上成長率を計算"""
-        try:
-            if period == CalculationPeriod.TTM:
-                # infoから成長率を取得
-                if data.info and "revenueGrowth" in data.info:
-                    return data.info["revenueGrowth"]
-                
-                # TTMデータから計算
-                if (
-                    data.revenue_ttm is not None
-                    and hasattr(data.revenue_ttm, 'iloc')
-                    and len(data.revenue_ttm) > 1
-                ):
-                    current = data.revenue_ttm.iloc[0]
-                    previous = data.revenue_ttm.iloc[1]
-                    if previous != 0:
-                        return (current / previous) - 1
-
-            elif period == CalculationPeriod.ANNUAL:
-                # 年次データから計算
-                if (
-                    data.revenue_annual is not None
-                    and hasattr(data.revenue_annual, 'iloc')
-                    and len(data.revenue_annual) > 1
-                ):
-                    current = data.revenue_annual.iloc[0]
-                    previous = data.revenue_annual.iloc[1]
-                    if previous != 0:
-                        return (current / previous) - 1
-
-            return None
-
-        except Exception as e:
-            logger.warning(f"Error calculating revenue growth: {e}")
-            return None
-
-        except Exception as e:
-            logger.warning(f"Error calculating revenue growth: {e}")
-            return None
+        return _revenue_growth(data, period)
 
     def _calculate_operating_margin(
         self, data: FinancialData, period: CalculationPeriod
@@ -171,8 +196,7 @@ class EBITDAStrategy:
                 return None
 
             # Rule of 40 = 売上成長率(%) + EBITDAマージン(%)
-            r40 = rev_growth * 100 + ebitda_margin * 100
-            return r40
+            return _combine(rev_growth, ebitda_margin)
 
         except Exception as e:
             logger.warning(f"Error in EBITDA strategy calculation: {e}")
@@ -181,10 +205,8 @@ class EBITDAStrategy:
     def _calculate_revenue_growth(
         self, data: FinancialData, period: CalculationPeriod
     ) -> Optional[float]:
-        """売上成長率を計算"""
-        # OPStrategy と同じロジック
-        op_strategy = OPStrategy()
-        return op_strategy._calculate_revenue_growth(data, period)
+        """売上成長率を計算（OPStrategy と共通）"""
+        return _revenue_growth(data, period)
 
     def _calculate_ebitda_margin(
         self, data: FinancialData, period: CalculationPeriod
@@ -260,7 +282,7 @@ class Rule40Calculator:
                 calculation_time=datetime.now(),
             )
 
-            # 売上成長率計算（共通）
+            # 売上成長率計算（共通・1回のみ）
             result.revenue_growth_yoy = self._calculate_revenue_growth(data, period)
 
             # 営業利益率計算
@@ -269,12 +291,16 @@ class Rule40Calculator:
             # EBITDAマージン計算
             result.ebitda_margin = self._calculate_ebitda_margin(data, period)
 
-            # バリアントに応じて R40 を計算
+            # バリアントに応じて R40 を計算（各戦略の calculate と同じ式）
             if variant in [Rule40Variant.OP, Rule40Variant.BOTH]:
-                result.r40_op = self.op_strategy.calculate(data, period)
+                result.r40_op = _combine(
+                    result.revenue_growth_yoy, result.operating_margin
+                )
 
             if variant in [Rule40Variant.EBITDA, Rule40Variant.BOTH]:
-                result.r40_ebitda = self.ebitda_strategy.calculate(data, period)
+                result.r40_ebitda = _combine(
+                    result.revenue_growth_yoy, result.ebitda_margin
+                )
 
             # データ品質を評価
             result.data_quality = self._evaluate_result_quality(result)
@@ -290,6 +316,127 @@ class Rule40Calculator:
                 f"Failed to calculate Rule of 40 for {data.symbol}: {e}"
             )
 
+    def calculate_batch(
+        self,
+        data_list: Sequence[FinancialData],
+        period: CalculationPeriod = CalculationPeriod.TTM,
+        variant: Rule40Variant = Rule40Variant.OP,
+    ) -> List[Optional[Rule40Result]]:
+        """ユニバース全体の Rule of 40 を配列演算で一括計算
+
+        結果は calculate() と同一（NaN / None の区別を含む）で、入力と同じ順序の
+        リストを返す。数値以外の Series や info 値を含む銘柄のみ calculate() で
+        個別に計算し、計算に失敗した銘柄は None とする。
+        """
+        if not data_list:
+            return []
+
+        columns = _UniverseColumns(data_list, period)
+        (growth, op_margin, ebitda_margin), (
+            growth_ok,
+            op_ok,
+            ebitda_ok,
+        ) = columns.components()
+
+        with np.errstate(all="ignore"):
+            r40_op = growth * 100 + op_margin * 100
+            r40_ebitda = growth * 100 + ebitda_margin * 100
+
+        use_op = variant in [Rule40Variant.OP, Rule40Variant.BOTH]
+        use_ebitda = variant in [Rule40Variant.EBITDA, Rule40Variant.BOTH]
+        r40_op_ok = growth_ok & op_ok & use_op
+        r40_ebitda_ok = growth_ok & ebitda_ok & use_ebitda
+
+        # データ品質（_evaluate_result_quality と同じ判定）
+        complete = (growth_ok & (op_ok | ebitda_ok)) & (r40_op_ok | r40_ebitda_ok)
+        partial = growth_ok | op_ok | ebitda_ok
+        quality_codes = np.where(complete, 0, np.where(partial, 1, 2)).tolist()
+        qualities = (DataQuality.COMPLETE, DataQuality.PARTIAL, DataQuality.MISSING)
+
+        growth_list = _to_optional_list(growth, growth_ok)
+        op_list = _to_optional_list(op_margin, op_ok)
+        ebitda_list = _to_optional_list(ebitda_margin, ebitda_ok)
+        r40_op_list = _to_optional_list(r40_op, r40_op_ok)
+        r40_ebitda_list = _to_optional_list(r40_ebitda, r40_ebitda_ok)
+        fallback = columns.fallback.tolist()
+
+        calculation_time = datetime.now()
+        results: List[Optional[Rule40Result]] = []
+        for i, data in enumerate(data_list):
+            if fallback[i]:
+                try:
+                    results.append(self.calculate(data, period, variant))
+                except CalculationError as e:
+                    logger.warning(str(e))
+                    results.append(None)
+                continue
+
+            results.append(
+                Rule40Result(
+                    symbol=data.symbol,
+                    r40_op=r40_op_list[i],
+                    r40_ebitda=r40_ebitda_list[i],
+                    revenue_growth_yoy=growth_list[i],
+                    operating_margin=op_list[i],
+                    ebitda_margin=ebitda_list[i],
+                    period=period,
+                    variant=variant,
+                    calculation_time=calculation_time,
+                    data_quality=qualities[quality_codes[i]],
+                )
+            )
+
+        logger.debug(
+            f"Batch calculated Rule of 40 for {len(data_list)} symbols "
+            f"({int(columns.fallback.sum())} scalar fallbacks)"
+        )
+        return results
+
+    @staticmethod
+    def data_requirements(
+        period: CalculationPeriod, variant: Rule40Variant
+    ) -> DataRequirements:
+        """計算に必要な構成要素（名前・時価総額・TTM 指標のため info は常に必要）"""
+        parts = {DataPart.INFO}
+        needs_depreciation = variant in (Rule40Variant.EBITDA, Rule40Variant.BOTH)
+
+        if period == CalculationPeriod.TTM:
+            parts.add(DataPart.INCOME_TTM)
+            if needs_depreciation:
+                parts.add(DataPart.CASHFLOW_TTM)
+        elif period == CalculationPeriod.ANNUAL:
+            parts.add(DataPart.INCOME_ANNUAL)
+            if needs_depreciation:
+                parts.add(DataPart.CASHFLOW_ANNUAL)
+
+        return DataRequirements(
+            parts=frozenset(parts),
+            info_replaces_income_ttm=(
+                period == CalculationPeriod.TTM and variant == Rule40Variant.OP
+            ),
+        )
+
+    def r40_op_from_info(
+        self, info: Optional[Dict[str, Any]], period: CalculationPeriod
+    ) -> Tuple[bool, Optional[float]]:
+        """info だけで確定する営業利益版 R40 を取得
+
+        TTM では売上成長率・営業利益率とも info の値が財務諸表より優先されるため、
+        両方のキーが数値（または None）で揃っていれば、財務諸表を取得しなくても
+        calculate() と同じ r40_op になる。確定できない場合は (False, None)。
+        """
+        if period != CalculationPeriod.TTM or not info:
+            return False, None
+        if not all(key in info for key in TTM_INFO_KEYS):
+            return False, None
+
+        growth, margin = (info[key] for key in TTM_INFO_KEYS)
+        for value in (growth, margin):
+            if value is not None and not isinstance(value, _NUMERIC_TYPES):
+                return False, None
+
+        return True, _combine(growth, margin)
+
     def _calculate_revenue_growth(
         self, data: FinancialData, period: CalculationPeriod
     ) -> Optional[float]:
@@ -326,3 +473,163 @@ class Rule40Calculator:
             return DataQuality.PARTIAL
         else:
             return DataQuality.MISSING
+
+
+# info 値として配列化できる型（これ以外は calculate() で個別計算）
+_NUMERIC_TYPES = (int, float, np.integer, np.floating)
+
+
+class _UniverseColumns:
+    """calculate_batch 用に銘柄ごとの先頭値を NumPy 配列へ詰めたもの
+
+    NaN は正当な値として扱うため、値の有無は別の真偽値配列で保持する。
+    """
+
+    def __init__(self, data_list: Sequence[FinancialData], period: CalculationPeriod):
+        n = len(data_list)
+        self.fallback = np.zeros(n, dtype=bool)
+
+        if period == CalculationPeriod.TTM:
+            fields = ("revenue_ttm", "operating_income_ttm", "depreciation_ttm")
+        elif period == CalculationPeriod.ANNUAL:
+            fields = (
+                "revenue_annual",
+                "operating_income_annual",
+                "depreciation_annual",
+            )
+        else:
+            fields = None
+
+        # revenue は前期比のため2期分
+        self.revenue = np.full((n, 2), np.nan)
+        self.revenue_len = np.zeros(n, dtype=np.intp)
+        self.op_income = np.full(n, np.nan)
+        self.op_income_len = np.zeros(n, dtype=np.intp)
+        self.depreciation = np.full(n, np.nan)
+        self.depreciation_len = np.zeros(n, dtype=np.intp)
+
+        # info（TTM のみ）: キーの有無・値・値が None か
+        self.info_growth = np.full(n, np.nan)
+        self.info_growth_has = np.zeros(n, dtype=bool)
+        self.info_growth_none = np.zeros(n, dtype=bool)
+        self.info_margin = np.full(n, np.nan)
+        self.info_margin_has = np.zeros(n, dtype=bool)
+        self.info_margin_none = np.zeros(n, dtype=bool)
+
+        if fields is None:
+            return
+
+        revenue_field, op_field, dep_field = fields
+        use_info = period == CalculationPeriod.TTM
+
+        for i, data in enumerate(data_list):
+            revenue = getattr(data, revenue_field)
+            op_income = getattr(data, op_field)
+            depreciation = getattr(data, dep_field)
+            packed = (
+                self._pack(i, revenue, self.revenue, self.revenue_len)
+                and self._pack(i, op_income, self.op_income, self.op_income_len)
+                and self._pack(
+                    i, depreciation, self.depreciation, self.depreciation_len
+                )
+            )
+            if not packed or (use_info and not self._pack_info(i, data.info)):
+                self.fallback[i] = True
+
+    def _pack(self, i: int, series, values: np.ndarray, lengths: np.ndarray) -> bool:
+        """Series の先頭値（values の列数分）を格納（配列化できなければ False）"""
+        if series is None:
+            return True
+        if not isinstance(series, pd.Series):
+            return False
+
+        # Series.to_numpy() / .values は1回数 µs かかるため内部配列を直接参照する。
+        # 拡張型（Float64 など pd.NA を含みうる）は ndarray でないため個別計算に回す
+        array = series._values
+        length = len(array)
+        lengths[i] = length
+        if length == 0:
+            return True
+        if not isinstance(array, np.ndarray) or array.dtype.kind not in "fiu":
+            return False
+
+        if values.ndim == 1:
+            values[i] = array[0]
+        else:
+            head = array[: values.shape[1]]
+            values[i, : len(head)] = head
+        return True
+
+    def _pack_info(self, i: int, info) -> bool:
+        """info の revenueGrowth / operatingMargins を格納"""
+        if not info:
+            return True
+        if not isinstance(info, dict):
+            return False
+
+        for key, values, has, none in (
+            (
+                "revenueGrowth",
+                self.info_growth,
+                self.info_growth_has,
+                self.info_growth_none,
+            ),
+            (
+                "operatingMargins",
+                self.info_margin,
+                self.info_margin_has,
+                self.info_margin_none,
+            ),
+        ):
+            if key not in info:
+                continue
+            value = info[key]
+            has[i] = True
+            if value is None:
+                none[i] = True
+            elif isinstance(value, _NUMERIC_TYPES):
+                values[i] = value
+            else:
+                return False
+        return True
+
+    def components(self) -> Tuple[Tuple[np.ndarray, ...], Tuple[np.ndarray, ...]]:
+        """売上成長率・営業利益率・EBITDAマージンの (値, 有無) を配列で計算"""
+        current = self.revenue[:, 0]
+        previous = self.revenue[:, 1]
+        op_income = self.op_income
+        depreciation = self.depreciation
+
+        # 比較は scalar 版と同じく NaN != 0 を True とする
+        growth_calc_ok = (self.revenue_len > 1) & (previous != 0)
+        margin_calc_ok = (
+            (self.op_income_len > 0) & (self.revenue_len > 0) & (current != 0)
+        )
+        ebitda_ok = margin_calc_ok & (self.depreciation_len > 0)
+
+        with np.errstate(all="ignore"):
+            growth_calc = current / previous - 1
+            margin_calc = op_income / current
+            ebitda_margin = (op_income + depreciation) / current
+
+        # info にキーがあれば（値が None でも）info を優先
+        growth = np.where(self.info_growth_has, self.info_growth, growth_calc)
+        growth_ok = np.where(
+            self.info_growth_has, ~self.info_growth_none, growth_calc_ok
+        )
+        op_margin = np.where(self.info_margin_has, self.info_margin, margin_calc)
+        op_ok = np.where(self.info_margin_has, ~self.info_margin_none, margin_calc_ok)
+
+        vector = ~self.fallback
+        return (growth, op_margin, ebitda_margin), (
+            growth_ok & vector,
+            op_ok & vector,
+            ebitda_ok & vector,
+        )
+
+
+def _to_optional_list(values: np.ndarray, present: np.ndarray) -> List[Optional[float]]:
+    """配列を Python のリストへ変換（値が無い位置は None）"""
+    return [
+        value if ok else None for value, ok in zip(values.tolist(), present.tolist())
+    ]
@@ -4,7 +4,7 @@
 
 import logging
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QFrame,
@@ -54,6 +54,11 @@ class MainWindow(QMainWindow):
         # スレッド管理
         self.screening_thread = None
         self.screening_worker = None
+        # 裏の更新の停止を待っている間に要求された開始 (config, resume)
+        self._pending_start = None
+
+        # 逐次表示用の結果バッファ（タイマーでまとめてテーブルへ反映）
+        self._pending_results = []
 
         # ウィンドウ設定
         self._setup_window()
@@ -233,28 +238,52 @@ class MainWindow(QMainWindow):
             # スクリーニング開始
             self.side_bar.start_screening.connect(self.start_screening)
             self.side_bar.stop_screening.connect(self.stop_screening)
+            self.side_bar.resume_screening.connect(self.resume_screening)
 
             # 結果選択
             self.results_table.row_selected.connect(self.on_result_selected)
 
-    def start_screening(self, config):
-        """スクリーニング開始"""
+    def resume_screening(self):
+        """中断した実行を再開"""
+        self.start_screening(None, resume=True)
+
+    def start_screening(self, config, resume: bool = False):
+        """スクリーニング開始（resume の場合は中断した実行の続き）"""
         try:
             # 既存のスレッドがあれば停止
             if self.screening_thread and self.screening_thread.isRunning():
-                self.stop_screening()
+                if not self.screening_worker.revalidating:
+                    self.stop_screening()
+                    return
+                # 結果の表示後に裏で行っている更新は打ち切り、スレッドの終了
+                # （_on_thread_finished）で開始する（UI はブロックしない）
+                self._pending_start = (config, resume)
+                self.screening_thread.stop()
+                self.status_bar.showMessage("更新を停止中...")
+                if self.side_bar:
+                    self.side_bar.set_processing(True)
                 return
 
             # ワーカーとスレッド作成
-            self.screening_worker = ScreeningWorker(config, self.config_manager)
+            self.screening_worker = ScreeningWorker(
+                config, self.config_manager, resume=resume
+            )
             self.screening_thread = ScreeningThread(self.screening_worker)
 
             # シグナル接続
             self.screening_worker.progress_updated.connect(self._on_progress_updated)
             self.screening_worker.result_found.connect(self._on_result_found)
             self.screening_worker.finished.connect(self._on_screening_finished)
+            self.screening_worker.results_refreshed.connect(self._on_results_refreshed)
             self.screening_worker.error.connect(self._on_screening_error)
             self.screening_worker.status_updated.connect(self._on_status_updated)
+            self.screening_thread.finished.connect(self._on_thread_finished)
+
+            # 前回の結果をクリアし、逐次表示を開始
+            self._pending_results.clear()
+            if self.results_table:
+                self.results_table.clear_results()
+            self.result_flush_timer.start()
 
             # UI状態更新
             self.progress_bar.setVisible(True)
@@ -272,10 +301,27 @@ class MainWindow(QMainWindow):
                 self.side_bar.set_processing(False)
 
     def stop_screening(self):
-        """スクリーニング停止"""
+        """スクリーニング停止（UI はブロックせず、スレッドの終了で処理中を解除）"""
+        self._pending_start = None
+        self._stop_result_streaming()
+
         if self.screening_thread and self.screening_thread.isRunning():
             self.screening_thread.stop()
             self.status_bar.showMessage("スクリーニングを停止中...")
+            if self.side_bar:
+                self.side_bar.stop_button.setEnabled(False)
+            return
+
+        self._on_thread_finished()
+
+    def _on_thread_finished(self):
+        """スクリーニングスレッドの終了（停止・完了・エラー）"""
+        if self._pending_start is not None:
+            # 裏の更新の停止を待っていた開始を行う
+            config, resume = self._pending_start
+            self._pending_start = None
+            self.start_screening(config, resume)
+            return
 
         self.progress_bar.setVisible(False)
         if self.side_bar:
@@ -298,12 +344,29 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage(message)
 
     def _on_result_found(self, result):
-        """個別結果発見"""
-        # リアルタイムで結果テーブルに追加（オプション）
-        pass
+        """個別結果発見（バッファに積み、タイマーでまとめて表示）"""
+        self._pending_results.append(result)
+
+    def _flush_pending_results(self):
+        """バッファ済みの結果をテーブルへ反映"""
+        if not self._pending_results:
+            return
+
+        results, self._pending_results = self._pending_results, []
+        if self.results_table:
+            self.results_table.append_results(results)
+            self.status_label.setText(f"取得中: {len(self.results_table.results)}件")
+
+    def _stop_result_streaming(self):
+        """逐次表示を終了（残りのバッファを反映）"""
+        self.result_flush_timer.stop()
+        self._flush_pending_results()
 
     def _on_screening_finished(self, results):
         """スクリーニング完了"""
+        # 最終結果で置き換えるためバッファは破棄
+        self.result_flush_timer.stop()
+        self._pending_results.clear()
         self.progress_bar.setVisible(False)
 
         # 結果を表示
@@ -316,8 +379,15 @@ class MainWindow(QMainWindow):
         if self.side_bar:
             self.side_bar.set_processing(False)
 
+    def _on_results_refreshed(self, results, symbols):
+        """再検証で取得し直した銘柄の結果を差し替え"""
+        if self.results_table:
+            self.results_table.replace_results(list(results), symbols)
+            self.status_label.setText(f"完了: {len(self.results_table.results)}件")
+
     def _on_screening_error(self, error_message: str):
         """スクリーニングエラー"""
+        self._stop_result_streaming()
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage(f"エラー: {error_message}")
 
@@ -510,6 +580,13 @@ class MainWindow(QMainWindow):
 
     def _setup_timers(self):
         """タイマー設定"""
+        # 結果の逐次表示（performance.ui_update_interval ごとにまとめて反映）
+        self.result_flush_timer = QTimer(self)
+        self.result_flush_timer.setInterval(
+            max(10, self.config_manager.get("performance.ui_update_interval", 100))
+        )
+        self.result_flush_timer.timeout.connect(self._flush_pending_results)
+
         # 定期更新タイマー（後で実装）
         # self.update_timer = QTimer()
         # self.update_timer.timeout.connect(self.periodic_update)
@@ -531,6 +608,7 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """ウィンドウクローズイベント"""
         # スレッド停止
+        self._pending_start = None
         if self.screening_thread and self.screening_thread.isRunning():
             self.screening_thread.stop()
             self.screening_thread.wait(3000)  # 3秒待機
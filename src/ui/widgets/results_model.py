@@ -0,0 +1,375 @@
+"""
+結果テーブル用のモデル / プロキシ（モデル・ビュー）
+"""
+
+import math
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+)
+from PySide6.QtGui import QBrush, QColor
+
+try:
+    from ...core.domain.models import Rule40Result, Rule40Variant
+    from ...core.domain.result_frame import ResultFrame
+except ImportError:
+    from src.core.domain.models import Rule40Result, Rule40Variant
+    from src.core.domain.result_frame import ResultFrame
+
+
+# ソート用の生データ（数値列は float、欠損は -inf）
+SORT_ROLE = Qt.UserRole + 1
+
+# 1回の追加で挿入を通知する連続区間の上限（超えたら末尾に追加して並べ替える）
+MAX_INSERT_RUNS = 16
+
+# (ヘッダー, ResultFrame の列名, 列幅)。"r40" は表示バリアントに応じて切り替える
+COLUMNS = (
+    ("シンボル", "symbol", 80),
+    ("銘柄名", "name", 200),
+    ("Rule of 40", "r40", 100),
+    ("売上成長率", "revenue_growth_yoy", 100),
+    ("営業利益率", "operating_margin", 100),
+    ("EBITDAマージン", "ebitda_margin", 100),
+    ("時価総額", "market_cap", 100),
+    ("セクター", "sector", 150),
+)
+
+_TEXT_KEYS = {"symbol", "name", "sector"}
+_PERCENT_COLUMNS = {"revenue_growth_yoy", "operating_margin", "ebitda_margin"}
+_GREEN = QBrush(QColor(Qt.green))
+_YELLOW = QBrush(QColor(Qt.yellow))
+_RED = QBrush(QColor(Qt.red))
+_NUMERIC_ALIGNMENT = Qt.AlignRight | Qt.AlignVCenter
+
+
+def format_market_cap(market_cap: float) -> str:
+    """時価総額をフォーマット"""
+    if market_cap >= 1e12:
+        return f"${market_cap/1e12:.1f}T"
+    elif market_cap >= 1e9:
+        return f"${market_cap/1e9:.1f}B"
+    elif market_cap >= 1e6:
+        return f"${market_cap/1e6:.1f}M"
+    else:
+        return f"${market_cap:,.0f}"
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """ResultFrame を表示するテーブルモデル
+
+    セルはビューが要求した時点で列配列から生成するため、行ごとの
+    アイテムは持たない。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._frame = ResultFrame()
+        self._variant = Rule40Variant.OP
+        self._r40: Tuple[np.ndarray, np.ndarray] = self._frame.r40_values(self._variant)
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+
+    @property
+    def frame(self) -> ResultFrame:
+        return self._frame
+
+    @property
+    def variant(self) -> Rule40Variant:
+        return self._variant
+
+    def set_frame(self, frame: ResultFrame):
+        """表示する結果を差し替え（ソート中ならその順序で）"""
+        self.beginResetModel()
+        self._set_frame(frame)
+        if self._sort_column >= 0:
+            self._set_frame(frame.take(self._sort_indices(self._sort_column)))
+        self.endResetModel()
+
+    def append_results(self, results: Sequence[Rule40Result]):
+        """結果を追加（ソート中は追加分だけをソートし、挿入位置を二分探索で求める）
+
+        既存の行は並べ直さず、追加分が入る連続した位置ごとに行の挿入を通知する。
+        位置が散らばりすぎる場合は末尾に追加してから並び順の変更を通知する。
+        """
+        if not results:
+            return
+
+        addition = ResultFrame.from_results(results)
+        count, added = len(self._frame), len(addition)
+        if self._sort_column >= 0:
+            addition = addition.take(self._sort_indices(self._sort_column, addition))
+            positions = self._insert_positions(addition)
+        else:
+            positions = np.full(added, count, dtype=np.intp)
+
+        # 追加後の行番号と、結合したフレーム（既存 + 追加分）からの並び順
+        merged = self._frame.extended(addition)
+        rows = positions + np.arange(added)
+        inserted = np.zeros(count + added, dtype=bool)
+        inserted[rows] = True
+        order = np.empty(count + added, dtype=np.intp)
+        order[~inserted] = np.arange(count)
+        order[inserted] = count + np.arange(added)
+
+        runs = np.split(rows, np.flatnonzero(np.diff(rows) != 1) + 1)
+        if len(runs) > MAX_INSERT_RUNS:
+            self.beginInsertRows(QModelIndex(), count, count + added - 1)
+            self._set_frame(merged)
+            self.endInsertRows()
+            self._reorder(order)
+            return
+
+        visible = ~inserted
+        for run in runs:
+            self.beginInsertRows(QModelIndex(), int(run[0]), int(run[-1]))
+            visible[run] = True
+            self._set_frame(merged.take(order[visible]))
+            self.endInsertRows()
+
+    def replace_results(
+        self, results: Sequence[Rule40Result], symbols: Sequence[str]
+    ):
+        """symbols の行を results で置き換える（results に無い銘柄の行は削除）"""
+        updated = {result.symbol: result for result in results}
+        removed = set(symbols)
+        rows = []
+        for row in self._frame:
+            if row.symbol in updated:
+                rows.append(updated.pop(row.symbol))
+            elif row.symbol not in removed:
+                rows.append(row)
+        rows.extend(updated.values())
+        self.set_frame(ResultFrame(rows))
+
+    def set_variant(self, variant: Rule40Variant):
+        """Rule of 40 列の表示バリアントを変更（行は再構築しない）"""
+        self._variant = variant
+        self._r40 = self._frame.r40_values(variant)
+        column = self.column_of("r40")
+        if self._sort_column == column:
+            self.sort(self._sort_column, self._sort_order)
+        elif len(self._frame):
+            self.dataChanged.emit(
+                self.index(0, column), self.index(len(self._frame) - 1, column)
+            )
+
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """生データの argsort で並べ替え（選択などの永続インデックスは維持）"""
+        self._sort_column = column
+        self._sort_order = order
+        if column < 0 or not len(self._frame):
+            return
+
+        self._reorder(self._sort_indices(column))
+
+    def _reorder(self, order_indices: np.ndarray):
+        """行を order_indices の順に並べ替えて通知（永続インデックスを付け替える）"""
+        self.layoutAboutToBeChanged.emit()
+        self._set_frame(self._frame.take(order_indices))
+
+        # 旧行番号 -> 新行番号
+        new_rows = np.empty(len(order_indices), dtype=np.intp)
+        new_rows[order_indices] = np.arange(len(order_indices))
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(int(new_rows[i.row()]), i.column()) for i in old_indexes],
+        )
+        self.layoutChanged.emit()
+
+    def _sort_keys(self, column: int, frame: ResultFrame) -> np.ndarray:
+        """列のソートキー（数値列の欠損は -inf、文字列列の None は空文字列）"""
+        key = COLUMNS[column][1]
+        if key == "r40":
+            values, missing = (
+                self._r40 if frame is self._frame else frame.r40_values(self._variant)
+            )
+            return np.where(missing, -np.inf, values)
+        if key in _TEXT_KEYS:
+            return frame.text_keys(key)
+        return np.where(frame.missing(key), -np.inf, frame.column(key))
+
+    def _sort_indices(
+        self, column: int, frame: Optional[ResultFrame] = None
+    ) -> np.ndarray:
+        frame = self._frame if frame is None else frame
+        return frame.sort_indices(
+            keys=self._sort_keys(column, frame),
+            ascending=self._sort_order == Qt.AscendingOrder,
+        )
+
+    def _insert_positions(self, addition: ResultFrame) -> np.ndarray:
+        """ソート済みの追加分を、同値の既存行の後ろに入れる位置（追加前の行番号）"""
+        keys = self._sort_keys(self._sort_column, self._frame)
+        new_keys = self._sort_keys(self._sort_column, addition)
+        if self._sort_order == Qt.AscendingOrder:
+            return np.searchsorted(keys, new_keys, side="right")
+        # 降順のキーは逆順にすると昇順になる
+        return len(keys) - np.searchsorted(keys[::-1], new_keys, side="left")
+
+    def _set_frame(self, frame: ResultFrame):
+        self._frame = frame
+        self._r40 = frame.r40_values(self._variant)
+
+    def result_at(self, row: int) -> Optional[Rule40Result]:
+        """行の Rule40Result を取得"""
+        if 0 <= row < len(self._frame):
+            return self._frame[row]
+        return None
+
+    @staticmethod
+    def column_of(key: str) -> int:
+        """列名から列番号を取得"""
+        return next(i for i, (_, name, _) in enumerate(COLUMNS) if name == key)
+
+    # --- QAbstractTableModel ---
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._frame)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COLUMNS[section][0]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        key = COLUMNS[index.column()][1]
+
+        if key in _TEXT_KEYS:
+            if role in (Qt.DisplayRole, SORT_ROLE):
+                return self._frame.column(key)[row]
+            return None
+
+        value = self._raw_value(key, row)
+
+        if role == Qt.DisplayRole:
+            return self._format(key, value)
+        if role == SORT_ROLE:
+            return -math.inf if value is None else value
+        if role == Qt.UserRole:
+            return value
+        if role == Qt.TextAlignmentRole:
+            return _NUMERIC_ALIGNMENT
+        if role == Qt.ForegroundRole:
+            # 負値は赤色
+            return _RED if value is not None and value < 0 else None
+        if role == Qt.BackgroundRole and key == "r40" and value:
+            if value >= 40:
+                return _GREEN
+            if value >= 30:
+                return _YELLOW
+        return None
+
+    def _raw_value(self, key: str, row: int) -> Optional[float]:
+        if key == "r40":
+            values, missing = self._r40
+        else:
+            values, missing = self._frame.column(key), self._frame.missing(key)
+        return None if missing[row] else float(values[row])
+
+    def _format(self, key: str, value: Optional[float]) -> str:
+        # 0 も N/A 表示（従来の表示と同じ）
+        if not value:
+            return "N/A"
+        if key == "r40":
+            return f"{value:.1f}%"
+        if key in _PERCENT_COLUMNS:
+            return f"{value * 100:.1f}%"
+        return format_market_cap(value)
+
+
+class ResultsFilterProxyModel(QSortFilterProxyModel):
+    """バリアント・閾値・検索によるフィルターを行うプロキシ
+
+    条件はフレーム全体に対する真偽値マスクとして一括評価し、
+    filterAcceptsRow はマスクを参照するだけにする。ソートは行ごとの比較を
+    避けるため、ソースモデルの argsort に委譲する。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(SORT_ROLE)
+        self.setDynamicSortFilter(False)
+        self._variant = Rule40Variant.OP
+        self._threshold: Optional[float] = 40.0
+        self._search_text = ""
+        self._mask: Optional[np.ndarray] = None
+        self._mask_frame: Optional[ResultFrame] = None
+
+    def set_filters(
+        self,
+        variant: Rule40Variant,
+        threshold: Optional[float],
+        search_text: str,
+    ):
+        """フィルター条件を変更"""
+        self._variant = variant
+        self._threshold = threshold
+        self._search_text = search_text.strip().lower()
+        self._mask_frame = None
+        self.invalidateRowsFilter()
+
+    def accepted_mask(self) -> np.ndarray:
+        """現在のフレームに対するフィルターマスク（フレームが変われば再計算）"""
+        source = self.sourceModel()
+        frame = source.frame if source is not None else ResultFrame()
+        if self._mask_frame is not frame:
+            self._mask = self._compute_mask(frame)
+            self._mask_frame = frame
+        return self._mask
+
+    def filtered_frame(self) -> ResultFrame:
+        """フィルターを通過した結果（元の順序）"""
+        source = self.sourceModel()
+        if source is None:
+            return ResultFrame()
+        return source.frame.take(self.accepted_mask())
+
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """ソースモデルで並べ替え（プロキシ自身はソースの順序を保つ）"""
+        source = self.sourceModel()
+        if source is not None:
+            source.sort(column, order)
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        mask = self.accepted_mask()
+        return source_row < len(mask) and bool(mask[source_row])
+
+    def _compute_mask(self, frame: ResultFrame) -> np.ndarray:
+        mask = np.ones(len(frame), dtype=bool)
+
+        # バリアントフィルター
+        if self._variant == Rule40Variant.OP:
+            mask &= ~frame.missing("r40_op")
+        elif self._variant == Rule40Variant.EBITDA:
+            mask &= ~frame.missing("r40_ebitda")
+
+        # 閾値フィルター
+        if self._threshold is not None:
+            op_ok = frame.threshold_mask(self._threshold, Rule40Variant.OP)
+            ebitda_ok = frame.threshold_mask(self._threshold, Rule40Variant.EBITDA)
+            if self._variant == Rule40Variant.OP:
+                mask &= op_ok
+            elif self._variant == Rule40Variant.EBITDA:
+                mask &= ebitda_ok
+            else:  # BOTH
+                mask &= op_ok | ebitda_ok
+
+        # 検索フィルター
+        if self._search_text:
+            mask &= frame.contains_mask(self._search_text, ("symbol", "name", "sector"))
+
+        return mask
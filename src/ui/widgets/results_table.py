@@ -3,7 +3,7 @@
 """
 
 import logging
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import pandas as pd
 from PySide6.QtCore import Qt, Signal
@@ -16,14 +16,16 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
+from .results_model import COLUMNS, ResultsFilterProxyModel, ResultsTableModel
+
 try:
     from ...core.domain.models import CalculationPeriod, Rule40Result, Rule40Variant
+    from ...core.domain.result_frame import ResultFrame
 except ImportError:
     try:
         from src.core.domain.models import (
@@ -31,6 +33,7 @@ except ImportError:
             Rule40Result,
             Rule40Variant,
         )
+        from src.core.domain.result_frame import ResultFrame
     except ImportError:
         # Fallback for direct execution
         import sys
@@ -42,6 +45,7 @@ except ImportError:
             Rule40Result,
             Rule40Variant,
         )
+        from src.core.domain.result_frame import ResultFrame
 
 logger = logging.getLogger(__name__)
 
@@ -55,9 +59,10 @@ class ResultsTable(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.results: List[Rule40Result] = []
-        self.filtered_results: List[Rule40Result] = []
         self.current_variant = Rule40Variant.OP
+        self.model = ResultsTableModel(self)
+        self.proxy_model = ResultsFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
 
         self._setup_ui()
         self._setup_connections()
@@ -74,12 +79,15 @@ class ResultsTable(QWidget):
         header_widget = self._create_header_widget()
         layout.addWidget(header_widget)
 
-        # テーブル
-        self.table = QTableWidget()
+        # テーブル（表示範囲のセルのみ描画されるモデル・ビュー）
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.setSortingEnabled(True)
+        self.table.sortByColumn(-1, Qt.AscendingOrder)
+        self.table.verticalHeader().setDefaultSectionSize(24)
 
         # ヘッダー設定
         header = self.table.horizontalHeader()
@@ -154,198 +162,75 @@ class ResultsTable(QWidget):
 
     def _setup_columns(self):
         """列設定"""
-        columns = [
-            "シンボル",
-            "銘柄名",
-            "Rule of 40",
-            "売上成長率",
-            "営業利益率",
-            "EBITDAマージン",
-            "時価総額",
-            "セクター",
-        ]
-
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels(columns)
-
-        # 列幅設定
-        column_widths = [80, 200, 100, 100, 100, 100, 100, 150]
-        for i, width in enumerate(column_widths):
+        for i, (_, _, width) in enumerate(COLUMNS):
             self.table.setColumnWidth(i, width)
 
     def _setup_connections(self):
         """シグナル接続"""
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.selectionModel().currentRowChanged.connect(
+            self._on_selection_changed
+        )
         self.variant_combo.currentTextChanged.connect(self._on_variant_changed)
         self.search_box.textChanged.connect(self._on_search_changed)
         self.threshold_checkbox.toggled.connect(self._on_threshold_changed)
         self.refresh_button.clicked.connect(self.refresh_display)
         self.export_csv_button.clicked.connect(self._on_export_csv)
 
-    def set_results(self, results: List[Rule40Result]):
+    @property
+    def results(self) -> ResultFrame:
+        """全結果"""
+        return self.model.frame
+
+    @property
+    def filtered_results(self) -> ResultFrame:
+        """フィルターを通過した結果"""
+        return self.proxy_model.filtered_frame()
+
+    def set_results(self, results: Union[ResultFrame, List[Rule40Result]]):
         """結果を設定"""
-        self.results = results
+        self.model.set_frame(ResultFrame.from_results(results))
         self._apply_filters()
-        self.refresh_display()
 
         # 結果があればエクスポートボタンを有効化
-        self.export_csv_button.setEnabled(len(results) > 0)
+        self.export_csv_button.setEnabled(len(self.results) > 0)
 
-        logger.info(f"Set {len(results)} results in table")
+        logger.info(f"Set {len(self.results)} results in table")
 
-    def _apply_filters(self):
-        """フィルター適用"""
-        filtered = self.results.copy()
+    def append_results(self, results: List[Rule40Result]):
+        """結果を追加（実行中の逐次表示用）"""
+        self.model.append_results(results)
+        self._update_stats()
+        self.export_csv_button.setEnabled(len(self.results) > 0)
 
-        # バリアントフィルター
-        if self.current_variant == Rule40Variant.OP:
-            filtered = [r for r in filtered if r.r40_op is not None]
-        elif self.current_variant == Rule40Variant.EBITDA:
-            filtered = [r for r in filtered if r.r40_ebitda is not None]
+    def replace_results(self, results: List[Rule40Result], symbols: List[str]):
+        """再検証で更新された銘柄の行を差し替え"""
+        self.model.replace_results(results, symbols)
+        self._apply_filters()
+        self.export_csv_button.setEnabled(len(self.results) > 0)
 
-        # 閾値フィルター
-        if self.threshold_checkbox.isChecked():
-            threshold = 40.0
-            if self.current_variant == Rule40Variant.OP:
-                filtered = [r for r in filtered if r.r40_op and r.r40_op >= threshold]
-            elif self.current_variant == Rule40Variant.EBITDA:
-                filtered = [
-                    r for r in filtered if r.r40_ebitda and r.r40_ebitda >= threshold
-                ]
-            else:  # BOTH
-                filtered = [
-                    r
-                    for r in filtered
-                    if (r.r40_op and r.r40_op >= threshold)
-                    or (r.r40_ebitda and r.r40_ebitda >= threshold)
-                ]
-
-        # 検索フィルター
-        search_text = self.search_box.text().strip().lower()
-        if search_text:
-            filtered = [
-                r
-                for r in filtered
-                if search_text in r.symbol.lower()
-                or search_text in r.name.lower()
-                or search_text in r.sector.lower()
-            ]
-
-        self.filtered_results = filtered
-
-        # 統計更新
+    def _apply_filters(self):
+        """フィルター適用（プロキシのマスクを更新するだけで行は再作成しない）"""
+        threshold = 40.0 if self.threshold_checkbox.isChecked() else None
+        self.proxy_model.set_filters(
+            self.current_variant, threshold, self.search_box.text()
+        )
+        self._update_stats()
+
+    def _update_stats(self):
+        """統計更新"""
         self.stats_label.setText(f"結果: {len(self.results)}件")
-        self.filtered_label.setText(f"表示: {len(self.filtered_results)}件")
+        self.filtered_label.setText(f"表示: {self.proxy_model.rowCount()}件")
 
     def refresh_display(self):
         """表示更新"""
-        self.table.setRowCount(len(self.filtered_results))
-
-        for row, result in enumerate(self.filtered_results):
-            # シンボル
-            self.table.setItem(row, 0, self._create_item(result.symbol))
-
-            # 銘柄名
-            self.table.setItem(row, 1, self._create_item(result.name))
+        self.proxy_model.invalidate()
+        self._update_stats()
+        logger.debug(f"Refreshed display with {self.proxy_model.rowCount()} rows")
 
-            # Rule of 40
-            r40_value = result.get_r40_value(self.current_variant)
-            r40_item = self._create_numeric_item(
-                r40_value, "%.1f%%" % r40_value if r40_value else "N/A"
-            )
-            if r40_value and r40_value >= 40:
-                r40_item.setBackground(Qt.green)
-            elif r40_value and r40_value >= 30:
-                r40_item.setBackground(Qt.yellow)
-            self.table.setItem(row, 2, r40_item)
-
-            # 売上成長率
-            growth_item = self._create_numeric_item(
-                result.revenue_growth_yoy,
-                (
-                    "%.1f%%" % (result.revenue_growth_yoy * 100)
-                    if result.revenue_growth_yoy
-                    else "N/A"
-                ),
-            )
-            self.table.setItem(row, 3, growth_item)
-
-            # 営業利益率
-            op_item = self._create_numeric_item(
-                result.operating_margin,
-                (
-                    "%.1f%%" % (result.operating_margin * 100)
-                    if result.operating_margin
-                    else "N/A"
-                ),
-            )
-            self.table.setItem(row, 4, op_item)
-
-            # EBITDAマージン
-            ebitda_item = self._create_numeric_item(
-                result.ebitda_margin,
-                (
-                    "%.1f%%" % (result.ebitda_margin * 100)
-                    if result.ebitda_margin
-                    else "N/A"
-                ),
-            )
-            self.table.setItem(row, 5, ebitda_item)
-
-            # 時価総額
-            mc_item = self._create_numeric_item(
-                result.market_cap,
-                (
-                    self._format_market_cap(result.market_cap)
-                    if result.market_cap
-                    else "N/A"
-                ),
-            )
-            self.table.setItem(row, 6, mc_item)
-
-            # セクター
-            self.table.setItem(row, 7, self._create_item(result.sector))
-
-        logger.debug(f"Refreshed display with {len(self.filtered_results)} rows")
-
-    def _create_item(self, text: str) -> QTableWidgetItem:
-        """テーブルアイテム作成"""
-        item = QTableWidgetItem(text)
-        item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-        return item
-
-    def _create_numeric_item(
-        self, value: Optional[float], formatted_text: str
-    ) -> QTableWidgetItem:
-        """数値アイテム作成"""
-        item = QTableWidgetItem(formatted_text)
-        item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-        if value is not None:
-            item.setData(Qt.UserRole, value)  # ソート用に生データを保持
-
-            # 負値は赤色
-            if value < 0:
-                item.setForeground(Qt.red)
-
-        return item
-
-    def _format_market_cap(self, market_cap: float) -> str:
-        """時価総額をフォーマット"""
-        if market_cap >= 1e12:
-            return f"${market_cap/1e12:.1f}T"
-        elif market_cap >= 1e9:
-            return f"${market_cap/1e9:.1f}B"
-        elif market_cap >= 1e6:
-            return f"${market_cap/1e6:.1f}M"
-        else:
-            return f"${market_cap:,.0f}"
-
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, current, previous=None):
         """選択変更イベント"""
-        current_row = self.table.currentRow()
-        if 0 <= current_row < len(self.filtered_results):
-            result = self.filtered_results[current_row]
+        result = self.get_selected_result()
+        if result is not None:
             self.row_selected.emit(result)
 
     def _on_variant_changed(self, text: str):
@@ -356,58 +241,51 @@ class ResultsTable(QWidget):
             "両方": Rule40Variant.BOTH,
         }
         self.current_variant = variant_map.get(text, Rule40Variant.OP)
+        self.model.set_variant(self.current_variant)
         self._apply_filters()
-        self.refresh_display()
 
     def _on_search_changed(self, text: str):
         """検索テキスト変更イベント"""
         self._apply_filters()
-        self.refresh_display()
 
     def _on_threshold_changed(self, checked: bool):
         """閾値チェック変更イベント"""
         self._apply_filters()
-        self.refresh_display()
 
     def get_selected_result(self) -> Optional[Rule40Result]:
         """選択中の結果を取得"""
-        current_row = self.table.currentRow()
-        if 0 <= current_row < len(self.filtered_results):
-            return self.filtered_results[current_row]
-        return None
+        current = self.table.currentIndex()
+        if not current.isValid():
+            return None
+        return self.model.result_at(self.proxy_model.mapToSource(current).row())
 
     def clear_results(self):
         """結果をクリア"""
-        self.results.clear()
-        self.filtered_results.clear()
-        self.table.setRowCount(0)
-        self.stats_label.setText("結果: 0件")
-        self.filtered_label.setText("表示: 0件")
+        self.model.set_frame(ResultFrame())
+        self._update_stats()
 
     def export_to_dataframe(self) -> pd.DataFrame:
-        """DataFrameにエクスポート"""
-        if not self.filtered_results:
+        """DataFrameにエクスポート（表示中の列をそのまま使用）"""
+        filtered = self.filtered_results
+        if not len(filtered):
             return pd.DataFrame()
 
-        data = []
-        for result in self.filtered_results:
-            row = {
-                "シンボル": result.symbol,
-                "銘柄名": result.name,
-                "Rule of 40 (OP)": result.r40_op,
-                "Rule of 40 (EBITDA)": result.r40_ebitda,
-                "売上成長率": result.revenue_growth_yoy,
-                "営業利益率": result.operating_margin,
-                "EBITDAマージン": result.ebitda_margin,
-                "時価総額": result.market_cap,
-                "セクター": result.sector,
-                "業種": result.industry,
-                "データ品質": result.data_quality.value,
-                "計算時刻": result.calculation_time,
-            }
-            data.append(row)
-
-        return pd.DataFrame(data)
+        df = filtered.to_dataframe()
+        columns = {
+            "symbol": "シンボル",
+            "name": "銘柄名",
+            "r40_op": "Rule of 40 (OP)",
+            "r40_ebitda": "Rule of 40 (EBITDA)",
+            "revenue_growth_yoy": "売上成長率",
+            "operating_margin": "営業利益率",
+            "ebitda_margin": "EBITDAマージン",
+            "market_cap": "時価総額",
+            "sector": "セクター",
+            "industry": "業種",
+            "data_quality": "データ品質",
+            "calculation_time": "計算時刻",
+        }
+        return df[list(columns)].rename(columns=columns)
 
     def _on_export_csv(self):
         """CSVエクスポートボタンクリック"""
@@ -415,7 +293,7 @@ class ResultsTable(QWidget):
         from PySide6.QtWidgets import QFileDialog, QMessageBox
 
         # 結果がない場合
-        if not self.filtered_results:
+        if not len(self.filtered_results):
             QMessageBox.warning(self, "警告", "エクスポートする結果がありません")
             return
 
@@ -53,6 +53,7 @@ class SideBar(QWidget):
     # シグナル
     start_screening = Signal(ScreeningConfig)
     stop_screening = Signal()
+    resume_screening = Signal()  # 中断した実行の再開
     config_changed = Signal(ScreeningConfig)
 
     def __init__(self, config_manager: ConfigManager, parent=None):
@@ -241,6 +242,11 @@ class SideBar(QWidget):
         self.force_refresh_checkbox.setChecked(False)
         layout.addWidget(self.force_refresh_checkbox)
 
+        # 取得失敗の再試行
+        self.retry_failures_checkbox = QCheckBox("取得に失敗した銘柄を再試行")
+        self.retry_failures_checkbox.setChecked(False)
+        layout.addWidget(self.retry_failures_checkbox)
+
         return group
 
     def _create_action_buttons(self) -> QWidget:
@@ -298,6 +304,11 @@ class SideBar(QWidget):
         )
         layout.addWidget(self.stop_button)
 
+        # 再開ボタン
+        self.resume_button = QPushButton("中断した実行を再開")
+        self.resume_button.setToolTip("停止・異常終了した実行の未処理の銘柄だけを処理します")
+        layout.addWidget(self.resume_button)
+
         # 設定保存ボタン
         self.save_config_button = QPushButton("設定を保存")
         layout.addWidget(self.save_config_button)
@@ -418,6 +429,7 @@ class SideBar(QWidget):
         """処理状態を設定"""
         self.start_button.setEnabled(not is_processing)
         self.stop_button.setEnabled(is_processing)
+        self.resume_button.setEnabled(not is_processing)
 
         if is_processing:
             self.start_button.setText("処理中...")
@@ -448,6 +460,9 @@ class SideBar(QWidget):
         # 停止ボタン
         self.stop_button.clicked.connect(self._on_stop_screening)
 
+        # 再開ボタン
+        self.resume_button.clicked.connect(self.resume_screening.emit)
+
     def _on_start_screening(self):
         """スクリーニング開始処理"""
         try:
@@ -525,7 +540,20 @@ class SideBar(QWidget):
             margin_positive_only=self.margin_positive_checkbox.isChecked(),
             max_workers=max(1, self.workers_spinbox.value()),  # 最小値1を保証
             cache_ttl_hours=max(1, self.cache_spinbox.value()),  # 最小値1を保証
-            force_refresh=self.force_refresh_checkbox.isChecked()
+            annual_statement_ttl_hours=self.config_manager.get(
+                "fetch.annual_statement_ttl_hours", 720
+            ),
+            ttm_statement_ttl_hours=self.config_manager.get(
+                "fetch.ttm_statement_ttl_hours", 168
+            ),
+            force_refresh=self.force_refresh_checkbox.isChecked(),
+            fetch_backend=self.config_manager.get("fetch.backend", "thread"),
+            streaming=self.config_manager.get("performance.streaming", True),
+            prefilter=self.config_manager.get("fetch.prefilter", True),
+            failure_ttl_hours=self.config_manager.get("fetch.failure_ttl_hours", 6),
+            retry_failures=self.retry_failures_checkbox.isChecked(),
+            stale_grace_hours=self.config_manager.get("fetch.stale_grace_hours", 0),
+            offline=self.config_manager.get("universe.offline", False),
         )
         
         return config
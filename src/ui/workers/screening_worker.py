@@ -3,16 +3,29 @@
 """
 
 import logging
+from typing import Optional
 
 from PySide6.QtCore import QObject, QThread, Signal
 
 try:
     from ...core.application.screening_service import ScreeningService
-    from ...core.domain.models import Rule40Result, ScreeningConfig
+    from ...core.domain.cancellation import CancellationToken
+    from ...core.domain.models import (
+        Rule40Result,
+        ScreeningCancelledError,
+        ScreeningConfig,
+        ValidationError,
+    )
 except ImportError:
     try:
         from src.core.application.screening_service import ScreeningService
-        from src.core.domain.models import Rule40Result, ScreeningConfig
+        from src.core.domain.cancellation import CancellationToken
+        from src.core.domain.models import (
+            Rule40Result,
+            ScreeningCancelledError,
+            ScreeningConfig,
+            ValidationError,
+        )
     except ImportError:
         # Fallback for direct execution
         import sys
@@ -21,7 +34,13 @@ except ImportError:
         project_root = Path(__file__).parent.parent.parent
         sys.path.insert(0, str(project_root))
         from src.core.application.screening_service import ScreeningService
-        from src.core.domain.models import Rule40Result, ScreeningConfig
+        from src.core.domain.cancellation import CancellationToken
+        from src.core.domain.models import (
+            Rule40Result,
+            ScreeningCancelledError,
+            ScreeningConfig,
+            ValidationError,
+        )
 
 logger = logging.getLogger(__name__)
 
@@ -32,15 +51,24 @@ class ScreeningWorker(QObject):
     # シグナル
     progress_updated = Signal(int, int, str)  # current, total, message
     result_found = Signal(Rule40Result)  # 個別結果
-    finished = Signal(list)  # 全結果
+    finished = Signal(object)  # 全結果（ResultFrame）
+    results_refreshed = Signal(object, list)  # 再検証後の結果（ResultFrame）, 取得し直した銘柄
     error = Signal(str)  # エラー
     status_updated = Signal(str)  # ステータス更新
 
-    def __init__(self, config: ScreeningConfig, config_manager):
+    def __init__(
+        self,
+        config: Optional[ScreeningConfig],
+        config_manager,
+        resume: bool = False,
+    ):
         super().__init__()
         self.config = config
         self.config_manager = config_manager
+        self.resume = resume  # 中断した実行の再開（config は記録から復元）
         self._is_running = False
+        self.revalidating = False  # 結果の通知後、期限切れのデータを更新中
+        self.cancel_token = CancellationToken()  # 停止で実行中の取得も打ち切る
         self.service = None
 
     def start_screening(self):
@@ -61,30 +89,69 @@ class ScreeningWorker(QObject):
                 if self._is_running:
                     self.result_found.emit(result)
 
-            self.status_updated.emit("銘柄データを取得中...")
+            if self.resume:
+                run = self.service.get_resumable_run()
+                if run is None:
+                    raise ValidationError("再開できる中断した実行がありません")
+                self.config = run.config
+                self.status_updated.emit(
+                    f"中断した実行を再開中 (残り{run.remaining}/{run.total}銘柄)..."
+                )
+                results = self.service.resume(
+                    run.run_id,
+                    progress_callback=progress_callback,
+                    result_callback=result_callback,
+                    cancel_token=self.cancel_token,
+                )
+            else:
+                self.status_updated.emit("銘柄データを取得中...")
 
-            # スクリーニング実行
-            results = self.service.screen_stocks(
-                self.config,
-                progress_callback=progress_callback,
-                result_callback=result_callback,
-            )
+                # スクリーニング実行
+                results = self.service.screen_stocks(
+                    self.config,
+                    progress_callback=progress_callback,
+                    result_callback=result_callback,
+                    cancel_token=self.cancel_token,
+                )
 
             if self._is_running:
                 self.status_updated.emit(f"スクリーニング完了: {len(results)}件")
                 self.finished.emit(results)
+                self._revalidate()
             else:
                 self.status_updated.emit("スクリーニングが中断されました")
 
+        except ScreeningCancelledError:
+            logger.info("Screening cancelled by user")
+            self.status_updated.emit("スクリーニングが中断されました")
         except Exception as e:
             logger.error(f"Screening error: {e}")
             self.error.emit(f"スクリーニングエラー: {str(e)}")
         finally:
             self._is_running = False
 
+    def _revalidate(self):
+        """期限切れのキャッシュから表示した銘柄を取得し直し、結果を差し替える"""
+        count = len(self.service.pending_revalidation)
+        if not count:
+            return
+
+        self.status_updated.emit(f"期限切れのデータを更新中 ({count}銘柄)...")
+        self.revalidating = True
+        try:
+            results, refreshed = self.service.revalidate(
+                self.config, cancel_token=self.cancel_token
+            )
+        finally:
+            self.revalidating = False
+        if self._is_running:
+            self.results_refreshed.emit(results, refreshed)
+            self.status_updated.emit(f"データ更新完了: {len(refreshed)}/{count}銘柄")
+
     def stop_screening(self):
-        """スクリーニング停止"""
+        """スクリーニング停止（待機せずに戻る。未着手の取得は破棄される）"""
         self._is_running = False
+        self.cancel_token.cancel()
         self.status_updated.emit("スクリーニングを停止中...")
 
 
@@ -100,7 +167,5 @@ class ScreeningThread(QThread):
         self.worker.start_screening()
 
     def stop(self):
-        """スレッド停止"""
+        """スレッド停止を要求（終了は finished シグナルで通知される）"""
         self.worker.stop_screening()
-        self.quit()
-        self.wait()
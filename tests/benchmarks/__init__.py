@@ -0,0 +1,3 @@
+"""
+ベンチマーク（pytest の収集対象外。python -m tests.benchmarks.<name> で実行）
+"""
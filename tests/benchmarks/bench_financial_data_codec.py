@@ -0,0 +1,146 @@
+"""
+FinancialData キャッシュ形式のデコード速度ベンチマーク
+
+比較対象:
+- json (legacy): 旧形式 json.dumps(data.__dict__, default=str) の json.loads。
+  Series が文字列化されるため実際には利用できない（参考値）
+- json (typed): Series を index/values のリストとして保存し、
+  pd.to_datetime + pd.Series で復元する可逆な JSON 形式
+- binary: src.core.data.serialization
+
+実行: python -m tests.benchmarks.bench_financial_data_codec
+"""
+
+import json
+import sys
+import timeit
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.core.data.serialization import (
+    SERIES_FIELDS,
+    decode_financial_data,
+    encode_financial_data,
+)
+from src.core.domain.models import DataQuality, FinancialData
+
+# 判定基準: 可逆な JSON 形式に対するデコード速度比
+REQUIRED_SPEEDUP = 10.0
+
+
+def make_sample(symbol: str = "BENCH") -> FinancialData:
+    """yfinance 相当の FinancialData を生成"""
+    rng = np.random.default_rng(0)
+    annual = pd.to_datetime(["2024-12-31", "2023-12-31", "2022-12-31", "2021-12-31"])
+    quarterly = pd.to_datetime(
+        ["2024-12-31", "2024-09-30", "2024-06-30", "2024-03-31", "2023-12-31"]
+    )
+
+    def series(index, name):
+        return pd.Series(rng.uniform(1e8, 1e10, len(index)), index=index, name=name)
+
+    # info は yfinance 同様 150 キー程度
+    info = {f"field{i}": rng.uniform() for i in range(140)}
+    info.update(
+        {
+            "longName": "Bench Corp",
+            "shortName": "Bench",
+            "marketCap": 123456789012,
+            "sector": "Technology",
+            "industry": "Software",
+            "revenueGrowth": 0.21,
+            "operatingMargins": 0.18,
+            "ebitdaMargins": 0.25,
+        }
+    )
+
+    return FinancialData(
+        symbol=symbol,
+        revenue_annual=series(annual, "Total Revenue"),
+        revenue_ttm=series(quarterly, "Total Revenue"),
+        operating_income_annual=series(annual, "Operating Income"),
+        operating_income_ttm=series(quarterly, "Operating Income"),
+        depreciation_annual=series(annual, "Depreciation And Amortization"),
+        depreciation_ttm=series(quarterly, "Depreciation And Amortization"),
+        info=info,
+        last_updated=datetime.now(),
+        data_quality=DataQuality.COMPLETE,
+    )
+
+
+def encode_typed_json(data: FinancialData) -> str:
+    payload = {
+        "symbol": data.symbol,
+        "info": data.info,
+        "last_updated": data.last_updated.isoformat(),
+        "data_quality": data.data_quality.value,
+    }
+    for name in SERIES_FIELDS:
+        s = getattr(data, name)
+        if s is not None:
+            payload[name] = {
+                "name": s.name,
+                "index": [ts.isoformat() for ts in s.index],
+                "values": s.tolist(),
+            }
+    return json.dumps(payload)
+
+
+def decode_typed_json(text: str) -> FinancialData:
+    payload = json.loads(text)
+    fields = {}
+    for name in SERIES_FIELDS:
+        s = payload.get(name)
+        if s is not None:
+            fields[name] = pd.Series(
+                s["values"], index=pd.to_datetime(s["index"]), name=s["name"]
+            )
+    return FinancialData(
+        symbol=payload["symbol"],
+        info=payload["info"],
+        last_updated=datetime.fromisoformat(payload["last_updated"]),
+        data_quality=DataQuality(payload["data_quality"]),
+        **fields,
+    )
+
+
+def bench(func, number: int) -> float:
+    """1回あたりの秒数（best of 5）"""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main() -> int:
+    data = make_sample()
+
+    legacy = json.dumps(data.__dict__, default=str)
+    typed = encode_typed_json(data)
+    binary = encode_financial_data(data)
+
+    # 可逆性チェック
+    decoded = decode_financial_data(binary)
+    for name in SERIES_FIELDS:
+        original = getattr(data, name)
+        if original is not None:
+            pd.testing.assert_series_equal(getattr(decoded, name), original)
+
+    number = 500
+    results = {
+        "json (legacy)": (len(legacy), bench(lambda: json.loads(legacy), number)),
+        "json (typed)": (len(typed), bench(lambda: decode_typed_json(typed), number)),
+        "binary": (len(binary), bench(lambda: decode_financial_data(binary), number)),
+    }
+
+    print(f"{'format':<15} {'bytes':>8} {'decode (us)':>12}")
+    for name, (size, seconds) in results.items():
+        print(f"{name:<15} {size:>8} {seconds * 1e6:>12.1f}")
+
+    speedup = results["json (typed)"][1] / results["binary"][1]
+    print(f"\nbinary vs typed JSON decode speedup: {speedup:.1f}x")
+
+    return 0 if speedup >= REQUIRED_SPEEDUP else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
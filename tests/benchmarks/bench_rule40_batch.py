@@ -0,0 +1,120 @@
+"""
+Rule40Calculator 一括計算のベンチマーク
+
+calculate() を銘柄ごとに呼ぶ場合と calculate_batch() を比較し、
+全銘柄で結果が一致することも確認する。
+
+実行: python -m tests.benchmarks.bench_rule40_batch [銘柄数 ...]
+"""
+
+import math
+import sys
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from src.core.domain.models import CalculationPeriod, FinancialData, Rule40Variant
+from src.core.domain.rule40 import Rule40Calculator
+
+DEFAULT_SIZES = (10_000, 100_000)
+
+FIELDS = (
+    "r40_op",
+    "r40_ebitda",
+    "revenue_growth_yoy",
+    "operating_margin",
+    "ebitda_margin",
+    "data_quality",
+)
+
+
+def make_universe(size: int, seed: int = 0) -> List[FinancialData]:
+    """欠損・NaN・info 有無が混在する合成ユニバースを生成"""
+    rng = np.random.default_rng(seed)
+    annual = pd.to_datetime(["2024-12-31", "2023-12-31", "2022-12-31", "2021-12-31"])
+    quarterly = pd.to_datetime(
+        ["2024-12-31", "2024-09-30", "2024-06-30", "2024-03-31", "2023-12-31"]
+    )
+
+    universe = []
+    for i in range(size):
+        revenue = rng.uniform(1e8, 1e10, len(annual))
+        if rng.random() < 0.02:
+            revenue[1] = np.nan
+
+        info = {}
+        if rng.random() < 0.7:
+            info["revenueGrowth"] = float(rng.normal(0.1, 0.2))
+        if rng.random() < 0.7:
+            info["operatingMargins"] = float(rng.normal(0.1, 0.2))
+
+        universe.append(
+            FinancialData(
+                symbol=f"SYM{i}",
+                revenue_annual=pd.Series(revenue, index=annual),
+                operating_income_annual=pd.Series(
+                    revenue * rng.normal(0.1, 0.2), index=annual
+                ),
+                depreciation_annual=(
+                    pd.Series(revenue * 0.05, index=annual)
+                    if rng.random() < 0.8
+                    else None
+                ),
+                revenue_ttm=pd.Series(rng.uniform(1e8, 1e10, 5), index=quarterly),
+                operating_income_ttm=pd.Series(
+                    rng.uniform(-1e8, 1e9, 5), index=quarterly
+                ),
+                depreciation_ttm=pd.Series(rng.uniform(1e6, 1e8, 5), index=quarterly),
+                info=info,
+            )
+        )
+    return universe
+
+
+def same(left, right) -> bool:
+    if left is None or right is None:
+        return left is right
+    if isinstance(left, float) and math.isnan(left):
+        return isinstance(right, float) and math.isnan(right)
+    return left == right
+
+
+def main() -> int:
+    sizes = [int(arg) for arg in sys.argv[1:]] or list(DEFAULT_SIZES)
+    calculator = Rule40Calculator()
+    variant = Rule40Variant.BOTH
+    mismatches = 0
+
+    print(
+        f"{'symbols':>8} {'period':<7} {'scalar (s)':>11} {'batch (s)':>10} {'speedup':>8}"
+    )
+    for size in sizes:
+        universe = make_universe(size)
+        for period in (CalculationPeriod.TTM, CalculationPeriod.ANNUAL):
+            start = time.perf_counter()
+            scalar = [calculator.calculate(data, period, variant) for data in universe]
+            scalar_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            batch = calculator.calculate_batch(universe, period, variant)
+            batch_seconds = time.perf_counter() - start
+
+            for expected, result in zip(scalar, batch):
+                if not all(
+                    same(getattr(result, f), getattr(expected, f)) for f in FIELDS
+                ):
+                    mismatches += 1
+
+            print(
+                f"{size:>8} {period.value:<7} {scalar_seconds:>11.2f} "
+                f"{batch_seconds:>10.2f} {scalar_seconds / batch_seconds:>7.1f}x"
+            )
+
+    print(f"\nmismatches: {mismatches}")
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
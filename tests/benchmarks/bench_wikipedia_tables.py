@@ -0,0 +1,122 @@
+"""
+Wikipedia 構成銘柄テーブル取り出しのベンチマーク
+
+ページ全体を pd.read_html でパースする場合と、構成銘柄のテーブルだけを
+extract_table で取り出す場合（初回・パース結果のキャッシュ命中）を比較し、
+シンボル・銘柄名が一致することも確認する。
+
+保存したページ（ブラウザで「ページを保存」した HTML など）を引数に渡すと
+それを使い、省略時は構成銘柄ページを模した合成ページを使う。
+
+実行: python -m tests.benchmarks.bench_wikipedia_tables [page.html ...]
+"""
+
+import io
+import sys
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.adapters.html_tables import (
+    CONSTITUENTS_TABLE_ID,
+    clear_parsed_cache,
+    extract_table,
+)
+
+REPEAT = 3
+
+
+def make_page(
+    constituents: int = 503, filler_tables: int = 40, filler_rows: int = 120, seed: int = 0
+) -> str:
+    """構成銘柄テーブルと多数の無関係なテーブル（変更履歴・ナビボックス）を持つ合成ページ"""
+    rng = np.random.default_rng(seed)
+    letters = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+
+    parts = ["<html><head><title>List of S&amp;P 500 companies</title></head><body>"]
+    parts.append('<table class="box-notice"><tr><td>Notice</td></tr></table>')
+    parts.append('<h2 id="S&amp;P_500_component_stocks">S&amp;P 500 component stocks</h2>')
+    parts.append(
+        f'<table class="wikitable sortable" id="{CONSTITUENTS_TABLE_ID}"><tbody>'
+        "<tr><th>Symbol</th><th>Security</th><th>GICS Sector</th>"
+        "<th>GICS Sub-Industry</th><th>Headquarters Location</th>"
+        "<th>Date added</th><th>CIK</th><th>Founded</th></tr>"
+    )
+    for i in range(constituents):
+        symbol = "".join(rng.choice(letters, 3)) + str(i)
+        parts.append(
+            f'<tr><td><a href="/q/{symbol}">{symbol}</a></td>'
+            f'<td><a href="/wiki/C{i}">Company {i} Inc.</a></td>'
+            f"<td>Sector {i % 11}</td><td>Industry {i % 67}</td>"
+            f"<td>City {i}, State</td><td>20{i % 25:02d}-01-01</td>"
+            f"<td>{1000000 + i:010d}</td><td>19{i % 100:02d}</td></tr>"
+        )
+    parts.append("</tbody></table>")
+
+    for t in range(filler_tables):
+        parts.append(f'<h3 id="changes_{t}">Changes {t}</h3><table class="wikitable">')
+        parts.append("<tr><th>Date</th><th>Added</th><th>Removed</th><th>Reason</th></tr>")
+        for r in range(filler_rows):
+            parts.append(
+                f"<tr><td>2020-{r % 12 + 1:02d}-01</td><td>ADD{r}</td>"
+                f"<td>REM{r}</td><td>Reason {t}-{r} <sup>[{r}]</sup></td></tr>"
+            )
+        parts.append("</table>")
+
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def timed(fn: Callable[[], pd.DataFrame]) -> Tuple[float, pd.DataFrame]:
+    best, result = float("inf"), None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def read_html_all(html: str) -> pd.DataFrame:
+    """従来の方法: 全テーブルをパースし、Symbol / Security 列を持つものを選ぶ"""
+    for table in pd.read_html(io.StringIO(html)):
+        if "Symbol" in table.columns and "Security" in table.columns:
+            return table
+    raise ValueError("constituents table not found")
+
+
+def extract_cold(html: str) -> pd.DataFrame:
+    clear_parsed_cache()
+    return extract_table(html, table_id=CONSTITUENTS_TABLE_ID)
+
+
+def run(name: str, html: str):
+    full_time, full = timed(lambda: read_html_all(html))
+    cold_time, cold = timed(lambda: extract_cold(html))
+    hot_time, hot = timed(lambda: extract_table(html, table_id=CONSTITUENTS_TABLE_ID))
+
+    columns = ["Symbol", "Security"]
+    expected = full[columns].astype(str).values.tolist()
+    assert cold[columns].values.tolist() == expected, "extract_table mismatch"
+    assert hot[columns].values.tolist() == expected, "cached result mismatch"
+
+    print(
+        f"{name}: {len(html) / 1e6:.2f} MB, {len(full)} rows | "
+        f"read_html {full_time * 1000:.1f} ms | "
+        f"extract {cold_time * 1000:.1f} ms ({full_time / cold_time:.1f}x) | "
+        f"cached {hot_time * 1000:.2f} ms"
+    )
+
+
+def main(paths: List[str]):
+    if paths:
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                run(path, f.read())
+    else:
+        run("synthetic", make_page())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
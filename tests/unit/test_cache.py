@@ -0,0 +1,68 @@
+"""
+CacheManager のユニットテスト
+"""
+
+import threading
+
+import pytest
+
+from src.core.data.cache import CacheManager
+
+
+@pytest.fixture
+def cache(temp_db_file):
+    manager = CacheManager(temp_db_file, ttl_hours=1)
+    yield manager
+    manager.close()
+
+
+class TestCacheManager:
+    """CacheManager のテスト"""
+
+    def test_set_many_get_many_roundtrip(self, cache):
+        """一括保存・一括取得（bytes は BLOB のまま）"""
+        items = {f"key_{i}": {"value": i} for i in range(1200)}
+        items["blob"] = b"\x00\x01binary"
+        cache.set_many(items)
+
+        loaded = cache.get_many(list(items) + ["missing"])
+
+        assert loaded == items
+        assert cache.get("blob") == b"\x00\x01binary"
+
+    def test_get_many_drops_expired_entries(self, cache):
+        """期限切れのエントリは返さずに削除する"""
+        cache.set_many({"fresh": 1})
+        cache.set_many({"stale": 2}, ttl_hours=-1)
+
+        assert cache.get_many(["fresh", "stale"]) == {"fresh": 1}
+        assert cache.get_keys() == ["fresh"]
+
+    def test_get_many_stale_returns_entries_within_grace(self, cache):
+        """猶予内の期限切れエントリは期限切れとして返し、猶予を過ぎたものは削除する"""
+        cache.set_many({"fresh": 1})
+        cache.set_many({"stale": 2}, ttl_hours=-1)
+        cache.set_many({"gone": 3}, ttl_hours=-3)
+
+        values, stale = cache.get_many_stale(["fresh", "stale", "gone"], 2)
+        assert values == {"fresh": 1, "stale": 2}
+        assert stale == {"stale"}
+        assert sorted(cache.get_keys()) == ["fresh", "stale"]
+
+    def test_connections_are_reused_per_thread(self, cache):
+        """スレッドごとに接続を1本だけ使い回す"""
+        main_conn = cache._connection()
+        assert cache._connection() is main_conn
+
+        worker_conns = []
+
+        def worker():
+            cache.set("worker", 1)
+            worker_conns.append(cache._connection())
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert worker_conns[0] is not main_conn
+        assert cache.get("worker") == 1
@@ -0,0 +1,128 @@
+"""
+ヘッドレス CLI のユニットテスト
+"""
+
+import json
+import logging
+import subprocess
+import sys
+
+import pytest
+
+from src import cli
+from src.core.application import screening_service
+from src.core.data.config_loader import ConfigManager
+
+from .test_screening_service import FakeYFClient
+
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    """CLI が追加したログハンドラを取り除く"""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "cache:\n"
+        f"  path: {tmp_path / 'cache.db'}\n"
+        "fetch:\n"
+        "  requests_per_second: 1000.0\n"
+        "  max_requests_per_second: 1000.0\n"
+        "logging:\n"
+        "  level: WARNING\n",
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+@pytest.fixture
+def universe_csv(tmp_path):
+    path = tmp_path / "universe.csv"
+    path.write_text("symbol\nS1\nS2\nLOW\nBAD1\n", encoding="utf-8")
+    return str(path)
+
+
+class TestCLI:
+    """CLI のテスト"""
+
+    def test_does_not_import_qt(self):
+        """CLI とスクリーニングサービスの読み込みで PySide6 を読み込まない"""
+        code = (
+            "import sys, src.cli;"
+            "import src.core.application.screening_service;"
+            "sys.exit(any(m.startswith('PySide6') for m in sys.modules))"
+        )
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+    def test_screen_writes_output_and_summary(
+        self, monkeypatch, capsys, tmp_path, config_path, universe_csv
+    ):
+        """結果ファイル・stdout の集計・stderr の進捗イベントを出力する"""
+        monkeypatch.setattr(
+            screening_service, "YFClient", lambda timeout: FakeYFClient()
+        )
+        out = tmp_path / "results.json"
+
+        exit_code = cli.main(
+            [
+                "--config",
+                config_path,
+                "screen",
+                "--sources",
+                "",
+                "--csv",
+                universe_csv,
+                "--out",
+                str(out),
+            ]
+        )
+
+        captured = capsys.readouterr()
+        summary = json.loads(captured.out)
+        assert exit_code == cli.EXIT_OK
+        assert summary["status"] == "ok"
+        assert summary["symbols"] == 4
+        assert summary["fetched"] == 3
+        assert summary["fetch_failed"] == 1
+        assert summary["passed"] == 2
+
+        events = [json.loads(line) for line in captured.err.splitlines()]
+        assert any(e["event"] == "progress" for e in events)
+
+        records = json.loads(out.read_text(encoding="utf-8"))
+        assert sorted(r["symbol"] for r in records) == ["S1", "S2"]
+
+    def test_usage_errors(self, capsys, config_path, tmp_path):
+        """不明なデータソース・出力形式は EXIT_USAGE"""
+        assert cli.main(["--config", config_path, "screen", "--sources", "nope"]) == (
+            cli.EXIT_USAGE
+        )
+        assert "nope" in json.loads(capsys.readouterr().out)["error"]
+
+        out = str(tmp_path / "results.txt")
+        assert cli.main(["--config", config_path, "screen", "--out", out]) == (
+            cli.EXIT_USAGE
+        )
+
+    def test_build_config_falls_back_to_config_file(self, tmp_path):
+        """引数が無い設定は設定ファイルの値を使う（引数優先）"""
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            "rule40:\n  threshold: 30\n  min_revenue: 100000000\n", encoding="utf-8"
+        )
+        config_manager = ConfigManager(str(path))
+        parser = cli.build_parser()
+
+        config = cli._build_config(parser.parse_args(["screen"]), config_manager)
+        assert config.threshold == 30.0
+        assert config.min_revenue == 100000000
+
+        args = parser.parse_args(["screen", "--min-revenue", "5e8"])
+        assert cli._build_config(args, config_manager).min_revenue == 5e8
@@ -0,0 +1,116 @@
+"""
+取得エンジンのユニットテスト
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.core.application.fetch_engine import (
+    AsyncFetchEngine,
+    ThreadPoolFetchEngine,
+    create_fetch_engine,
+)
+from src.core.data.rate_limiter import AdaptiveRateLimiter
+from src.core.domain.cancellation import CancellationToken
+from src.core.domain.models import DataFetchError, FinancialData
+
+
+def _fast_limiter() -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(
+        requests_per_second=1000.0,
+        max_requests_per_second=1000.0,
+        initial_workers=4,
+        max_workers=4,
+        base_penalty_seconds=0.0,
+    )
+
+
+@pytest.mark.parametrize("engine_class", [ThreadPoolFetchEngine, AsyncFetchEngine])
+class TestFetchEngines:
+    """両エンジン共通の契約テスト"""
+
+    def test_all_symbols_reported_in_caller_thread(self, engine_class):
+        engine = engine_class(_fast_limiter(), max_concurrency=4)
+        caller = threading.get_ident()
+        seen = {}
+
+        def on_result(symbol, data, error):
+            assert threading.get_ident() == caller
+            seen[symbol] = (data, error)
+
+        symbols = [f"S{i}" for i in range(20)]
+        engine.fetch_all(symbols, lambda s: FinancialData(symbol=s), on_result)
+
+        assert set(seen) == set(symbols)
+        assert all(data.symbol == s for s, (data, _) in seen.items())
+
+    def test_rate_limit_is_retried(self, engine_class):
+        limiter = _fast_limiter()
+        engine = engine_class(limiter, max_concurrency=2, retry_attempts=3)
+        calls = []
+
+        def fetch(symbol):
+            calls.append(symbol)
+            if len(calls) == 1:
+                raise DataFetchError("Too Many Requests. Rate limited.")
+            return FinancialData(symbol=symbol)
+
+        results = []
+        engine.fetch_all(["AAPL"], fetch, lambda s, d, e: results.append((d, e)))
+
+        assert len(calls) == 2
+        assert results[0][0].symbol == "AAPL"
+        assert limiter.total_throttled == 1
+
+    def test_other_errors_are_not_retried(self, engine_class):
+        engine = engine_class(_fast_limiter(), max_concurrency=2)
+        calls = []
+
+        def fetch(symbol):
+            calls.append(symbol)
+            raise DataFetchError("delisted")
+
+        results = []
+        engine.fetch_all(["DEAD"], fetch, lambda s, d, e: results.append((d, e)))
+
+        assert calls == ["DEAD"]
+        assert results[0][0] is None
+        assert isinstance(results[0][1], DataFetchError)
+
+
+    def test_cancel_drops_queued_and_abandons_in_flight(self, engine_class):
+        engine = engine_class(_fast_limiter(), max_concurrency=2)
+        token = CancellationToken()
+        release = threading.Event()
+        started = []
+
+        def fetch(symbol):
+            started.append(symbol)
+            if symbol == "S0":
+                return FinancialData(symbol=symbol)
+            token.cancel()
+            release.wait(5)  # 応答しないリクエスト
+            return FinancialData(symbol=symbol)
+
+        seen = []
+        begin = time.monotonic()
+        engine.fetch_all(
+            [f"S{i}" for i in range(20)],
+            fetch,
+            lambda s, d, e: seen.append((s, e)),
+            token,
+        )
+        elapsed = time.monotonic() - begin
+        release.set()
+
+        assert elapsed < 2
+        assert len(started) <= 3
+        assert all(error is None for _, error in seen)
+
+
+def test_unknown_backend_falls_back_to_thread():
+    engine = create_fetch_engine("unknown", _fast_limiter(), 2)
+
+    assert isinstance(engine, ThreadPoolFetchEngine)
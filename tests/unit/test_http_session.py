@@ -0,0 +1,130 @@
+"""
+共有 HTTP セッション（接続プール）のユニットテスト（ローカルの HTTP サーバーを使用）
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("curl_cffi")
+
+from yfinance.data import YfData
+
+from src.core.data.http_session import (
+    PooledSession,
+    export_session_state,
+    get_shared_session,
+    restore_session_state,
+    session_state_ttl_hours,
+)
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """keep-alive で固定のレスポンスを返すハンドラ"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_connection_reused_across_threads(server_url):
+    session = PooledSession()
+    texts = []
+
+    # ワーカースレッドが毎回入れ替わっても接続は使い回される
+    for _ in range(3):
+        worker = threading.Thread(
+            target=lambda: texts.append(session.get(server_url).text)
+        )
+        worker.start()
+        worker.join()
+
+    stats = session.get_stats()
+    session.close()
+
+    assert texts == ["ok"] * 3
+    assert stats["requests"] == 3
+    assert stats["connections_created"] == 1
+    assert stats["connections_reused"] == 2
+    assert stats["curl_handles"] == 1
+
+
+def test_shared_session_is_singleton():
+    assert get_shared_session() is get_shared_session()
+
+
+@pytest.fixture
+def yf_data():
+    """yfinance の認証状態（プロセス共有）をテスト後に元に戻す"""
+    data = YfData()
+    saved = (data._session, data._cookie, data._crumb, data._cookie_strategy)
+    data._cookie = data._crumb = None
+    yield data
+    data._session, data._cookie, data._crumb, data._cookie_strategy = saved
+
+
+def session_state(expires: float) -> dict:
+    return {
+        "crumb": "crumb123",
+        "strategy": "basic",
+        "cookies": [
+            {
+                "name": "A3",
+                "value": "token",
+                "domain": ".yahoo.com",
+                "path": "/",
+                "secure": True,
+                "expires": expires,
+            }
+        ],
+    }
+
+
+class TestSessionState:
+    """Yahoo の認証状態の保存・復元のテスト"""
+
+    def test_restore_then_export_round_trip(self, yf_data):
+        session = PooledSession()
+        state = session_state(time.time() + 86400)
+
+        assert restore_session_state(session, state)
+        assert yf_data._crumb == "crumb123"
+
+        exported = export_session_state(session)
+        assert exported["crumb"] == "crumb123"
+        assert [c["name"] for c in exported["cookies"]] == ["A3"]
+        # 既に認証済みなら上書きしない
+        assert not restore_session_state(session, state)
+
+    def test_expired_state_is_ignored(self, yf_data):
+        session = PooledSession()
+
+        assert not restore_session_state(session, session_state(time.time() - 60))
+        assert yf_data._crumb is None
+        assert export_session_state(session) is None
+
+    def test_ttl_capped_by_cookie_expiry(self):
+        state = session_state(time.time() + 5.5 * 3600)
+
+        assert session_state_ttl_hours(state, 24) == 5
+        assert session_state_ttl_hours(state, 2) == 2
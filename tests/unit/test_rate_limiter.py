@@ -0,0 +1,123 @@
+"""
+レートリミッタのユニットテスト
+"""
+
+import asyncio
+import threading
+
+from src.core.data.rate_limiter import (
+    AdaptiveRateLimiter,
+    AIMDController,
+    TokenBucket,
+    is_rate_limit_error,
+)
+from src.core.domain.models import DataFetchError
+
+
+class TestTokenBucket:
+    """TokenBucket のテスト"""
+
+    def test_burst_within_capacity_does_not_wait(self):
+        bucket = TokenBucket(rate=5.0)
+
+        waits = [bucket.reserve() for _ in range(5)]
+
+        assert all(w == 0.0 for w in waits)
+
+    def test_reserve_beyond_capacity_returns_wait(self):
+        bucket = TokenBucket(rate=2.0)
+        bucket.reserve()
+        bucket.reserve()
+
+        wait = bucket.reserve()
+
+        assert 0.4 < wait <= 0.5
+
+
+class TestAIMDController:
+    """AIMDController のテスト"""
+
+    def test_additive_increase_after_window(self):
+        controller = AIMDController(initial_limit=2, max_limit=10)
+
+        for _ in range(3):
+            controller.on_success()
+
+        assert controller.limit == 3
+
+    def test_multiplicative_decrease(self):
+        controller = AIMDController(initial_limit=8, max_limit=10)
+
+        controller.on_throttle()
+
+        assert controller.limit == 4
+
+    def test_acquire_respects_limit(self):
+        controller = AIMDController(initial_limit=1, max_limit=4)
+
+        assert controller.try_acquire()
+        assert not controller.try_acquire()
+        controller.release()
+        assert controller.try_acquire()
+
+    def test_async_waiter_is_woken_by_release(self):
+        """非同期の待機はポーリングせず、別スレッドの release() で起こされる"""
+        controller = AIMDController(initial_limit=1, max_limit=4)
+        assert controller.try_acquire()
+
+        async def wait_for_slot():
+            threading.Timer(0.05, controller.release).start()
+            await asyncio.wait_for(controller.acquire_async(), timeout=2.0)
+
+        asyncio.run(wait_for_slot())
+
+        assert controller.in_flight == 1
+        assert not controller._async_waiters
+
+
+class TestAdaptiveRateLimiter:
+    """AdaptiveRateLimiter のテスト"""
+
+    def test_success_raises_rate(self):
+        limiter = AdaptiveRateLimiter(requests_per_second=1.0, rate_increase=0.5)
+
+        limiter.record_success()
+
+        assert limiter.rate == 1.5
+
+    def test_throttle_backs_off_rate_and_concurrency(self):
+        limiter = AdaptiveRateLimiter(
+            requests_per_second=4.0,
+            initial_workers=8,
+            max_workers=8,
+            backoff_factor=2.0,
+            base_penalty_seconds=0.0,
+        )
+
+        limiter.record_throttle()
+
+        assert limiter.rate == 2.0
+        assert limiter.concurrency.limit == 4
+        assert limiter.total_throttled == 1
+
+    def test_rate_is_clamped(self):
+        limiter = AdaptiveRateLimiter(
+            requests_per_second=1.0,
+            min_requests_per_second=0.5,
+            max_requests_per_second=1.2,
+            rate_increase=1.0,
+            base_penalty_seconds=0.0,
+        )
+
+        limiter.record_success()
+        assert limiter.rate == 1.2
+
+        limiter.record_throttle()
+        limiter.record_throttle()
+        assert limiter.rate == 0.5
+
+
+def test_is_rate_limit_error():
+    assert is_rate_limit_error(DataFetchError("Too Many Requests. Rate limited."))
+    assert is_rate_limit_error(Exception("HTTP Error 429"))
+    assert not is_rate_limit_error(DataFetchError("No data found, symbol may be delisted"))
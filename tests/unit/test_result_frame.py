@@ -0,0 +1,92 @@
+"""
+ResultFrame のユニットテスト
+"""
+
+import pytest
+
+from src.core.domain.models import Filter, Rule40Result, Rule40Variant, SortConfig
+from src.core.domain.result_frame import ResultFrame
+
+
+@pytest.fixture
+def results():
+    nan = float("nan")
+    return [
+        Rule40Result("AAA", "Alpha", r40_op=55.0, operating_margin=0.2, sector="Tech"),
+        Rule40Result("BBB", "Beta", r40_op=None, r40_ebitda=45.0, market_cap=2e9),
+        Rule40Result("CCC", "Gamma", r40_op=40.0, operating_margin=-0.1),
+        Rule40Result("DDD", "Delta", r40_op=nan, ebitda_margin=0.3, market_cap=0),
+        Rule40Result("EEE", "Epsilon", r40_op=55.0, sector="Health"),
+    ]
+
+
+class TestResultFrame:
+    """ResultFrame のテスト"""
+
+    @pytest.mark.parametrize(
+        "filter_obj",
+        [
+            Filter("r40_op", "gte", 40.0),
+            Filter("r40_op", "neq", 55.0),
+            Filter("operating_margin", "lt", 0),
+            Filter("sector", "contains", "TEC"),
+            Filter("unknown", "gt", 0),
+        ],
+    )
+    def test_filter_mask_matches_filter_apply(self, results, filter_obj):
+        """マスクは Filter.apply と同じ行を選ぶ"""
+        frame = ResultFrame(results)
+
+        selected = frame.take(frame.filter_mask(filter_obj))
+
+        assert list(selected) == [r for r in results if filter_obj.apply(r)]
+
+    @pytest.mark.parametrize("variant", list(Rule40Variant))
+    def test_threshold_mask_matches_meets_threshold(self, results, variant):
+        """閾値マスクは meets_threshold と一致"""
+        frame = ResultFrame(results)
+
+        mask = frame.threshold_mask(40.0, variant)
+
+        assert mask.tolist() == [r.meets_threshold(40.0, variant) for r in results]
+
+    @pytest.mark.parametrize("ascending", [True, False])
+    def test_sort_matches_sorted(self, results, ascending):
+        """argsort は sorted(key=SortConfig.get_key) と同順（安定）"""
+        # NaN は Python の比較で順序が定まらないため除外
+        rows = [r for r in results if r.symbol != "DDD"]
+        sort_config = SortConfig("r40_op", ascending=ascending)
+        expected = sorted(rows, key=sort_config.get_key, reverse=not ascending)
+
+        assert list(ResultFrame(rows).sort_by("r40_op", ascending)) == expected
+
+    @pytest.mark.parametrize("ascending", [True, False])
+    def test_sort_text_with_none(self, ascending):
+        """文字列列の None は空文字列として並べる"""
+        rows = [
+            Rule40Result("AAA", "Alpha", sector="Tech"),
+            Rule40Result("BBB", "Beta", sector=None),
+            Rule40Result("CCC", "Gamma", sector="Health"),
+        ]
+
+        symbols = [r.symbol for r in ResultFrame(rows).sort_by("sector", ascending)]
+
+        expected = ["BBB", "CCC", "AAA"]
+        assert symbols == (expected if ascending else expected[::-1])
+
+    def test_sequence_behaviour(self, results):
+        """リストと同様に扱える"""
+        frame = ResultFrame(results)
+
+        assert len(frame) == 5
+        assert frame[0] is results[0]
+        assert [r.symbol for r in frame[1:3]] == ["BBB", "CCC"]
+        assert frame.optional_column("r40_op")[1] is None
+
+    def test_extended_appends_rows(self, results):
+        """extended は既存の列を保ったまま末尾に追加する"""
+        frame = ResultFrame(results[:2]).extended(results[2:])
+
+        assert list(frame) == results
+        assert frame.missing("r40_op").tolist() == [False, True, False, False, False]
+        assert ResultFrame().extended(results[:1])[0] is results[0]
@@ -319,3 +319,86 @@ class TestEBITDAStrategy:
         margin = strategy._calculate_ebitda_margin(data, CalculationPeriod.TTM)
 
         assert margin is None  # 減価償却費データがないため計算不可
+
+
+class TestCalculateBatch:
+    """Rule40Calculator.calculate_batch のテスト"""
+
+    FIELDS = (
+        "r40_op",
+        "r40_ebitda",
+        "revenue_growth_yoy",
+        "operating_margin",
+        "ebitda_margin",
+        "data_quality",
+    )
+
+    def _edge_cases(self):
+        nan = float("nan")
+        return [
+            FinancialData(
+                symbol="FULL",
+                revenue_ttm=pd.Series([130.0, 100.0]),
+                operating_income_ttm=pd.Series([26.0]),
+                depreciation_ttm=pd.Series([4.0]),
+                revenue_annual=pd.Series([120, 100]),
+                operating_income_annual=pd.Series([30, 20]),
+                depreciation_annual=pd.Series([5, 5]),
+                info={"revenueGrowth": 0.25, "operatingMargins": 0.2},
+            ),
+            # info のキーが None なら計算値ではなく None
+            FinancialData(
+                symbol="INFO_NONE",
+                revenue_ttm=pd.Series([130.0, 100.0]),
+                operating_income_ttm=pd.Series([26.0]),
+                info={"revenueGrowth": None},
+            ),
+            FinancialData(
+                symbol="NAN",
+                revenue_ttm=pd.Series([nan, 100.0]),
+                operating_income_ttm=pd.Series([26.0]),
+                revenue_annual=pd.Series([120.0, nan]),
+                operating_income_annual=pd.Series([nan]),
+                info={},
+            ),
+            FinancialData(
+                symbol="ZERO",
+                revenue_ttm=pd.Series([0.0, 0.0]),
+                operating_income_ttm=pd.Series([1.0]),
+                depreciation_ttm=pd.Series([1.0]),
+                revenue_annual=pd.Series([], dtype=float),
+            ),
+            # 数値以外は個別計算にフォールバック
+            FinancialData(
+                symbol="OBJECT",
+                revenue_ttm=pd.Series([None, 100.0], dtype=object),
+                operating_income_ttm=pd.Series([26.0]),
+                info={"operatingMargins": "n/a"},
+            ),
+            FinancialData(symbol="EMPTY"),
+        ]
+
+    def _same(self, left, right):
+        if isinstance(left, float) and isinstance(right, float):
+            return (left != left and right != right) or left == right
+        return left == right
+
+    def test_batch_matches_scalar(self):
+        """全期間・全バリアントで calculate() と同一の結果"""
+        calculator = Rule40Calculator()
+        data_list = self._edge_cases()
+
+        for period in CalculationPeriod:
+            for variant in Rule40Variant:
+                batch = calculator.calculate_batch(data_list, period, variant)
+                for data, result in zip(data_list, batch):
+                    expected = calculator.calculate(data, period, variant)
+                    for field in self.FIELDS:
+                        left = getattr(result, field)
+                        right = getattr(expected, field)
+                        assert (left is None) == (right is None), (data.symbol, field)
+                        assert self._same(left, right), (data.symbol, field)
+
+    def test_empty_batch(self):
+        """空の入力"""
+        assert Rule40Calculator().calculate_batch([]) == []
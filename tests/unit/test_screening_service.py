@@ -0,0 +1,428 @@
+"""
+ScreeningService のユニットテスト（ネットワークを使わないフェイククライアント）
+"""
+
+import threading
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from src.core.adapters.base import BaseSymbolSource, NetworkError
+from src.core.application.screening_service import ScreeningService
+from src.core.data.config_loader import ConfigManager
+from src.core.data.yf_client import apply_info
+from src.core.domain.cancellation import CancellationToken
+from src.core.domain.models import (
+    DataFetchError,
+    DataPart,
+    DataQuality,
+    Filter,
+    FinancialData,
+    JournalStatus,
+    Market,
+    Rule40Result,
+    Rule40Variant,
+    RunStatus,
+    ScreeningCancelledError,
+    ScreeningConfig,
+    Symbol,
+    UniverseDiff,
+    ValidationError,
+)
+
+
+class FakeYFClient:
+    """決まったデータを返す YFClient の代替"""
+
+    def __init__(self):
+        self.requested = []
+        self.statements_requested = []
+        self.released = []
+        self.calendar = {}  # info に加える決算カレンダー
+
+    def get_info(self, symbol: str) -> dict:
+        self.requested.append(symbol)
+        if symbol.startswith("BAD"):
+            raise DataFetchError(f"delisted {symbol}")
+
+        info = {"revenueGrowth": 0.3, "marketCap": 1e9, "longName": f"{symbol} Inc"}
+        if symbol == "SLOW":
+            # info だけで R40 = 1 + 5 が確定する
+            info.update(revenueGrowth=0.01, operatingMargins=0.05)
+        info.update(self.calendar)
+        return info
+
+    def get_financial_data(
+        self, symbol: str, info=None, requirements=None, base=None, cancel_token=None
+    ) -> FinancialData:
+        if info is None:
+            if base is not None and base.info:
+                info = base.info
+            else:
+                info = self.get_info(symbol)
+        self.statements_requested.append(symbol)
+
+        margin = 0.01 if symbol == "LOW" else 0.2
+        data = FinancialData(
+            symbol=symbol,
+            revenue_ttm=pd.Series([130.0, 100.0]),
+            operating_income_ttm=pd.Series([130.0 * margin, 20.0]),
+        )
+        return apply_info(data, info)
+
+    def release_ticker(self, symbol: str):
+        self.released.append(symbol)
+
+    def clear_tickers(self):
+        pass
+
+    def get_pool_stats(self) -> dict:
+        return {}
+
+
+class FakeSource(BaseSymbolSource):
+    """固定の銘柄を返すデータソース（全ソースが揃うまで待って並行取得を確認）"""
+
+    def __init__(self, name, symbols, barrier=None, error=None, diff=None):
+        super().__init__(name)
+        self.symbols = symbols
+        self.barrier = barrier
+        self.error = error
+        self.diff = diff
+
+    def fetch_table(self):
+        self.last_diff = self.diff
+        if self.barrier is not None:
+            self.barrier.wait()
+        if self.error is not None:
+            raise self.error
+        return self._build_table(
+            pd.Series(self.symbols), pd.Series(self.symbols), Market.NYSE
+        )
+
+
+@pytest.fixture
+def service(tmp_path):
+    config_manager = ConfigManager(str(tmp_path / "missing.yaml"))
+    config_manager.set("cache.path", str(tmp_path / "cache.db"))
+    config_manager.set("fetch.requests_per_second", 1000.0)
+    config_manager.set("fetch.max_requests_per_second", 1000.0)
+
+    service = ScreeningService(config_manager)
+    service.yf_client = FakeYFClient()
+    symbols = [Symbol(f"S{i}", f"S{i}", Market.NASDAQ) for i in range(5)]
+    symbols += [
+        Symbol(name, name, Market.NASDAQ) for name in ("LOW", "SLOW", "BAD1")
+    ]
+    service._get_symbols = lambda config, progress_callback=None: symbols
+    yield service
+    service.cache.close()
+
+
+class TestScreeningService:
+    """ScreeningService のテスト"""
+
+    def test_streaming_matches_batch(self, service):
+        """ストリーミングとフェーズ処理で同じ結果になる"""
+        streamed, batched = [], []
+        streaming_results = service.screen_stocks(
+            ScreeningConfig(sources=[], streaming=True), result_callback=streamed.append
+        )
+        batch_results = service.screen_stocks(
+            ScreeningConfig(sources=[], streaming=False), result_callback=batched.append
+        )
+
+        # 同順位の並びは取得完了順に依存するため銘柄ごとに比較
+        by_symbol = {r.symbol: r.r40_op for r in batch_results}
+        assert {r.symbol: r.r40_op for r in streaming_results} == by_symbol
+        assert [r.r40_op for r in streaming_results] == [r.r40_op for r in batch_results]
+        assert "LOW" not in {r.symbol for r in streaming_results}
+
+        # どちらもフィルターを通過した結果だけを通知する
+        assert sorted(r.symbol for r in streamed) == sorted(
+            r.symbol for r in streaming_results
+        )
+        assert sorted(r.symbol for r in batched) == sorted(
+            r.symbol for r in batch_results
+        )
+
+    def test_row_filter_matches_frame_filter(self, service):
+        """1件ずつの判定（ストリーミング）は一括のフィルタリングと同じ結果になる"""
+        results = [
+            Rule40Result("A", r40_op=45.0, operating_margin=10.0, market_cap=5e9),
+            Rule40Result("B", r40_op=30.0, ebitda_margin=5.0, market_cap=2e9),
+            Rule40Result("C", r40_op=60.0, operating_margin=-5.0, sector="Tech"),
+            Rule40Result("D", r40_ebitda=50.0, ebitda_margin=float("nan")),
+        ]
+        configs = [
+            ScreeningConfig(sources=[]),
+            ScreeningConfig(sources=[], threshold=None, min_revenue=3e9),
+            ScreeningConfig(
+                sources=[], variant=Rule40Variant.BOTH, margin_positive_only=True
+            ),
+            ScreeningConfig(
+                sources=[],
+                threshold=None,
+                filters=[Filter("sector", "contains", "tech")],
+            ),
+        ]
+
+        for config in configs:
+            expected = [r.symbol for r in service._apply_filters(results, config)]
+            assert [
+                r.symbol for r in results if service._passes_filters(r, config)
+            ] == expected
+
+    def test_cached_symbols_skip_network(self, service):
+        """キャッシュ済みの銘柄は再取得しない"""
+        service.screen_stocks(ScreeningConfig(sources=[]))
+        service.yf_client.requested.clear()
+
+        service.screen_stocks(ScreeningConfig(sources=[]))
+
+        # 取得に失敗した銘柄もネガティブキャッシュにより再取得しない
+        assert service.yf_client.requested == []
+
+    def test_expired_part_is_refetched_alone(self, service):
+        """期限切れの構成要素（info）だけを取得し、財務諸表は再取得しない"""
+        config = ScreeningConfig(sources=[])
+        first = service.screen_stocks(config)
+        client = service.yf_client
+        client.requested.clear()
+        client.statements_requested.clear()
+
+        # info だけ期限切れにする
+        service.cache.delete_many(
+            service._cache_key(symbol, DataPart.INFO) for symbol in ("S0", "S1")
+        )
+        second = service.screen_stocks(config)
+
+        assert sorted(client.requested) == ["S0", "S1"]
+        assert client.statements_requested == []
+        assert [r.r40_op for r in second] == [r.r40_op for r in first]
+
+    def test_stale_entries_are_served_then_revalidated(self, service):
+        """猶予内の期限切れデータは即座に返し、revalidate で取得し直す"""
+        config = ScreeningConfig(sources=[], stale_grace_hours=24)
+        service.screen_stocks(config)
+        client = service.yf_client
+        client.requested.clear()
+
+        expired_at = (datetime.now() - timedelta(hours=1)).isoformat()
+        service.cache._connection().execute(
+            "UPDATE cache SET expires_at = ? WHERE key = ?",
+            (expired_at, service._cache_key("S0", DataPart.INFO)),
+        )
+        results = service.screen_stocks(config)
+
+        assert client.requested == []
+        quality = {r.symbol: r.data_quality for r in results}
+        assert quality["S0"] == DataQuality.STALE
+        assert quality["S1"] != DataQuality.STALE
+        assert [s.symbol for s in service.pending_revalidation] == ["S0"]
+
+        updated = []
+        refreshed, symbols = service.revalidate(config, result_callback=updated.append)
+        assert client.requested == ["S0"]
+        assert symbols == ["S0"]
+        assert [r.symbol for r in refreshed] == [r.symbol for r in updated] == ["S0"]
+        assert refreshed[0].data_quality != DataQuality.STALE
+        assert service.pending_revalidation == []
+
+    def test_statements_expire_at_next_earnings(self, service):
+        """財務諸表は次回の決算発表まで有効で、決算期が進むと取得し直す"""
+        client = service.yf_client
+        next_earnings = datetime.now() + timedelta(days=30)
+        client.calendar = {
+            "mostRecentQuarter": int(datetime(2025, 3, 31).timestamp()),
+            "earningsTimestampStart": int(next_earnings.timestamp()),
+        }
+        config = ScreeningConfig(sources=[])
+        service.screen_stocks(config)
+
+        key = service._cache_key("S0", DataPart.INCOME_TTM)
+        (expires_at,) = (
+            service.cache._connection()
+            .execute("SELECT expires_at FROM cache WHERE key = ?", (key,))
+            .fetchone()
+        )
+        expires_in = datetime.fromisoformat(expires_at) - next_earnings
+        assert timedelta(hours=11) < expires_in < timedelta(hours=13)
+
+        # info の更新で決算期末が進んでいれば、期限前でも財務諸表を取得し直す
+        client.calendar["mostRecentQuarter"] = int(datetime(2025, 6, 30).timestamp())
+        service.cache.delete_many(
+            service._cache_key(symbol, DataPart.INFO) for symbol in ("S0", "S1")
+        )
+        client.statements_requested.clear()
+        service.screen_stocks(config)
+        assert sorted(client.statements_requested) == ["S0", "S1"]
+
+        client.statements_requested.clear()
+        service.screen_stocks(config)
+        assert client.statements_requested == []
+
+    def test_failed_symbols_are_negatively_cached(self, service):
+        """取得に失敗した銘柄は失敗の記録の有効期間中は再取得しない"""
+        service.screen_stocks(ScreeningConfig(sources=[], force_refresh=True))
+        failures = service.get_failures()
+        assert [f.symbol for f in failures] == ["BAD1"]
+        assert "delisted" in failures[0].reason
+        assert failures[0].is_active()
+
+        service.yf_client.requested.clear()
+        service.screen_stocks(ScreeningConfig(sources=[]))
+        assert service.yf_client.requested == []
+        assert service.last_summary.skipped_failures == 1
+
+        # 期間が過ぎると再取得し、再び失敗すると連続回数が増える
+        expired = replace(failures[0], retry_after=datetime.now())
+        service.cache.set(service._failure_key("BAD1"), expired.to_dict())
+        service.screen_stocks(ScreeningConfig(sources=[]))
+        assert service.yf_client.requested == ["BAD1"]
+        assert [f.failures for f in service.get_failures()] == [2]
+
+        # 再試行: 記録を消して再取得する
+        service.yf_client.requested.clear()
+        service.screen_stocks(ScreeningConfig(sources=[], retry_failures=True))
+        assert service.yf_client.requested == ["BAD1"]
+        assert service.last_summary.skipped_failures == 0
+        assert [f.failures for f in service.get_failures()] == [1]
+
+    def test_interrupted_run_resumes_remaining_symbols(self, service):
+        """中断した実行は記録から未処理・失敗の銘柄だけを処理し直す"""
+        config = ScreeningConfig(sources=[], threshold=0.0)
+        first = service.screen_stocks(config)
+        assert service.journal.get_run(service.last_summary.run_id).status == (
+            RunStatus.COMPLETED
+        )
+
+        # S3 / S4 を処理する前に中断した実行
+        symbols = service._get_symbols(config)
+        run_id = service.journal.start(config, symbols)
+        done = {s.symbol: (JournalStatus.DONE, None) for s in symbols[:3]}
+        service.journal.update(run_id, done)
+        service.journal.finish(run_id, RunStatus.INTERRUPTED)
+        service.cache.delete_many(
+            service._cache_key(symbol, part)
+            for symbol in ("S3", "S4")
+            for part in DataPart
+        )
+        assert service.get_resumable_run().remaining == len(symbols) - 3
+
+        service.yf_client.requested.clear()
+        resumed = service.resume()
+        assert sorted(service.yf_client.requested) == ["S3", "S4"]
+        assert sorted(r.symbol for r in resumed) == sorted(r.symbol for r in first)
+        assert service.last_summary.resumed == 3
+
+        run = service.journal.get_run(run_id)
+        assert run.status == RunStatus.COMPLETED
+        assert run.counts == {JournalStatus.DONE: 7, JournalStatus.FAILED: 1}
+        assert service.get_resumable_run() is None
+        with pytest.raises(ValidationError):
+            service.resume()
+
+    def test_cancel_interrupts_run(self, service):
+        """停止すると ScreeningCancelledError で戻り、実行は中断として記録される"""
+        token = CancellationToken()
+        config = ScreeningConfig(sources=[], threshold=0.0, force_refresh=True)
+        with pytest.raises(ScreeningCancelledError):
+            service.screen_stocks(
+                config, result_callback=lambda r: token.cancel(), cancel_token=token
+            )
+
+        run = service.journal.get_run(service.last_summary.run_id)
+        assert run.status == RunStatus.INTERRUPTED
+        assert service.last_summary.passed == 0
+
+    def test_prefilter_skips_statements_for_pruned_symbols(self, service):
+        """info だけでフィルター落ちが確定する銘柄は財務諸表を取得しない"""
+        client = service.yf_client
+        unfiltered = service.screen_stocks(
+            ScreeningConfig(sources=[], prefilter=False, force_refresh=True)
+        )
+        assert "SLOW" in client.statements_requested
+
+        client.statements_requested.clear()
+        prefiltered = service.screen_stocks(
+            ScreeningConfig(sources=[], force_refresh=True)
+        )
+        assert "SLOW" not in client.statements_requested
+        assert "S0" in client.statements_requested
+        assert client.released == ["SLOW"]
+        assert service.last_summary.pruned == 1
+        assert service.last_summary.fetch_failed == 1
+        assert sorted(r.symbol for r in prefiltered) == sorted(
+            r.symbol for r in unfiltered
+        )
+
+        # 時価総額の下限は期間・バリアントによらず info で判定できる
+        client.statements_requested.clear()
+        results = service.screen_stocks(
+            ScreeningConfig(sources=[], force_refresh=True, min_revenue=2e9)
+        )
+        assert client.statements_requested == []
+        assert len(results) == 0
+
+    def test_sources_are_fetched_concurrently(self, service):
+        """データソースは並行して取得し、失敗したソースを記録して残りで続ける"""
+        del service._get_symbols
+        barrier = threading.Barrier(3, timeout=5)
+        service.data_sources = {
+            "a": FakeSource("a", ["S1", "S2"], barrier),
+            "b": FakeSource("b", [], barrier, NetworkError("HTTP 503")),
+            "c": FakeSource("c", ["S2", "S3"], barrier),
+        }
+        progress = []
+
+        symbols = service._get_symbols(
+            ScreeningConfig(sources=["a", "b", "c"]),
+            lambda current, total, message: progress.append((current, total)),
+        )
+
+        assert [(s.symbol, s.source) for s in symbols] == [
+            ("S1", "a"), ("S2", "c"), ("S3", "c")
+        ]
+        assert service.last_summary.source_errors == {"b": "HTTP 503"}
+        assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+
+    def test_delta_mode_fetches_only_new_symbols(self, service):
+        """delta モードは既存の銘柄を期限切れでもキャッシュから返し、一覧の変化を集計に残す"""
+        del service._get_symbols
+        source = FakeSource("a", ["S0", "S1", "S2"])
+        service.data_sources = {"a": source}
+        service.screen_stocks(ScreeningConfig(sources=["a"], threshold=0.0))
+
+        # S0・S1 のキャッシュは猶予も過ぎている（通常の実行なら削除して取得し直す）
+        expired_at = (datetime.now() - timedelta(days=30)).isoformat()
+        with service.cache._connection() as conn:
+            conn.executemany(
+                "UPDATE cache SET expires_at = ? WHERE key = ?",
+                [
+                    (expired_at, service._cache_key(symbol, part))
+                    for symbol in ("S0", "S1")
+                    for part in DataPart
+                ],
+            )
+
+        # UNCACHED は一覧には前からあったがキャッシュが無い（取得する）
+        source.symbols = ["S0", "S1", "S2", "NEW", "UNCACHED"]
+        source.diff = UniverseDiff(added=["NEW"], removed=["GONE"])
+        service.yf_client.requested.clear()
+        results = service.screen_stocks(
+            ScreeningConfig(sources=["a"], threshold=0.0, delta=True)
+        )
+
+        assert sorted(service.yf_client.requested) == ["NEW", "UNCACHED"]
+        quality = {r.symbol: r.data_quality for r in results}
+        assert sorted(quality) == ["NEW", "S0", "S1", "S2", "UNCACHED"]
+        assert quality["S0"] == quality["S1"] == DataQuality.STALE
+        assert quality["S2"] != DataQuality.STALE
+        assert service.last_summary.delta_reused == 2
+        assert service.pending_revalidation == []
+        assert service.last_summary.universe_diff == {
+            "a": {"added": ["NEW"], "removed": ["GONE"], "renamed": {}}
+        }
@@ -0,0 +1,119 @@
+"""
+FinancialData バイナリシリアライズのユニットテスト
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from src.core.data.serialization import (
+    INFO_KEYS,
+    decode_financial_data,
+    encode_financial_data,
+    merge_financial_data,
+    split_financial_data,
+)
+from src.core.domain.models import (
+    CacheError,
+    DataPart,
+    DataQuality,
+    FinancialData,
+)
+
+
+def _yfinance_like_data() -> FinancialData:
+    dates = pd.to_datetime(["2024-09-30", "2023-09-30", "2022-09-30"])
+    return FinancialData(
+        symbol="AAPL",
+        revenue_annual=pd.Series(
+            [391035e6, 383285e6, float("nan")], index=dates, name="Total Revenue"
+        ),
+        operating_income_annual=pd.Series(
+            [123216e6, 114301e6, 119437e6], index=dates, name="Operating Income"
+        ),
+        revenue_ttm=pd.Series([395000e6], index=["TTM"]),
+        info={
+            "longName": "Apple Inc.",
+            "marketCap": 3000000000000,
+            "revenueGrowth": 0.061,
+            "operatingMargins": 0.31,
+            "sector": "Technology",
+            "fullTimeEmployees": 161000,
+        },
+        last_updated=datetime(2024, 11, 1, 9, 30, 15, 123456),
+        data_quality=DataQuality.COMPLETE,
+    )
+
+
+class TestFinancialDataCodec:
+    """エンコード / デコードのテスト"""
+
+    def test_round_trip_preserves_series(self):
+        original = _yfinance_like_data()
+
+        decoded = decode_financial_data(encode_financial_data(original))
+
+        pd.testing.assert_series_equal(decoded.revenue_annual, original.revenue_annual)
+        pd.testing.assert_series_equal(
+            decoded.operating_income_annual, original.operating_income_annual
+        )
+        pd.testing.assert_series_equal(decoded.revenue_ttm, original.revenue_ttm)
+        assert decoded.depreciation_annual is None
+
+    def test_round_trip_preserves_metadata(self, sample_financial_data):
+        decoded = decode_financial_data(encode_financial_data(sample_financial_data))
+
+        assert decoded.symbol == sample_financial_data.symbol
+        assert decoded.last_updated == sample_financial_data.last_updated
+        assert decoded.data_quality == DataQuality.COMPLETE
+        assert decoded.parts is None
+        pd.testing.assert_series_equal(
+            decoded.depreciation_ttm, sample_financial_data.depreciation_ttm
+        )
+
+    def test_round_trip_preserves_parts(self):
+        original = _yfinance_like_data()
+        original.parts = frozenset({DataPart.INFO, DataPart.INCOME_ANNUAL})
+
+        decoded = decode_financial_data(encode_financial_data(original))
+
+        assert decoded.parts == original.parts
+
+    def test_split_and_merge_round_trip(self):
+        original = _yfinance_like_data()
+        original.parts = frozenset(
+            {DataPart.INFO, DataPart.INCOME_ANNUAL, DataPart.INCOME_TTM}
+        )
+
+        pieces = split_financial_data(original)
+        assert set(pieces) == original.parts
+        assert pieces[DataPart.INCOME_ANNUAL].info is None
+        assert pieces[DataPart.INFO].revenue_annual is None
+
+        merged = merge_financial_data(
+            decode_financial_data(encode_financial_data(piece))
+            for piece in pieces.values()
+        )
+        assert merged.parts == original.parts
+        assert merged.info["longName"] == "Apple Inc."
+        pd.testing.assert_series_equal(merged.revenue_annual, original.revenue_annual)
+        pd.testing.assert_series_equal(merged.revenue_ttm, original.revenue_ttm)
+
+        # 欠けた構成要素は parts に含まれない（再取得の対象になる）
+        del pieces[DataPart.INFO]
+        assert merge_financial_data(pieces.values()).parts == {
+            DataPart.INCOME_ANNUAL,
+            DataPart.INCOME_TTM,
+        }
+
+    def test_info_is_trimmed_to_known_keys(self):
+        decoded = decode_financial_data(encode_financial_data(_yfinance_like_data()))
+
+        assert set(decoded.info) <= set(INFO_KEYS)
+        assert decoded.info["revenueGrowth"] == 0.061
+        assert decoded.info["marketCap"] == 3000000000000
+
+    def test_invalid_payload_raises_cache_error(self):
+        with pytest.raises(CacheError):
+            decode_financial_data(b"not a payload")
@@ -0,0 +1,244 @@
+"""
+銘柄データ取得アダプタのユニットテスト
+"""
+
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from src.core.adapters import CSVFileSource, NasdaqListed, OtherListed, WikipediaSP500
+from src.core.adapters.base import (
+    SYMBOL_COLUMNS,
+    normalize_symbols,
+    table_to_symbols,
+    valid_symbol_mask,
+)
+from src.core.adapters.html_tables import extract_table
+from src.core.data.cache import CacheManager
+from src.core.data.universe_cache import UniverseCache, diff_symbol_tables
+from src.core.domain.models import Market
+
+NASDAQ_LISTED = """Symbol|Security Name|Market Category|Test Issue|Financial Status
+AAPL|Apple Inc. - Common Stock|Q|N|N
+ZAZZT|Tick Pilot Test Stock|G|Y|N
+brk.b|Berkshire Hathaway|Q|N|N
+BAD SYM|Invalid Symbol|Q|N|N
+File Creation Time: 1017202608:00||||
+"""
+
+OTHER_LISTED = """ACT Symbol|Security Name|Exchange|CQS Symbol|ETF|Round Lot Size|Test Issue|NASDAQ Symbol
+IBM|International Business Machines|N|IBM|N|100|N|IBM
+SPY|SPDR S&P 500 ETF|P|SPY|Y|100|N|SPY
+XYZ|Unknown Exchange Corp|Q|XYZ|N|100|N|XYZ
+ATEST|Test Issue|A|ATEST|N|100|Y|ATEST
+File Creation Time: 1017202608:00|||||||
+"""
+
+
+WIKIPEDIA_PAGE = """<html><body>
+<table class="box"><tr><th>Symbol</th><th>Security</th></tr><tr><td>NOPE</td><td>x</td></tr></table>
+<h2 id="S&amp;P_500_component_stocks">Components</h2>
+<table class="wikitable sortable" id="constituents"><tbody>
+<tr><th>Symbol</th><th>Security</th><th>GICS Sector</th></tr>
+<tr><td><a href="#">MMM</a></td><td>3M</td><td>Industrials</td></tr>
+<tr><td>BRK.B</td><td>Berkshire <table><tr><td>nested</td></tr></table>Hathaway</td>
+<td>Financials</td></tr>
+</tbody></table>
+<table><tr><th>Date</th></tr><tr><td>2024</td></tr></table>
+</body></html>"""
+
+
+@pytest.fixture
+def fake_get(monkeypatch):
+    """requests.get を固定のレスポンスを返す関数に置き換える（送ったヘッダーを記録）"""
+    sent = []
+
+    def install(text, status_code=200, headers=None):
+        def get(url, headers=None, timeout=None):
+            sent.append(headers or {})
+            if status_code is None:
+                raise AssertionError("network access in offline mode")
+            return SimpleNamespace(
+                text=text,
+                status_code=status_code,
+                headers=response_headers,
+                raise_for_status=lambda: None,
+            )
+
+        response_headers = headers or {}
+        monkeypatch.setattr("src.core.adapters.base.requests.get", get)
+        return sent
+
+    return install
+
+
+class TestSymbolTable:
+    """列単位の正規化・バリデーションのテスト"""
+
+    def test_normalize_and_validate_symbols(self):
+        """欠損値・株式クラスの接尾辞・無効なシンボルを列単位で処理する"""
+        raw = [
+            "aapl", " brk.b ", "BF.A", "nan", None, float("nan"),
+            "BAD SYM", "TOOLONGSYMBOL", "7203.T", "META", 1234,
+        ]
+
+        normalized = normalize_symbols(pd.Series(raw, dtype=object))
+        valid = valid_symbol_mask(normalized)
+
+        assert normalized.tolist() == [
+            "AAPL", "BRK-B", "BF-A", "", "", "",
+            "BAD SYM", "TOOLONGSYMBOL", "7203.T", "META", "1234",
+        ]
+        assert valid.tolist() == [
+            True, True, True, False, False, False,
+            False, False, True, True, True,
+        ]
+
+    def test_nasdaq_listed_table(self, fake_get):
+        """テスト銘柄・無効なシンボル・ファイル作成時刻の行を除く"""
+        fake_get(NASDAQ_LISTED)
+
+        table = NasdaqListed().fetch_table()
+
+        assert list(table.columns) == SYMBOL_COLUMNS
+        assert table["symbol"].tolist() == ["AAPL", "BRK-B"]
+        assert set(table["market"]) == {Market.NASDAQ.value}
+
+    def test_other_listed_symbols_are_built_on_demand(self, fake_get):
+        """Exchange から市場を判定し、fetch() で Symbol に変換する"""
+        fake_get(OTHER_LISTED)
+
+        symbols = OtherListed().fetch()
+
+        assert [(s.symbol, s.market) for s in symbols] == [
+            ("IBM", Market.NYSE),
+            ("SPY", Market.NASDAQ),
+            ("XYZ", Market.OTHER),
+        ]
+        assert symbols[0].source == "Other Listed"
+
+    def test_csv_source_adds_exchange_suffix(self, tmp_path):
+        """4桁の数字のシンボルに .T を付け、不明な市場は OTHER にする"""
+        path = tmp_path / "symbols.csv"
+        path.write_text(
+            "symbol,name,market,sector\n"
+            "7203,Toyota,tse_prime,Auto\n"
+            "AAPL,Apple,NASDAQ,\n"
+            "6758.T,Sony,unknown,Tech\n"
+            ",Blank,NYSE,\n"
+        )
+
+        table = CSVFileSource(str(path)).fetch_table()
+
+        assert table["symbol"].tolist() == ["7203.T", "AAPL", "6758.T"]
+        assert table["market"].tolist() == ["TSE_PRIME", "NASDAQ", "OTHER"]
+        assert table["sector"].tolist() == ["Auto", "", "Tech"]
+        assert table_to_symbols(table)[0].market == Market.TSE_PRIME
+
+    def test_unchanged_list_is_revalidated_not_parsed(self, fake_get, temp_db_file):
+        """保存した検証子で条件付き GET を送り、304 なら保存したテーブルを使う"""
+        cache = CacheManager(str(temp_db_file))
+        source = NasdaqListed()
+        source.snapshots = UniverseCache(cache)
+
+        fake_get(NASDAQ_LISTED, headers={"ETag": '"v1"'})
+        first = source.fetch_table()
+
+        sent = fake_get("", status_code=304)
+        assert source.fetch_table().to_dict("list") == first.to_dict("list")
+        assert sent[-1]["If-None-Match"] == '"v1"'
+
+        # オフラインではネットワークを使わない
+        source.offline = True
+        fake_get("", status_code=None)
+        assert source.fetch_table()["symbol"].tolist() == ["AAPL", "BRK-B"]
+        cache.close()
+
+    def test_diff_is_reported_once(self, fake_get, temp_db_file):
+        """変化は前回の取得から求め、内容が同じ再取得・304 では空になる"""
+        cache = CacheManager(str(temp_db_file))
+        source = NasdaqListed()
+        source.snapshots = UniverseCache(cache)
+
+        fake_get(NASDAQ_LISTED)
+        source.fetch_table()
+        assert source.last_diff is None
+
+        changed = NASDAQ_LISTED.replace("brk.b|", "BRKB|").replace(
+            "AAPL|", "MSFT|Microsoft|Q|N|N\nAAPL|"
+        )
+        fake_get(changed)
+        source.fetch_table()
+        assert source.last_diff.to_dict() == {
+            "added": ["MSFT"],
+            "removed": [],
+            "renamed": {"BRK-B": "BRKB"},
+        }
+
+        for _ in range(2):
+            fake_get(changed)
+            source.fetch_table()
+            assert not source.last_diff.changed
+
+        fake_get("", status_code=304)
+        source.fetch_table()
+        assert not source.last_diff.changed
+        cache.close()
+
+    def test_diff_symbol_tables(self):
+        """追加・削除と、銘柄名が同じシンボルの変更を区別する"""
+        previous = pd.DataFrame(
+            {"symbol": ["FB", "TWTR", "AAPL"], "name": ["Meta", "Twitter", "Apple"]}
+        )
+        current = pd.DataFrame(
+            {"symbol": ["META", "AAPL", "ARM"], "name": ["meta ", "Apple", "Arm"]}
+        )
+
+        diff = diff_symbol_tables(previous, current)
+
+        assert diff.added == ["ARM"]
+        assert diff.removed == ["TWTR"]
+        assert diff.renamed == {"FB": "META"}
+        assert diff.new_symbols == ["ARM", "META"]
+
+    def test_diff_does_not_pair_ambiguous_names(self):
+        """銘柄名が一意でない（複数のクラス株）・市場が違うものは変更とみなさない"""
+        previous = pd.DataFrame(
+            {
+                "symbol": ["GOOG", "GOOGL", "ABC", "OLD"],
+                "name": ["Alphabet", "Alphabet", "Acme", "Old Co"],
+                "market": ["NASDAQ", "NASDAQ", "NYSE", "NYSE"],
+            }
+        )
+        current = pd.DataFrame(
+            {
+                "symbol": ["GOOG", "GOOGX", "ABCD", "NEW"],
+                "name": ["Alphabet", "Alphabet", "Acme", "old co"],
+                "market": ["NASDAQ", "NASDAQ", "NASDAQ", "NYSE"],
+            }
+        )
+
+        diff = diff_symbol_tables(previous, current)
+
+        assert diff.renamed == {"OLD": "NEW"}
+        assert diff.added == ["GOOGX", "ABCD"]
+        assert diff.removed == ["GOOGL", "ABC"]
+
+    def test_extract_table_by_id_or_anchor(self):
+        """id・アンカーで構成銘柄のテーブルだけを取り出す（入れ子のテーブルも含めて切り出す）"""
+        by_id = extract_table(WIKIPEDIA_PAGE, table_id="constituents")
+        by_anchor = extract_table(WIKIPEDIA_PAGE, anchor="S&P_500_component_stocks")
+
+        assert by_id["Symbol"].tolist() == ["MMM", "BRK.B"]
+        assert by_id["Security"].tolist() == ["3M", "Berkshire nestedHathaway"]
+        assert by_anchor.equals(by_id)
+        assert extract_table(WIKIPEDIA_PAGE, table_id="missing") is None
+
+        # キャッシュしたパース結果は呼び出し元の変更の影響を受けない
+        by_id.loc[0, "Symbol"] = "CHANGED"
+        assert extract_table(WIKIPEDIA_PAGE, table_id="constituents").loc[0, "Symbol"] == "MMM"
+
+        table = WikipediaSP500()._parse(WIKIPEDIA_PAGE)
+        assert table["symbol"].tolist() == ["MMM", "BRK-B"]
+        assert table["sector"].tolist() == ["Industrials", "Financials"]
@@ -0,0 +1,166 @@
+"""
+YFClient の構成要素ごとの取得のユニットテスト（yf.Ticker をフェイクに置換）
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from src.core.data import yf_client
+from src.core.domain.models import (
+    CalculationPeriod,
+    DataFetchError,
+    DataPart,
+    Rule40Variant,
+)
+from src.core.domain.rule40 import Rule40Calculator
+
+
+class FakeTicker:
+    """アクセスされた属性を数える yf.Ticker の代替"""
+
+    calls: Counter = Counter()
+    created: Counter = Counter()
+    info_data = {"revenueGrowth": 0.2, "marketCap": 1e9}
+
+    def __init__(self, symbol: str, session=None):
+        self.symbol = symbol
+        self.session = session
+        FakeTicker.created[symbol] += 1
+
+    def __getattr__(self, name):
+        FakeTicker.calls[name] += 1
+        columns = pd.to_datetime(["2024-12-31", "2023-12-31"])
+        if name == "info":
+            return dict(FakeTicker.info_data)
+        if name in ("income_stmt", "ttm_income_stmt"):
+            return pd.DataFrame(
+                [[120.0, 100.0], [30.0, 20.0]],
+                index=["Total Revenue", "Operating Income"],
+                columns=columns,
+            )
+        if name in ("cashflow", "ttm_cashflow"):
+            return pd.DataFrame(
+                [[6.0, 5.0]], index=["Depreciation And Amortization"], columns=columns
+            )
+        raise AttributeError(name)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(yf_client.yf, "Ticker", FakeTicker)
+    FakeTicker.calls = Counter()
+    FakeTicker.created = Counter()
+    FakeTicker.info_data = {"revenueGrowth": 0.2, "marketCap": 1e9}
+    return yf_client.YFClient()
+
+
+def requirements(period, variant):
+    return Rule40Calculator.data_requirements(period, variant)
+
+
+class TestSelectiveFetch:
+    """必要な財務諸表のみを取得するテスト"""
+
+    def test_ttm_op_fetches_only_ttm_income(self, client):
+        data = client.get_financial_data(
+            "AAA", requirements=requirements(CalculationPeriod.TTM, Rule40Variant.OP)
+        )
+
+        assert FakeTicker.calls == Counter(info=1, ttm_income_stmt=1)
+        assert data.parts == {DataPart.INFO, DataPart.INCOME_TTM}
+        assert data.revenue_annual is None
+        assert data.revenue_ttm.iloc[0] == 120.0
+
+    def test_ttm_op_skips_statements_when_info_suffices(self, client):
+        FakeTicker.info_data["operatingMargins"] = 0.3
+
+        data = client.get_financial_data(
+            "AAA", requirements=requirements(CalculationPeriod.TTM, Rule40Variant.OP)
+        )
+
+        assert FakeTicker.calls == Counter(info=1)
+        assert Rule40Calculator().calculate(data).r40_op == pytest.approx(50.0)
+
+    def test_ttm_ebitda_uses_ttm_cashflow(self, client):
+        data = client.get_financial_data(
+            "AAA",
+            requirements=requirements(CalculationPeriod.TTM, Rule40Variant.EBITDA),
+        )
+
+        result = Rule40Calculator().calculate(
+            data, CalculationPeriod.TTM, Rule40Variant.EBITDA
+        )
+        assert data.depreciation_ttm.iloc[0] == 6.0
+        assert result.r40_ebitda == pytest.approx(20.0 + 30.0)
+
+    def test_top_up_fetches_only_missing_parts(self, client):
+        cached = client.get_financial_data(
+            "AAA", requirements=requirements(CalculationPeriod.TTM, Rule40Variant.OP)
+        )
+        FakeTicker.calls.clear()
+
+        needed = requirements(CalculationPeriod.TTM, Rule40Variant.BOTH)
+        data = client.get_financial_data("AAA", requirements=needed, base=cached)
+
+        assert FakeTicker.calls == Counter(ttm_cashflow=1)
+        assert not needed.missing(data)
+        assert cached.depreciation_ttm is None
+
+
+class TestTickerReuse:
+    """実行中の Ticker の使い回しのテスト"""
+
+    def test_info_then_statements_share_ticker(self, client):
+        info = client.get_info("AAA")
+        client.get_financial_data(
+            "AAA",
+            info=info,
+            requirements=requirements(CalculationPeriod.TTM, Rule40Variant.OP),
+        )
+
+        assert FakeTicker.created == Counter(AAA=1)
+        stats = client.get_pool_stats()
+        assert stats["tickers_created"] == 1
+        assert stats["tickers_reused"] == 1
+        # 取得が完了した銘柄の Ticker は破棄される
+        assert stats["tickers_alive"] == 0
+
+    def test_failed_info_releases_ticker(self, client, monkeypatch):
+        class FailingTicker(FakeTicker):
+            @property
+            def info(self):
+                raise ValueError("HTTP Error 404")
+
+        monkeypatch.setattr(yf_client.yf, "Ticker", FailingTicker)
+
+        with pytest.raises(DataFetchError):
+            client.get_info("AAA")
+
+        assert client.get_pool_stats()["tickers_alive"] == 0
+
+    def test_clear_tickers(self, client):
+        client.get_info("AAA")
+        client.get_info("BBB")
+        client.clear_tickers()
+        client.get_info("AAA")
+
+        assert FakeTicker.created == Counter(AAA=2, BBB=1)
+
+
+def test_earnings_calendar_uses_earliest_upcoming_date():
+    now = datetime.now()
+    info = {
+        "mostRecentQuarter": int(datetime(2025, 3, 31).timestamp()),
+        "earningsTimestamp": int((now - timedelta(days=60)).timestamp()),
+        "earningsTimestampStart": int((now + timedelta(days=20)).timestamp()),
+        "earningsTimestampEnd": int((now + timedelta(days=25)).timestamp()),
+    }
+
+    period_end, next_earnings = yf_client.earnings_calendar(info)
+
+    assert period_end == datetime(2025, 3, 31)
+    assert timedelta(days=19) < next_earnings - now < timedelta(days=21)
+    assert yf_client.earnings_calendar({"earningsTimestamp": "soon"}) == (None, None)